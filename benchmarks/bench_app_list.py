@@ -0,0 +1,92 @@
+"""Latenza del cambio pagina e RSS della lista app con molte voci.
+
+    python3 benchmarks/bench_app_list.py [numero_di_voci]
+
+Confronta la vecchia lista con un QWidget per riga (ricostruita qui) con
+il modello virtualizzato usato da AppLauncher. Ogni variante gira in un
+processo separato, così l'RSS misurato non è sporcato dall'altra, in una
+HOME temporanea con un catalogo di synthetic.generate_tree.
+"""
+import os
+import sys
+import tempfile
+import subprocess
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from harness import timings_ms, prepare_home
+import synthetic
+
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+
+
+def fill_widget_rows(list_widget, apps):
+    """La vecchia show_category_apps: un QWidget con layout, due QLabel e un QPushButton per riga."""
+    from PyQt5 import QtWidgets, QtCore
+    list_widget.clear()
+    for app in apps:
+        widget = QtWidgets.QWidget()
+        layout = QtWidgets.QHBoxLayout(widget)
+        layout.setContentsMargins(5, 2, 5, 2)
+        layout.addWidget(QtWidgets.QLabel())
+        layout.addWidget(QtWidgets.QLabel(app['name']))
+        layout.addStretch()
+        button = QtWidgets.QPushButton("+")
+        button.setFixedSize(24, 24)
+        layout.addWidget(button)
+        item = QtWidgets.QListWidgetItem()
+        item.setSizeHint(widget.sizeHint())
+        item.setData(QtCore.Qt.UserRole, app)
+        list_widget.addItem(item)
+        list_widget.setItemWidget(item, widget)
+
+
+def run_variant(variant, count):
+    from PyQt5 import QtWidgets
+    qt_app = QtWidgets.QApplication(sys.argv)
+    import launcher_ui
+
+    window = launcher_ui.AppLauncher()
+    # Let the background catalog scan finish before replacing its data.
+    while not window.catalog_ready:
+        qt_app.processEvents()
+    window.show()
+    apps = synthetic.synthetic_apps(count, categories=["Bench"])
+    window.category_index = launcher_ui.category_index.CategoryIndex(apps)
+    if variant == "widgets":
+        legacy = QtWidgets.QListWidget()
+        window.app_list_layout.replaceWidget(window.app_list_widget, legacy)
+        window.app_list_widget.hide()
+        show_page = lambda: fill_widget_rows(legacy, apps)
+    else:
+        show_page = lambda: window.show_category_apps(QtWidgets.QListWidgetItem("Bench"))
+    qt_app.processEvents()
+
+    rss_before = rss_mb()
+
+    def switch_page():
+        show_page()
+        qt_app.processEvents()
+
+    timings = timings_ms(switch_page, 3)
+    print(f"{variant:8s} {count} rows: page switch {min(timings):8.1f} ms (best of 3)  "
+          f"RSS +{rss_mb() - rss_before:6.1f} MB")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--variant":
+        run_variant(sys.argv[2], int(sys.argv[3]))
+        return
+    count = sys.argv[1] if len(sys.argv) > 1 else "10000"
+    with tempfile.TemporaryDirectory() as tmp:
+        dirs, _ = synthetic.generate_tree(os.path.join(tmp, "tree"), int(count), icons=False)
+        env = prepare_home(tmp, dirs)
+        for variant in ("widgets", "model"):
+            subprocess.run([sys.executable, __file__, "--variant", variant, count], env=env, check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Throughput della modalità serie della calcolatrice: calc_batch contro un ciclo su calc_engine.
+
+    python3 benchmarks/bench_batch.py [righe]
+
+Per l'intervallo "x = 0..righe-1 step 1" misura la generazione dei
+valori, il calcolo vettoriale di ogni espressione, l'esportazione CSV e,
+su al massimo 100000 righe, lo stesso calcolo riga per riga con
+calc_engine.evaluate come farebbe la calcolatrice normale.
+"""
+import os
+import sys
+import tempfile
+
+from harness import timed_ms
+import calc_engine
+import calc_batch
+
+EXPRESSIONS = ["x*2+1", "(x**2 + 3*x - 7) / (x + 1)", "x**0.5 % 7 // 1", "-x**3 / 1e6 + x*x - 4"]
+LOOP_ROWS = 100000
+
+
+def loop(text, values):
+    results = []
+    for value in values:
+        try:
+            results.append(calc_engine.evaluate(text.replace("x", f"({value!r})")))
+        except calc_engine.CalcError:
+            results.append(float("nan"))
+    return results
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    sweep = f"x = 0..{rows - 1} step 1"
+    parse_ms, (names, columns) = timed_ms(lambda: calc_batch.parse_inputs(sweep))
+    print(f"{rows} rows; sweep values in {parse_ms:.1f} ms")
+    print(f"{'expression':30s} {'vectorized':>12s} {'csv export':>12s} {'engine loop':>14s}  (ms, loop on {LOOP_ROWS} rows)")
+    sample = columns[0][:LOOP_ROWS].tolist()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "serie.csv")
+        for text in EXPRESSIONS:
+            expression = calc_batch.compile_batch(text, names)
+            evaluate_ms, chunks = timed_ms(lambda: list(calc_batch.evaluate_chunks(expression, names, columns)))
+            results = calc_batch.numpy().concatenate([chunk for _, chunk in chunks])
+            export_ms, _ = timed_ms(lambda: calc_batch.write_csv(path, names, columns, results))
+            loop_ms, _ = timed_ms(lambda: loop(text, sample))
+            print(f"{text:30s} {evaluate_ms:12.1f} {export_ms:12.1f} {loop_ms:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
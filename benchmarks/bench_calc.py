@@ -0,0 +1,81 @@
+"""Throughput della valutazione delle espressioni della calcolatrice: eval() contro calc_engine.
+
+    python3 benchmarks/bench_calc.py [ripetizioni]
+
+Per ogni espressione misura eval() come faceva Calculator, calc_engine
+con la cache delle analisi svuotata a ogni giro (analisi, compilazione e
+valutazione) e calc_engine con l'espressione già in cache (il secondo "=").
+Misura anche quanto ci mette a rifiutare gli input patologici che con
+eval() bloccavano la finestra, e il costo di mostrare e copiare interi
+enormi: str() contro calc_engine.render (notazione scientifica) e
+calc_engine.full_digits (tutte le cifre, a richiesta).
+"""
+import sys
+import time
+
+from harness import timed_ms
+import calc_engine
+
+EXPRESSIONS = [
+    "1+2",
+    "12.5*4-3/7",
+    "(1+2)*(3+4)*(5+6)/7",
+    "2**64-1",
+    "-(3.25+4)**2%7//1",
+    "+".join(str(i) for i in range(200)),
+]
+HUGE_BITS = [10000, 100000, 500000]
+PATHOLOGICAL = ["9**9**9", "10**10**10", "(" * 5000 + "1" + ")" * 5000, "1+" * 100000 + "1"]
+
+
+def rate(action, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        action()
+    elapsed = time.perf_counter() - start
+    return repeats / elapsed
+
+
+def cold(text):
+    calc_engine.compile_expression.cache_clear()
+    return calc_engine.evaluate(text)
+
+
+def huge_results():
+    if hasattr(sys, "set_int_max_str_digits"):
+        # Lift the 4300-digit guard so the old str() path can be timed at all.
+        sys.set_int_max_str_digits(0)
+    for bits in HUGE_BITS:
+        value = 3 ** int(bits / 1.585)
+        str_ms, _ = timed_ms(lambda: str(value))
+        render_ms, _ = timed_ms(lambda: calc_engine.render(value))
+        digits_ms, _ = timed_ms(lambda: calc_engine.full_digits(value))
+        print(f"3**n, {bits:6d} bits: str() {str_ms:9.1f} ms   render {render_ms:7.2f} ms   full_digits {digits_ms:8.1f} ms")
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"{'expression':28s} {'eval()':>12s} {'engine cold':>12s} {'engine cached':>14s}  (evaluations/s)")
+    for text in EXPRESSIONS:
+        assert calc_engine.evaluate(text) == eval(text, {"__builtins__": None}, {})
+        eval_rate = rate(lambda: eval(text, {"__builtins__": None}, {}), repeats)
+        cold_rate = rate(lambda: cold(text), repeats)
+        cached_rate = rate(lambda: calc_engine.evaluate(text), repeats)
+        label = text if len(text) <= 28 else text[:25] + "..."
+        print(f"{label:28s} {eval_rate:12.0f} {cold_rate:12.0f} {cached_rate:14.0f}")
+
+    for text in PATHOLOGICAL:
+        start = time.perf_counter()
+        try:
+            calc_engine.evaluate(text)
+            outcome = "accepted"
+        except calc_engine.CalcError as e:
+            outcome = str(e)
+        label = text if len(text) <= 28 else text[:25] + "..."
+        print(f"{label:28s} rejected in {(time.perf_counter() - start) * 1000:8.2f} ms: {outcome}")
+
+    huge_results()
+
+
+if __name__ == "__main__":
+    main()
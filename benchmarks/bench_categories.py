@@ -0,0 +1,49 @@
+"""Costo dell'apertura di una categoria e dell'aggiornamento dell'indice delle categorie.
+
+    python3 benchmarks/bench_categories.py [numero_di_voci] [ripetizioni]
+
+Confronta il vecchio raggruppamento per prima categoria con ordinamento a
+ogni clic (ricostruito qui) con category_index.CategoryIndex, che tiene le
+viste già ordinate; misura anche la costruzione dell'indice e l'aggiunta e
+rimozione di una voce a catalogo pieno.
+"""
+import sys
+import locale
+import itertools
+
+from harness import timed_ms, median_ms
+import synthetic
+import category_index
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    try:
+        locale.setlocale(locale.LC_COLLATE, "")
+    except locale.Error:
+        pass
+    apps = synthetic.synthetic_apps(count)
+
+    grouped = {}
+    for app in apps:
+        grouped.setdefault(app['category'], []).append(app)
+    build_ms, index = timed_ms(lambda: category_index.CategoryIndex(apps))
+    names = sorted(index.categories())
+
+    old_names = itertools.cycle(synthetic.MAIN_CATEGORIES)
+    old_ms = median_ms(lambda: list(sorted(grouped.get(next(old_names), []), key=lambda x: x['name'].lower())), repeats)
+    new_names = itertools.cycle(synthetic.MAIN_CATEGORIES)
+    new_ms = median_ms(lambda: list(index.apps(next(new_names))), repeats)
+    extra = {'id': "extra.desktop", 'name': "Extra", 'categories': ["Utility", "TextEditor"]}
+    present = itertools.cycle([False, True])
+    update_ms = median_ms(lambda: index.remove(extra) if next(present) else index.add(extra), repeats)
+
+    print(f"{count} apps, {len(names)} categories, index built in {build_ms:.1f} ms (LC_COLLATE={locale.setlocale(locale.LC_COLLATE)})")
+    print(f"{'sort per click':18s} open {old_ms:8.3f} ms (median)")
+    print(f"{'CategoryIndex':18s} open {new_ms:8.3f} ms   add/remove {update_ms:6.3f} ms (median)")
+    print("  " + ", ".join(f"{name} {index.count(name)}" for name in names))
+
+
+if __name__ == "__main__":
+    main()
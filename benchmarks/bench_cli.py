@@ -0,0 +1,56 @@
+"""Latenza delle interrogazioni senza interfaccia grafica (--list, --search, --categories).
+
+    python3 benchmarks/bench_cli.py [numero_di_voci] [ripetizioni]
+
+Genera un catalogo sintetico in una HOME temporanea, scalda l'indice con
+una prima esecuzione e misura il tempo totale del processo, confrontato
+con l'avvio a vuoto dell'interprete. Controlla anche che PyQt5 non venga
+importato: se succede, o se l'interrogazione fallisce, esce con 1.
+"""
+import sys
+import tempfile
+import subprocess
+
+from harness import ROOT, LAUNCHER, timings_ms, prepare_home
+import synthetic
+
+QUERIES = [["--list"], ["--list", "--json"], ["--search", "text edit"], ["--categories"]]
+
+
+def best_of(argv, env, repeats):
+    return min(timings_ms(lambda: subprocess.run(argv, env=env, stdout=subprocess.DEVNULL, check=True), repeats))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    with tempfile.TemporaryDirectory() as tmp:
+        dirs, _ = synthetic.generate_tree(tmp, count, icons=False)
+        env = prepare_home(tmp, dirs)
+        subprocess.run([sys.executable, LAUNCHER, "--list"], env=env, stdout=subprocess.DEVNULL, check=True)
+
+        # run_path does not put the script's directory on sys.path the way "python3 launcher.py" does.
+        probe = ("import runpy, sys\n"
+                 "launcher, root = sys.argv[1:3]\n"
+                 "sys.path.insert(0, root)\n"
+                 "sys.argv = [launcher, '--list']\n"
+                 "try:\n    runpy.run_path(launcher, run_name='__main__')\n"
+                 "except SystemExit as e:\n    assert not e.code, e.code\n"
+                 "sys.exit(2 if any(m.startswith('PyQt5') for m in sys.modules) else 0)")
+        result = subprocess.run([sys.executable, "-c", probe, LAUNCHER, ROOT], env=env, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, text=True)
+        if result.returncode not in (0, 2):
+            sys.exit(f"launcher.py --list failed:\n{result.stderr}")
+        qt_imported = result.returncode == 2
+        print(f"{count} entries, PyQt5 imported: {qt_imported}")
+
+        print(f"{'python3 -c pass':30s} {best_of([sys.executable, '-c', 'pass'], env, repeats):7.1f} ms")
+        for query in QUERIES:
+            label = "launcher.py " + " ".join(query)
+            print(f"{label:30s} {best_of([sys.executable, LAUNCHER] + query, env, repeats):7.1f} ms (best of {repeats})")
+        if qt_imported:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
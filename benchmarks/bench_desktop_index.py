@@ -0,0 +1,39 @@
+"""Confronta l'avvio a freddo (indice vuoto) con quello a caldo (indice valido).
+
+    python3 benchmarks/bench_desktop_index.py [numero_di_file]
+"""
+import os
+import sys
+import tempfile
+
+from harness import timed_ms
+import synthetic
+import catalog
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as tmp:
+        dirs, _ = synthetic.generate_tree(tmp, count, icons=False)
+        index_path = os.path.join(tmp, "desktop_index.json")
+
+        no_index_ms, apps = timed_ms(lambda: catalog.find_applications(dirs))
+        index = catalog.DesktopIndex(index_path)
+        cold_ms, _ = timed_ms(lambda: catalog.find_applications(dirs, index))
+        index = catalog.DesktopIndex(index_path)
+        warm_ms, _ = timed_ms(lambda: catalog.find_applications(dirs, index))
+        warm_hits = index.hits
+
+        os.utime(synthetic.desktop_files(dirs)[0], ns=(0, 0))
+        index = catalog.DesktopIndex(index_path)
+        one_changed_ms, _ = timed_ms(lambda: catalog.find_applications(dirs, index))
+
+        print(f"{len(apps)} entries")
+        print(f"no index:       {no_index_ms:8.1f} ms")
+        print(f"cold index:     {cold_ms:8.1f} ms")
+        print(f"warm index:     {warm_ms:8.1f} ms ({warm_hits} hits)")
+        print(f"1 file changed: {one_changed_ms:8.1f} ms ({index.misses} reparsed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Scalabilità della scoperta dei file .desktop rispetto al numero di worker.
+
+    python3 benchmarks/bench_discovery.py [5000 10000 20000]
+
+Genera con synthetic.generate_tree un albero con una cartella "utente"
+che sovrascrive una parte delle voci di sistema e misura
+find_applications senza indice.
+"""
+import sys
+import tempfile
+
+from harness import timed_ms
+import synthetic
+import catalog
+
+WORKER_COUNTS = [1, 2, 4, 8, 16]
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [5000, 10000, 20000]
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            dirs, _ = synthetic.generate_tree(tmp, count, icons=False)
+            line = [f"{count:6d} files:"]
+            for workers in WORKER_COUNTS:
+                elapsed, apps = timed_ms(lambda: catalog.find_applications(dirs, workers=workers))
+                line.append(f"{workers:2d}w {elapsed:7.1f} ms")
+            print("  ".join(line) + f"  ({len(apps)} apps)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Latenza clic -> exec: subprocess.Popen sul thread della GUI contro LaunchEngine.
+
+    python3 benchmarks/bench_launch.py [ripetizioni] [MB_di_zavorra]
+
+Per ogni metodo misura quanto resta bloccato il thread chiamante e il
+tempo dal clic all'uscita del figlio (/bin/true), cioè exec completato.
+Nel launcher launch() gira in un QRunnable, quindi il thread della GUI
+non attende nemmeno quel tempo. La zavorra simula un launcher residente
+con molta memoria occupata, che rende più costoso un fork classico.
+"""
+import os
+import sys
+import time
+import shutil
+import statistics
+import threading
+import subprocess
+
+from harness import timed_ms
+import launch_engine
+
+TRUE = shutil.which("true") or "/bin/true"
+APP = {'id': "true.desktop", 'name': "True", 'exec': TRUE, 'args': [TRUE, "%U"], 'icon': None}
+
+
+def blocked_and_total(start, wait, repeats):
+    """Tempi in ms di start() (il thread chiamante bloccato) e di start() più wait(), fino all'uscita del figlio."""
+    blocked, total = [], []
+    for _ in range(repeats):
+        blocked_ms, handle = timed_ms(start)
+        wait_ms, _ = timed_ms(lambda: wait(handle))
+        blocked.append(blocked_ms)
+        total.append(blocked_ms + wait_ms)
+    return blocked, total
+
+
+def bench_popen(repeats):
+    return blocked_and_total(lambda: subprocess.Popen([TRUE]), lambda proc: proc.wait(), repeats)
+
+
+def bench_engine(repeats):
+    done = threading.Event()
+    engine = launch_engine.LaunchEngine(lambda app, code, seconds: done.set())
+
+    def launch():
+        done.clear()
+        engine.launch(APP)
+
+    return blocked_and_total(launch, lambda _: done.wait(5), repeats)
+
+
+def report(label, blocked, total):
+    print(f"{label:26s} caller blocked {statistics.median(blocked):7.3f} ms   "
+          f"click to exit {statistics.median(total):7.3f} ms (median)")
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    ballast_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    ballast = bytearray(ballast_mb << 20)
+    for i in range(0, len(ballast), 4096):
+        ballast[i] = 1
+
+    report("subprocess.Popen", *bench_popen(repeats))
+    report("LaunchEngine.launch", *bench_engine(repeats))
+
+    # The reaper must leave no zombies behind.
+    time.sleep(0.2)
+    zombies = 0
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/stat", 'r') as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if fields[0] == "Z" and int(fields[1]) == os.getpid():
+            zombies += 1
+    print(f"zombie children left:      {zombies}")
+
+
+if __name__ == "__main__":
+    main()
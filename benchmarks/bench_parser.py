@@ -0,0 +1,32 @@
+"""Throughput di catalog.parse_desktop_file su file con e senza grandi sezioni [Desktop Action].
+
+    python3 benchmarks/bench_parser.py [numero_di_file]
+"""
+import os
+import sys
+import tempfile
+
+from harness import timed_ms
+import synthetic
+import catalog
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    with tempfile.TemporaryDirectory() as tmp:
+        for actions in (0, 50):
+            dirs, _ = synthetic.generate_tree(os.path.join(tmp, f"actions{actions}"), count, icons=False,
+                                              actions=actions)
+            paths = synthetic.desktop_files(dirs)
+            total_bytes = sum(os.path.getsize(p) for p in paths)
+            elapsed_ms, parsed = timed_ms(lambda: [catalog.parse_desktop_file(p) for p in paths])
+            elapsed = elapsed_ms / 1000
+            valid = sum(app is not None for app in parsed)
+            # Only the malformed ~2% may be dropped.
+            assert valid >= len(paths) * 0.9, valid
+            print(f"{actions:3d} actions/file: {len(paths) / elapsed:9.0f} files/s  "
+                  f"{total_bytes / elapsed / 1e6:7.1f} MB/s on disk  ({elapsed_ms:.1f} ms, {valid} valid)")
+
+
+if __name__ == "__main__":
+    main()
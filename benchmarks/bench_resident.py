@@ -0,0 +1,68 @@
+"""Latenza tasto -> finestra visibile: avvio a freddo contro istanza residente.
+
+    python3 benchmarks/bench_resident.py [ripetizioni]
+
+Usa una HOME temporanea (con guida e scorciatoie già segnate come viste)
+e la piattaforma Qt offscreen. Il tempo a freddo va dall'avvio del
+processo alla prima risposta del server locale, cioè a finestra mostrata;
+quello a caldo è l'intera esecuzione di "python3 launcher.py" contro
+l'istanza residente, più il solo round trip sul socket.
+"""
+import os
+import sys
+import time
+import socket
+import tempfile
+import subprocess
+
+from harness import LAUNCHER, timings_ms, prepare_home
+
+
+def round_trip(path, command="show"):
+    """Lo stesso protocollo di resident.send_to_resident, senza importare PyQt."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(2.0)
+        sock.connect(path)
+        sock.sendall(command.encode('utf-8') + b"\n")
+        return sock.makefile('rb').readline() == b"ok\n"
+
+
+def wait_for_server(path, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if round_trip(path):
+                return True
+        except OSError:
+            time.sleep(0.005)
+    return False
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with tempfile.TemporaryDirectory() as tmp:
+        env = prepare_home(tmp)
+        env.update(XDG_RUNTIME_DIR=tmp, QT_QPA_PLATFORM="offscreen")
+        path = os.path.join(tmp, f"pylauncher-{os.getuid()}.sock")
+
+        start = time.perf_counter()
+        daemon = subprocess.Popen([sys.executable, LAUNCHER, "--resident"], env=env,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            if not wait_for_server(path):
+                sys.exit("resident launcher did not start")
+            cold_ms = (time.perf_counter() - start) * 1000
+
+            client_ms = timings_ms(lambda: subprocess.run([sys.executable, LAUNCHER], env=env, check=True), repeats)
+            socket_ms = timings_ms(lambda: round_trip(path), repeats)
+        finally:
+            subprocess.run([sys.executable, LAUNCHER, "--quit"], env=env)
+            daemon.wait(timeout=10)
+
+        print(f"cold start to visible:            {cold_ms:8.1f} ms")
+        print(f"launcher.py against resident:     {min(client_ms):8.1f} ms (best of {repeats})")
+        print(f"socket show round trip:           {min(socket_ms):8.2f} ms (best of {repeats})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Costo per tasto della ricerca incrementale (ordinata per frecency): lookup nell'indice e ridisegno della lista.
+
+    python3 benchmarks/bench_search.py [numero_di_voci] [query]
+
+AppLauncher gira in una HOME temporanea sul catalogo di
+synthetic.generate_tree, con una cronologia di avvii casuale.
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from harness import timed_ms, prepare_home
+import synthetic
+import launch_history
+import search_index
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    query = sys.argv[2] if len(sys.argv) > 2 else "code studio"
+    with tempfile.TemporaryDirectory() as tmp:
+        dirs, _ = synthetic.generate_tree(os.path.join(tmp, "tree"), count, seed=42, icons=False)
+        os.environ.update(prepare_home(tmp, dirs))
+        run(count, query, os.path.join(tmp, "launch_history.log"))
+
+
+def run(count, query, history_path):
+    from PyQt5 import QtWidgets
+    qt_app = QtWidgets.QApplication(sys.argv)
+    import launcher_ui
+    window = launcher_ui.AppLauncher()
+    while not window.catalog_ready:
+        qt_app.processEvents()
+    apps = window.applications
+
+    history = launch_history.LaunchHistory(history_path)
+    now = time.time()
+    rng = random.Random(7)
+    for i in range(5000):
+        history.apply(rng.choice(apps)['id'], now - rng.random() * 365 * 86400)
+
+    build_ms, index = timed_ms(lambda: search_index.SearchIndex(apps, history.scores))
+    print(f"index build for {len(apps)} apps ({count} files): {build_ms:.1f} ms")
+    window.search_index = search_index.SearchIndex(apps, history.scores)
+    window.show()
+    qt_app.processEvents()
+
+    print(f"{'query':16s} {'results':>7s} {'lookup ms':>10s} {'scan ms':>8s} {'repaint ms':>10s}")
+    for n in range(1, len(query) + 1):
+        typed = query[:n]
+        lookup_ms, results = timed_ms(lambda: index.search(typed))
+        needle = typed.lower()
+        scan_ms, _ = timed_ms(lambda: [app for app in apps if needle in app['name'].lower()])
+
+        window.search_box.blockSignals(True)
+        window.search_box.setText(typed)
+        window.search_box.blockSignals(False)
+
+        def search_and_repaint():
+            window.search_apps()
+            window.app_list_widget.viewport().repaint()
+            qt_app.processEvents()
+
+        repaint_ms, _ = timed_ms(search_and_repaint)
+        print(f"{typed!r:16s} {len(results):7d} {lookup_ms:10.2f} {scan_ms:8.2f} {repaint_ms:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
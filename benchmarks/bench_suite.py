@@ -0,0 +1,157 @@
+"""Suite dei benchmark del percorso dati, con risultati in JSON da confrontare tra commit.
+
+    python3 benchmarks/bench_suite.py [--sizes 100,1000,10000,50000] [--repeats N] [--output FILE]
+    python3 benchmarks/bench_suite.py --compare VECCHIO.json NUOVO.json [--threshold PERCENTO]
+
+Per ogni dimensione genera con synthetic.generate_tree un albero .desktop
+e una cartella di icone in una cartella temporanea e misura, senza
+finestra e con la piattaforma Qt offscreen:
+
+  find_applications.cold    scansione e analisi senza indice
+  find_applications.warm    scansione con un DesktopIndex già valido
+  parse_desktop_file        tutti i file, malformati compresi, in serie
+  category_index.build      CategoryIndex dell'intero catalogo
+  category_index.open       lista di una categoria (mediana tra le categorie)
+  search_index.build        SearchIndex dell'intero catalogo
+  search.keystroke          una query digitata un carattere alla volta
+  icons.resolve             IconCache.icon per ogni app, cache vuota
+  icons.pixmap              IconCache.pixmap a 48 px (decodifica), cache vuota
+  icons.warm                IconCache.pixmap con la cache piena
+
+Il JSON riporta per ogni misura min_ms e median_ms su --repeats prove.
+--compare stampa la variazione delle mediane ed esce con 1 se una misura
+è peggiorata più di --threshold per cento (10 se non indicato).
+"""
+import os
+import sys
+import json
+import platform
+import tempfile
+import statistics
+import subprocess
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from harness import ROOT, option, measure
+import synthetic
+
+DEFAULT_SIZES = [100, 1000, 10000]
+QUERIES = ["text editor", "mus", "web browser 12"]
+
+
+def git_commit():
+    try:
+        result = subprocess.run(["git", "-C", ROOT, "rev-parse", "--short", "HEAD"],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        return result.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run_size(count, repeats, tmp):
+    import catalog
+    import category_index
+    import search_index
+    import launcher_ui
+
+    dirs, icon_dir = synthetic.generate_tree(tmp, count)
+    files = synthetic.desktop_files(dirs)
+    results = {"files": len(files)}
+
+    results["find_applications.cold"] = measure(lambda: catalog.find_applications(dirs), repeats)
+    apps = catalog.find_applications(dirs)
+    results["apps"] = len(apps)
+    index_path = os.path.join(tmp, "desktop_index.json")
+    catalog.find_applications(dirs, index=catalog.DesktopIndex(index_path))
+    results["find_applications.warm"] = measure(
+        lambda: catalog.find_applications(dirs, index=catalog.DesktopIndex(index_path)), repeats)
+    results["parse_desktop_file"] = measure(lambda: [catalog.parse_desktop_file(path) for path in files], repeats)
+
+    categories = category_index.CategoryIndex(apps)
+    names = list(categories.categories())
+    results["category_index.build"] = measure(lambda: category_index.CategoryIndex(apps), repeats)
+    opens = [measure(lambda: list(categories.apps(name)), repeats)["median_ms"] for name in names]
+    results["category_index.open"] = {"median_ms": round(statistics.median(opens), 4), "categories": len(names)}
+
+    results["search_index.build"] = measure(lambda: search_index.SearchIndex(apps), repeats)
+    index = search_index.SearchIndex(apps)
+
+    def type_queries():
+        for query in QUERIES:
+            for end in range(1, len(query) + 1):
+                index.search(query[:end])
+            index.search("")
+
+    keystrokes = sum(len(query) for query in QUERIES)
+    typed = measure(type_queries, repeats)
+    results["search.keystroke"] = {key: round(value / keystrokes, 4) if key.endswith("_ms") else value
+                                   for key, value in typed.items()}
+
+    icon_names = [app['icon'] for app in apps if app.get('icon')]
+    cache = launcher_ui.IconCache(icon_dir, max_entries=len(icon_names) * 2 + 1)
+    results["icons.resolve"] = measure(lambda: [cache.icon(name) for name in icon_names], repeats, setup=cache.clear)
+    results["icons.pixmap"] = measure(lambda: [cache.pixmap(name, 48) for name in icon_names], repeats, setup=cache.clear)
+    results["icons.warm"] = measure(lambda: [cache.pixmap(name, 48) for name in icon_names], repeats)
+    results["icons"] = len(icon_names)
+    return results
+
+
+def compare(old_path, new_path, threshold):
+    with open(old_path, 'r', encoding='utf-8') as f:
+        old = json.load(f)
+    with open(new_path, 'r', encoding='utf-8') as f:
+        new = json.load(f)
+    print(f"{old.get('commit')} -> {new.get('commit')}")
+    regressed = False
+    for size, metrics in new["results"].items():
+        before = old["results"].get(size, {})
+        for name, value in metrics.items():
+            if not isinstance(value, dict) or not isinstance(before.get(name), dict):
+                continue
+            a, b = before[name]["median_ms"], value["median_ms"]
+            change = (b - a) / a * 100 if a else 0.0
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressed = True
+            print(f"{size:>6s} {name:26s} {a:10.3f} -> {b:10.3f} ms {change:+7.1f}%{flag}")
+    return 1 if regressed else 0
+
+
+def main():
+    args = sys.argv[1:]
+    if "--compare" in args:
+        threshold = float(option(args, "--threshold", 10))
+        i = args.index("--compare")
+        sys.exit(compare(args[i + 1], args[i + 2], threshold))
+    sizes = [int(size) for size in option(args, "--sizes", ",".join(map(str, DEFAULT_SIZES))).split(",")]
+    repeats = int(option(args, "--repeats", 3))
+    output = option(args, "--output", None)
+
+    from PyQt5 import QtCore, QtWidgets
+    qt_app = QtWidgets.QApplication(sys.argv[:1])
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "qt": QtCore.QT_VERSION_STR,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "repeats": repeats,
+        "results": {},
+    }
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            report["results"][str(count)] = run_size(count, repeats, tmp)
+        print(f"{count} entries done", file=sys.stderr)
+
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    qt_app.quit()
+
+
+if __name__ == "__main__":
+    main()
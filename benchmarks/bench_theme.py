@@ -0,0 +1,87 @@
+"""Latenza del cambio tema e della navigazione con le frecce con una lunga lista app aperta.
+
+    python3 benchmarks/bench_theme.py [numero_di_voci] [ripetizioni]
+
+Confronta il vecchio cambio tema con setStyleSheet sulla finestra
+(ricostruito qui) con le palette precalcolate di ThemeEngine. Ogni misura
+comprende l'elaborazione degli eventi e un ridisegno sincrono della
+finestra. AppLauncher gira in una HOME temporanea con un catalogo di
+synthetic.generate_tree.
+"""
+import os
+import sys
+import tempfile
+import itertools
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from harness import median_ms, prepare_home
+import synthetic
+
+# The stylesheet the launcher used to set on the whole window for the dark theme.
+DARK_STYLE = """
+    QWidget { background-color: #2b2b2b; color: #f0f0f0; }
+    QListWidget { background-color: #2b2b2b; color: #f0f0f0; }
+    QListWidget::item:selected { background-color: #5a5a5a; color: white; }
+    QLabel { color: #a0a0a0; }
+"""
+
+
+def timed(qt_app, window, action, repeats):
+    """Mediana in ms di action più l'elaborazione degli eventi e un ridisegno sincrono."""
+    def step():
+        action()
+        qt_app.processEvents()
+        window.repaint()
+
+    return median_ms(step, repeats)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    with tempfile.TemporaryDirectory() as tmp:
+        dirs, _ = synthetic.generate_tree(os.path.join(tmp, "tree"), count, icons=False)
+        os.environ.update(prepare_home(tmp, dirs))
+        run(count, repeats)
+
+
+def run(count, repeats):
+    from PyQt5 import QtWidgets, QtCore
+    from PyQt5.QtTest import QTest
+    qt_app = QtWidgets.QApplication(sys.argv)
+    import launcher_ui
+
+    window = launcher_ui.AppLauncher()
+    while not window.catalog_ready:
+        qt_app.processEvents()
+    window.show()
+    window.category_index = launcher_ui.category_index.CategoryIndex(synthetic.synthetic_apps(count, categories=["Bench"]))
+    window.show_category_apps(QtWidgets.QListWidgetItem("Bench"))
+    window.app_list_widget.setCurrentIndex(window.app_list_model.index(0))
+    qt_app.processEvents()
+    engine = window.theme_engine
+    initial = window.theme
+
+    def press_down():
+        QTest.keyClick(window.app_list_widget, QtCore.Qt.Key_Down)
+
+    print(f"{count} rows open")
+    styles = itertools.cycle([DARK_STYLE, ""])
+    stylesheet_ms = timed(qt_app, window, lambda: window.setStyleSheet(next(styles)), repeats)
+    stylesheet_key_ms = timed(qt_app, window, press_down, repeats)
+    window.setStyleSheet("")
+    qt_app.processEvents()
+
+    themes = itertools.cycle(["light", "dark"])
+    palette_ms = timed(qt_app, window, lambda: engine.apply(next(themes)), repeats)
+    engine.apply("dark")
+    palette_key_ms = timed(qt_app, window, press_down, repeats)
+    engine.apply(initial)
+
+    print(f"{'setStyleSheet':16s} toggle {stylesheet_ms:8.2f} ms   arrow key {stylesheet_key_ms:6.2f} ms (median)")
+    print(f"{'ThemeEngine':16s} toggle {palette_ms:8.2f} ms   arrow key {palette_key_ms:6.2f} ms (median)")
+
+
+if __name__ == "__main__":
+    main()
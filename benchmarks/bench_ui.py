@@ -0,0 +1,206 @@
+"""Scenari scriptati sulla finestra vera di AppLauncher, con budget di tempo, ridisegni e widget.
+
+    python3 benchmarks/bench_ui.py [--entries N] [--repeats N] [--budgets FILE] [--output FILE]
+
+Genera con synthetic.generate_tree un catalogo e una cartella di icone in
+una HOME temporanea, avvia AppLauncher con la piattaforma Qt offscreen e
+ripete ogni scenario --repeats volte:
+
+  open_category     clic sulla categoria più grande
+  scroll            dieci PageDown nella lista app
+  type_search       digitazione di una query e ricerca
+  clear_search      svuotamento della ricerca e ritorno alle categorie
+  toggle_favorite   clic sul pulsante +/- della prima riga
+  toggle_theme      passaggio al tema successivo
+
+Per ogni scenario registra il tempo (mediana, eventi compresi), i
+QEvent.Paint ricevuti, i widget e gli oggetti figli della finestra dopo
+lo scenario e quanti widget ha lasciato in più. Esce con 1 se uno
+scenario supera il budget: quelli di BUDGETS, sovrascrivibili con un file
+JSON {"scenario": {"wall_ms": ..., "paints": ..., "widgets_created": ...}}.
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import statistics
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import harness
+from harness import option
+import synthetic
+
+BUDGETS = {
+    "open_category": {"wall_ms": 60, "paints": 40, "widgets_created": 0},
+    "scroll": {"wall_ms": 120, "paints": 80, "widgets_created": 0},
+    "type_search": {"wall_ms": 80, "paints": 80, "widgets_created": 0},
+    "clear_search": {"wall_ms": 60, "paints": 40, "widgets_created": 0},
+    "toggle_favorite": {"wall_ms": 40, "paints": 40, "widgets_created": 0},
+    "toggle_theme": {"wall_ms": 60, "paints": 80, "widgets_created": 0},
+}
+
+
+def run(qt_app, window, scenarios, repeats):
+    from PyQt5 import QtCore, QtWidgets
+
+    class PaintCounter(QtCore.QObject):
+        def __init__(self):
+            super().__init__()
+            self.paints = 0
+
+        def eventFilter(self, obj, event):
+            if event.type() == QtCore.QEvent.Paint:
+                self.paints += 1
+            return False
+
+    counter = PaintCounter()
+    qt_app.installEventFilter(counter)
+
+    def settle():
+        # Twice: the first pass can post the update requests the second paints.
+        qt_app.processEvents()
+        qt_app.processEvents()
+
+    results = {}
+    for name, setup, action in scenarios:
+        timings = []
+        paints = widgets_created = 0
+        for _ in range(repeats):
+            setup()
+            settle()
+            widgets_before = len(QtWidgets.QApplication.allWidgets())
+            counter.paints = 0
+            start = time.perf_counter()
+            action()
+            settle()
+            timings.append((time.perf_counter() - start) * 1000)
+            paints = counter.paints
+            widgets_created = len(QtWidgets.QApplication.allWidgets()) - widgets_before
+        results[name] = {
+            "wall_ms": round(statistics.median(timings), 3),
+            "paints": paints,
+            "widgets": len(QtWidgets.QApplication.allWidgets()),
+            "objects": len(window.findChildren(QtCore.QObject)),
+            "widgets_created": widgets_created,
+        }
+    qt_app.removeEventFilter(counter)
+    return results
+
+
+def scenarios_for(window):
+    from PyQt5 import QtCore
+    from PyQt5.QtTest import QTest
+
+    def biggest_category():
+        categories = window.category_list_widget
+        items = [categories.item(row) for row in range(categories.count())]
+        return max(items, key=lambda item: window.category_index.count(item.text()))
+
+    def open_category():
+        window.show_category_apps(biggest_category())
+
+    def reopen_category():
+        window.present()
+        open_category()
+        window.app_list_widget.scrollToTop()
+
+    def scroll():
+        for _ in range(10):
+            QTest.keyClick(window.app_list_widget, QtCore.Qt.Key_PageDown)
+
+    def type_search():
+        QTest.keyClicks(window.search_box, "text edi")
+        # What the debounce timer would run once typing stops.
+        window.search_apps()
+
+    def open_search():
+        window.present()
+        window.search_box.setText("text edi")
+        window.search_apps()
+
+    def clear_search():
+        window.search_box.clear()
+        window.search_apps()
+
+    def toggle_favorite():
+        view = window.app_list_widget
+        rect = window.app_list_delegate.toggle_rect(view.visualRect(window.app_list_model.index(0)))
+        QTest.mouseClick(view.viewport(), QtCore.Qt.LeftButton, QtCore.Qt.NoModifier, rect.center())
+
+    return [
+        ("open_category", window.present, open_category),
+        ("scroll", reopen_category, scroll),
+        ("type_search", window.present, type_search),
+        ("clear_search", open_search, clear_search),
+        ("toggle_favorite", reopen_category, toggle_favorite),
+        ("toggle_theme", window.present, window.cycle_theme),
+    ]
+
+
+def qt_message(kind, context, message):
+    # present() calls raise(), which the offscreen platform warns about on every run.
+    if "does not support" not in message:
+        sys.stderr.write(message + "\n")
+
+
+def over_budget(results, budgets):
+    failures = []
+    for name, limits in budgets.items():
+        measured = results.get(name)
+        if measured is None:
+            continue
+        for metric, limit in limits.items():
+            if measured[metric] > limit:
+                failures.append(f"{name}: {metric} {measured[metric]} > {limit}")
+    return failures
+
+
+def main():
+    args = sys.argv[1:]
+    entries = int(option(args, "--entries", 2000))
+    repeats = int(option(args, "--repeats", 5))
+    budgets_path = option(args, "--budgets", None)
+    output = option(args, "--output", None)
+    budgets = {name: dict(limits) for name, limits in BUDGETS.items()}
+    if budgets_path:
+        with open(budgets_path, 'r', encoding='utf-8') as f:
+            for name, limits in json.load(f).items():
+                budgets.setdefault(name, {}).update(limits)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dirs, icon_dir = synthetic.generate_tree(os.path.join(tmp, "tree"), entries)
+        os.environ.update(harness.prepare_home(tmp, dirs))
+        from PyQt5 import QtCore, QtWidgets
+        QtCore.qInstallMessageHandler(qt_message)
+        qt_app = QtWidgets.QApplication(sys.argv[:1])
+        import launcher_ui
+        launcher_ui.ICON_DIR = icon_dir
+
+        window = launcher_ui.AppLauncher()
+        window.show()
+        while not window.catalog_ready:
+            qt_app.processEvents()
+        results = run(qt_app, window, scenarios_for(window), repeats)
+        window.flush_settings()
+
+    print(f"{entries} entries, {repeats} runs per scenario")
+    for name, measured in results.items():
+        limits = budgets.get(name, {})
+        print(f"{name:16s} {measured['wall_ms']:8.2f} ms (budget {limits.get('wall_ms', '-')})  "
+              f"paints {measured['paints']:4d}  widgets {measured['widgets']:4d} (+{measured['widgets_created']})  "
+              f"objects {measured['objects']:5d}")
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump({"entries": entries, "repeats": repeats, "budgets": budgets, "results": results},
+                      f, indent=2, sort_keys=True)
+            f.write("\n")
+    failures = over_budget(results, budgets)
+    for failure in failures:
+        print(f"over budget: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
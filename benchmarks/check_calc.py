@@ -0,0 +1,72 @@
+"""Casi limite della calcolatrice e della modalità serie che hanno già dato risultati sbagliati.
+
+    python3 benchmarks/check_calc.py
+
+Ogni caso è un'azione e il risultato atteso: un valore, oppure il
+messaggio del CalcError che deve sollevare. Stampa ogni differenza ed
+esce con 1 se ce n'è almeno una.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import decimal
+
+import calc_batch
+import calc_engine
+from calc_engine import CalcError
+
+AMBIGUOUS_COMMA = ("Virgola ambigua: aggiungi i nomi delle colonne nella prima riga "
+                   "o scegli la virgola decimale")
+
+
+def table(text, decimal_comma=None):
+    names, columns = calc_batch.parse_table(text, decimal_comma)
+    return names, [column.tolist() for column in columns]
+
+
+CASES = [
+    # A headerless integer CSV must not turn into one column of decimals.
+    ("csv 1,2 3,4 5,6", lambda: table("1,2\n3,4\n5,6"), CalcError(AMBIGUOUS_COMMA)),
+    ("csv 1,2 3,4 5,6 as columns", lambda: table("1,2\n3,4\n5,6", False), (["x1", "x2"], [[1, 3, 5], [2, 4, 6]])),
+    ("csv with header", lambda: table("a,b\n1,2\n3,4"), (["a", "b"], [[1, 3], [2, 4]])),
+    ("csv with decimals", lambda: table("1.5,2\n3,4.25"), (["x1", "x2"], [[1.5, 3], [2, 4.25]])),
+    ("decimal comma column", lambda: table("1,5\n2,25", True), (["x"], [[1.5, 2.25]])),
+    ("decimal comma, semicolons", lambda: table("1,5;2\n3;4,5"), (["x1", "x2"], [[1.5, 3], [2, 4.5]])),
+    ("decimal comma, tabs", lambda: table("a\tb\n1,5\t2"), (["a", "b"], [[1.5], [2]])),
+    ("plain column", lambda: table("1\n2.5\n-3"), (["x"], [[1, 2.5, -3]])),
+    # Decimal mode must agree with int/float on a zero base.
+    ("0**-1", lambda: calc_engine.evaluate("0**-1"), CalcError("Divisione per zero")),
+    ("0**-1 decimal", lambda: calc_engine.evaluate("0**-1", precision=30), CalcError("Divisione per zero")),
+    ("0**0", lambda: calc_engine.evaluate("0**0"), 1),
+    ("0**0 decimal", lambda: calc_engine.evaluate("0**0", precision=30), decimal.Decimal(1)),
+]
+
+
+def run(action):
+    try:
+        return action()
+    except CalcError as e:
+        return CalcError(str(e))
+
+
+def same(got, expected):
+    if isinstance(expected, CalcError):
+        return isinstance(got, CalcError) and str(got) == str(expected)
+    return not isinstance(got, CalcError) and got == expected
+
+
+def main():
+    failed = 0
+    for label, action, expected in CASES:
+        got = run(action)
+        if not same(got, expected):
+            print(f"{label}: expected {expected!r}, got {got!r}")
+            failed += 1
+    print(f"{len(CASES) - failed}/{len(CASES)} cases pass")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
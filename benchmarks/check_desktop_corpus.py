@@ -0,0 +1,65 @@
+"""Verifica catalog.parse_desktop_file sul corpus di conformità in benchmarks/desktop_corpus.
+
+    python3 benchmarks/check_desktop_corpus.py
+
+Ogni NOME.desktop del corpus ha accanto NOME.json con il risultato atteso:
+
+  record    i campi attesi della voce (solo quelli elencati), null se il file va scartato
+  argv      [file passati, argv atteso] per expand_field_codes
+  visible   {"desktop corrente": visibile} per is_visible; "" vuol dire nessun desktop
+
+La lingua è fissata a it_IT. Stampa ogni differenza ed esce con 1 se ce
+n'è almeno una.
+"""
+import os
+import sys
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["LC_ALL"] = "it_IT.UTF-8"
+
+import catalog
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "desktop_corpus")
+
+
+def check(name, expected):
+    path = os.path.join(CORPUS, name + ".desktop")
+    app = catalog.parse_desktop_file(path)
+    failures = []
+    record = expected.get("record")
+    if record is None or app is None:
+        if record != app:
+            failures.append(f"record: expected {record}, got {app}")
+        return failures
+    for key, value in record.items():
+        if app.get(key) != value:
+            failures.append(f"{key}: expected {value!r}, got {app.get(key)!r}")
+    if "argv" in expected:
+        files, argv = expected["argv"]
+        got = catalog.expand_field_codes(app, files)
+        if got != argv:
+            failures.append(f"argv: expected {argv!r}, got {got!r}")
+    for desktop, visible in expected.get("visible", {}).items():
+        got = catalog.is_visible(app, [desktop] if desktop else [])
+        if got != visible:
+            failures.append(f"visible on {desktop or 'no desktop'}: expected {visible}, got {got}")
+    return failures
+
+
+def main():
+    catalog.LOCALE_VARIANTS = catalog.locale_variants()
+    names = sorted(name[:-len(".desktop")] for name in os.listdir(CORPUS) if name.endswith(".desktop"))
+    failed = 0
+    for name in names:
+        with open(os.path.join(CORPUS, name + ".json"), 'r', encoding='utf-8') as f:
+            failures = check(name, json.load(f))
+        for failure in failures:
+            print(f"{name}: {failure}")
+        failed += bool(failures)
+    print(f"{len(names) - failed}/{len(names)} files conform")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Funzioni comuni agli script dei benchmark: percorsi, opzioni, misure dei tempi e HOME temporanea.
+
+Importarlo mette la radice del progetto in sys.path, così gli script
+possono importare catalog, launcher_ui e gli altri moduli.
+"""
+import os
+import sys
+import json
+import time
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAUNCHER = os.path.join(ROOT, "launcher.py")
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def option(args, flag, default):
+    """Valore che segue flag in args, rimuovendoli entrambi; default se flag manca."""
+    if flag not in args:
+        return default
+    i = args.index(flag)
+    value = args[i + 1]
+    del args[i:i + 2]
+    return value
+
+
+def timed_ms(action):
+    """(millisecondi, risultato) di una chiamata di action."""
+    start = time.perf_counter()
+    result = action()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def timings_ms(action, repeats, setup=None):
+    """Tempi in ms di repeats chiamate di action; setup, se c'è, gira prima di ognuna e non viene misurato."""
+    timings = []
+    for _ in range(repeats):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        action()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def median_ms(action, repeats, setup=None):
+    return statistics.median(timings_ms(action, repeats, setup))
+
+
+def measure(action, repeats, setup=None):
+    """min e mediana in ms su repeats prove, nel formato dei JSON di bench_suite."""
+    timings = timings_ms(action, repeats, setup)
+    return {"min_ms": round(min(timings), 4), "median_ms": round(statistics.median(timings), 4), "runs": repeats}
+
+
+def prepare_home(tmp, dirs=None):
+    """HOME temporanea con guida e scorciatoie già viste; restituisce l'ambiente per il launcher.
+
+    dirs sono le cartelle .desktop di synthetic.generate_tree, che
+    diventano XDG_DATA_HOME e XDG_DATA_DIRS; senza, restano quelle del
+    sistema.
+    """
+    home = os.path.join(tmp, "home")
+    config_dir = os.path.join(home, ".config", "pylauncher_settings")
+    os.makedirs(config_dir)
+    with open(os.path.join(config_dir, "settings.json"), 'w', encoding='utf-8') as f:
+        json.dump({"guide_shown": True, "shortcuts_shown": True, "favorites": []}, f)
+    env = dict(os.environ, HOME=home, XDG_CACHE_HOME=os.path.join(tmp, "cache"))
+    if dirs:
+        env["XDG_DATA_HOME"] = os.path.dirname(dirs[0])
+        env["XDG_DATA_DIRS"] = os.path.dirname(dirs[1])
+    return env
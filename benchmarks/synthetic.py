@@ -0,0 +1,187 @@
+"""Generatore di alberi .desktop e cartelle di icone sintetici per i benchmark.
+
+    python3 benchmarks/synthetic.py CARTELLA [numero_di_voci]
+
+Le voci mescolano i campi come un sistema reale: nomi localizzati,
+GenericName, Comment, Exec con codici di campo, Keywords, una o più
+categorie principali e aggiuntive, sezioni [Desktop Action], voci
+nascoste o limitate a un desktop, sottocartelle di vendor e una cartella
+utente che ne sovrascrive alcune. Circa il 2% dei file è malformato.
+Le icone sono PNG 48x48 e SVG validi; alcune voci usano percorsi
+assoluti, altre nomi che esistono solo nel tema o da nessuna parte.
+synthetic_apps dà le stesse voci già analizzate, senza file, per i
+benchmark che partono dal catalogo in memoria.
+"""
+import os
+import sys
+import zlib
+import random
+import struct
+
+WORDS = ["text", "editor", "image", "viewer", "music", "player", "video", "terminal", "file", "manager",
+         "web", "browser", "mail", "client", "office", "writer", "sheet", "paint", "photo", "studio",
+         "code", "debug", "archive", "disk", "usage", "system", "monitor", "network", "chat", "calendar"]
+MAIN_CATEGORIES = ["AudioVideo", "Audio", "Video", "Development", "Education", "Game", "Graphics",
+                   "Network", "Office", "Science", "Settings", "System", "Utility"]
+ADDITIONAL_CATEGORIES = ["TextEditor", "WebBrowser", "IDE", "Viewer", "Player", "Archiving", "FileManager",
+                         "Email", "Chat", "Calendar", "Monitor", "TerminalEmulator", "Photography", "GTK",
+                         "Qt", "KDE", "GNOME", "X-Vendor-Tools"]
+FIELD_CODES = ["", " %f", " %F", " %u", " %U", " --new-window %U"]
+LOCALES = ["it", "de", "fr", "es", "pt_BR", "ja", "zh_CN"]
+MALFORMED = [
+    b"",
+    b"Name=No header\nExec=nohdr\n",
+    b"[Desktop Entry]\nName=No exec\nType=Application\n",
+    b"[Desktop Entry]\nName=Bad quotes\nExec=\"unterminated %F\n",
+    b"[Desktop Entry]\nName=Bad \xff\xfe utf8\nExec=bad\n",
+    b"\x00\x01\x02 binary garbage \x89PNG\r\n",
+]
+
+
+def png_bytes(size, seed):
+    """PNG RGBA size x size a tinta unita, valido ma senza dipendenze."""
+    r, g, b = (seed * 73) % 256, (seed * 151) % 256, (seed * 199) % 256
+    row = b"\x00" + bytes((r, g, b, 255)) * size
+    raw = zlib.compress(row * size)
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff)
+
+    header = struct.pack(">IIBBBBB", size, size, 8, 6, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", raw) + chunk(b"IEND", b"")
+
+
+def svg_text(seed):
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="48" height="48">'
+            f'<circle cx="24" cy="24" r="20" fill="#{(seed * 2654435761) & 0xffffff:06x}"/></svg>')
+
+
+def icon_name(i):
+    return f"synthetic-app-{i}"
+
+
+def entry_text(rng, i, name_prefix="", actions=None):
+    words = rng.sample(WORDS, 3)
+    name = name_prefix + " ".join(w.capitalize() for w in words[:2]) + f" {i}"
+    lines = ["[Desktop Entry]", "Type=Application", f"Name={name}"]
+    for loc in rng.sample(LOCALES, rng.randrange(len(LOCALES) + 1)):
+        lines.append(f"Name[{loc}]={name} ({loc})")
+    if rng.random() < 0.7:
+        lines.append(f"GenericName={words[0].capitalize()} {words[2].capitalize()}")
+    if rng.random() < 0.8:
+        lines.append(f"Comment={' '.join(rng.sample(WORDS, 6)).capitalize()}")
+    lines.append(f"Exec={words[0]}-{words[1]}-{i}{rng.choice(FIELD_CODES)}")
+    if rng.random() < 0.1:
+        lines.append(f"TryExec={words[0]}-{words[1]}-{i}")
+    roll = rng.random()
+    if roll < 0.6:
+        lines.append(f"Icon={icon_name(i)}")
+    elif roll < 0.7:
+        lines.append(f"Icon=/nonexistent/icons/{icon_name(i)}.png")
+    elif roll < 0.9:
+        lines.append(f"Icon={rng.choice(['accessories-text-editor', 'utilities-terminal', 'folder', 'missing-icon'])}")
+    categories = rng.sample(MAIN_CATEGORIES, rng.randint(1, 2)) + rng.sample(ADDITIONAL_CATEGORIES, rng.randint(0, 3))
+    lines.append("Categories=" + "".join(cat + ";" for cat in categories))
+    if rng.random() < 0.5:
+        lines.append("Keywords=" + "".join(w + ";" for w in rng.sample(WORDS, 4)))
+    if rng.random() < 0.05:
+        lines.append("Terminal=true")
+    if rng.random() < 0.05:
+        lines.append("NoDisplay=true")
+    if rng.random() < 0.03:
+        lines.append("OnlyShowIn=" + rng.choice(["KDE;", "GNOME;", "XFCE;"]))
+    if actions is None:
+        names = ["new-window", "private"] if rng.random() < 0.2 else []
+    else:
+        names = [f"action{j}" for j in range(actions)]
+    if names:
+        lines.append("Actions=" + "".join(action + ";" for action in names))
+        for action in names:
+            lines += ["", f"[Desktop Action {action}]", f"Name={action.capitalize()}",
+                      f"Exec={words[0]}-{words[1]}-{i} --{action}"]
+    return "\n".join(lines) + "\n"
+
+
+def generate_tree(root, count, seed=0, icons=True, actions=None):
+    """Crea sotto root un albero di count voci; restituisce (cartelle .desktop, cartella icone).
+
+    Le cartelle sono in ordine di precedenza, come application_dirs().
+    Con actions ogni voce ha esattamente quel numero di sezioni
+    [Desktop Action].
+    """
+    rng = random.Random(seed)
+    user_dir = os.path.join(root, "home", "applications")
+    system_dir = os.path.join(root, "usr", "applications")
+    vendor_dirs = [os.path.join(system_dir, vendor) for vendor in ("kde4", "org", "vendor")]
+    icon_dir = os.path.join(root, "icons", "48")
+    for d in [user_dir, system_dir, icon_dir] + vendor_dirs:
+        os.makedirs(d, exist_ok=True)
+
+    for i in range(count):
+        target = vendor_dirs[i % len(vendor_dirs)] if i % 8 == 0 else system_dir
+        path = os.path.join(target, f"app{i}.desktop")
+        if rng.random() < 0.02:
+            with open(path, 'wb') as f:
+                f.write(rng.choice(MALFORMED))
+            continue
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(entry_text(rng, i, actions=actions))
+        if icons:
+            if i % 4 == 0:
+                with open(os.path.join(icon_dir, icon_name(i) + ".svg"), 'w', encoding='utf-8') as f:
+                    f.write(svg_text(i))
+            else:
+                with open(os.path.join(icon_dir, icon_name(i) + ".png"), 'wb') as f:
+                    f.write(png_bytes(48, i))
+    # User copies shadow a few system entries.
+    for i in range(1, count, 25):
+        with open(os.path.join(user_dir, f"app{i}.desktop"), 'w', encoding='utf-8') as f:
+            f.write(entry_text(rng, i, "My ", actions))
+    return [user_dir, system_dir], icon_dir
+
+
+def desktop_files(dirs):
+    """Tutti i file .desktop sotto dirs, malformati compresi."""
+    return sorted(os.path.join(d, name) for top in dirs for d, _, names in os.walk(top) for name in names
+                  if name.endswith(".desktop"))
+
+
+def synthetic_apps(count, seed=0, categories=None):
+    """count voci di catalogo come le produce catalog.parse_desktop_file, senza scrivere file.
+
+    Nomi, Exec, Keywords e categorie hanno lo stesso mix di entry_text;
+    con categories tutte le voci stanno solo in quelle categorie.
+    """
+    rng = random.Random(seed)
+    apps = []
+    for i in range(count):
+        words = rng.sample(WORDS, 3)
+        if categories:
+            app_categories = list(categories)
+        else:
+            app_categories = (rng.sample(MAIN_CATEGORIES, rng.randint(1, 2))
+                              + rng.sample(ADDITIONAL_CATEGORIES, rng.randint(0, 3)))
+        apps.append({
+            'id': f"app{i}.desktop",
+            'name': " ".join(w.capitalize() for w in words[:2]) + f" {i}",
+            'exec': f"{words[0]}-{words[1]}-{i}",
+            'icon': icon_name(i),
+            'category': app_categories[0],
+            'categories': app_categories,
+            'keywords': words[1:],
+            'generic_name': f"{words[0].capitalize()} {words[2].capitalize()}",
+            'comment': "",
+        })
+    return apps
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    dirs, icon_dir = generate_tree(sys.argv[1], count)
+    print(f"{count} entries in {', '.join(dirs)}; icons in {icon_dir}")
+
+
+if __name__ == "__main__":
+    main()
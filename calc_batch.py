@@ -0,0 +1,210 @@
+import re
+import math
+
+import calc_engine
+from calc_engine import CalcError, LimitError
+
+# A sweep of 1e6 steps is 8 MB per column; past this the table and the
+# CSV stop being useful anyway.
+MAX_ROWS = 10_000_000
+# Rows evaluated between two looks at the cancellation token and between
+# two updates of the table.
+CHUNK_ROWS = 65536
+RESULT_NAME = "risultato"
+
+NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+SWEEP_RE = re.compile(rf"^\s*([A-Za-z_]\w*)\s*=\s*({NUMBER})\s*\.\.\s*({NUMBER})(?:\s+step\s+({NUMBER}))?\s*$",
+                      re.IGNORECASE)
+NAME_RE = re.compile(r"^[A-Za-z_]\w*$")
+DECIMAL_COMMA_RE = re.compile(r"^\s*[-+]?\d+(?:,\d+)?(?:[eE][-+]?\d+)?\s*$")
+
+
+def numpy():
+    """Il modulo numpy, importato solo quando serve; CalcError se non è installato."""
+    try:
+        import numpy
+    except ImportError:
+        raise CalcError("La modalità serie richiede NumPy (pip install numpy)")
+    return numpy
+
+
+def parse_sweep(text):
+    """(nome, inizio, fine, passo) per "x = 0..1e6 step 1", altrimenti None.
+
+    Senza step il passo è 1; la fine è compresa se ci cade un passo.
+    """
+    match = SWEEP_RE.match(text)
+    if not match:
+        return None
+    name, start, stop, step = match.groups()
+    return name, float(start), float(stop), float(step) if step else 1.0
+
+
+def sweep_values(start, stop, step):
+    np = numpy()
+    if step == 0 or not all(map(math.isfinite, (start, stop, step))):
+        raise CalcError("Intervallo non valido")
+    # The tolerance keeps the end of 0..1 step 0.1 despite 0.1 being inexact.
+    count = math.floor((stop - start) / step + 1e-9) + 1
+    if count <= 0:
+        raise CalcError("Intervallo vuoto")
+    if count > MAX_ROWS:
+        raise LimitError(f"Troppe righe (massimo {MAX_ROWS})")
+    return start + step * np.arange(count, dtype=np.float64)
+
+
+def split_row(line, separator):
+    return [cell.strip() for cell in (line.split(separator) if separator else line.split())]
+
+
+def to_float(cell):
+    try:
+        return float(cell)
+    except ValueError:
+        return float("nan")
+
+
+def parse_table(text, decimal_comma=None):
+    """(nomi, colonne) da una colonna incollata o da un CSV separato da virgole, punti e virgola o tab.
+
+    Se la prima riga non è numerica è l'intestazione con i nomi delle
+    variabili; altrimenti le colonne si chiamano x, oppure x1, x2, ...
+    Le celle non numeriche diventano NaN. Con decimal_comma=True la
+    virgola è il separatore decimale, come nei fogli di calcolo italiani,
+    con False separa le colonne; con None lo è solo se le colonne sono
+    separate da punti e virgola o tab, e un testo che si legge in entrambi
+    i modi ("1,2" su ogni riga) è un errore.
+    """
+    np = numpy()
+    lines = [line for line in text.splitlines() if line.strip()]
+    if not lines:
+        raise CalcError("Nessun valore da calcolare")
+    first = lines[0]
+    separator = "\t" if "\t" in first else ";" if ";" in first else None
+    if separator is None and "," in first and not decimal_comma:
+        separator = ","
+        if decimal_comma is None and all(DECIMAL_COMMA_RE.match(line) for line in lines):
+            # "1,5" is one and a half in a pasted column but two cells in a CSV.
+            raise CalcError("Virgola ambigua: aggiungi i nomi delle colonne nella prima riga "
+                            "o scegli la virgola decimale")
+    if decimal_comma is None:
+        decimal_comma = separator != ","
+    header = split_row(first, separator)
+    # "nan" and "inf" look like names but are numbers.
+    if all(NAME_RE.match(cell) and cell.lower() not in ("nan", "inf", "infinity") for cell in header):
+        names = header
+        lines = lines[1:]
+    else:
+        names = ["x"] if len(header) == 1 else [f"x{i}" for i in range(1, len(header) + 1)]
+    if len(set(names)) != len(names):
+        raise CalcError("Nomi di colonna ripetuti")
+    if len(lines) > MAX_ROWS:
+        raise LimitError(f"Troppe righe (massimo {MAX_ROWS})")
+
+    rows = [split_row(line, separator) for line in lines]
+    columns = []
+    for i in range(len(names)):
+        cells = [row[i] if i < len(row) else "" for row in rows]
+        if decimal_comma:
+            cells = [cell.replace(",", ".") for cell in cells]
+        try:
+            column = np.array(cells, dtype=np.float64)
+        except ValueError:
+            column = np.array([to_float(cell) for cell in cells], dtype=np.float64)
+        columns.append(column)
+    return names, columns
+
+
+def parse_inputs(text, decimal_comma=None):
+    """(nomi, colonne) per un intervallo "x = a..b step s" o per una tabella incollata."""
+    sweep = parse_sweep(text)
+    if sweep:
+        name, start, stop, step = sweep
+        return [name], [sweep_values(start, stop, step)]
+    return parse_table(text, decimal_comma)
+
+
+def vector_operations(np):
+    # Same meaning as the scalar OPERATIONS: np.mod and np.floor_divide follow Python's signs.
+    return {
+        "+": np.add,
+        "-": np.subtract,
+        "*": np.multiply,
+        "/": np.true_divide,
+        "//": np.floor_divide,
+        "%": np.mod,
+        "**": np.power,
+    }
+
+
+def run_vectorized(expression, variables, size, token, np, operations):
+    """Esegue il programma di expression su array float64; variables va dai nomi agli array."""
+    stack = []
+    for count, item in enumerate(expression.program):
+        if token is not None and count % calc_engine.CHECK_EVERY == 0:
+            token.check()
+        if item.__class__ is calc_engine.Variable:
+            stack.append(variables[item.name])
+        elif item.__class__ is not str:
+            stack.append(np.float64(item))
+        elif item == "neg":
+            stack.append(np.negative(stack.pop()))
+        elif item == "pos":
+            pass
+        else:
+            b = stack.pop()
+            stack.append(operations[item](stack.pop(), b))
+    result = stack[0]
+    if np.ndim(result) == 0:
+        return np.full(size, result, dtype=np.float64)
+    # A bare variable is the input column itself: never hand it out to be written.
+    return result.copy() if any(result is column for column in variables.values()) else result
+
+
+def compile_batch(text, names):
+    """Expression per text in modalità standard, con le sole variabili presenti in names."""
+    expression = calc_engine.compile_expression(text)
+    for name in expression.variables:
+        if name not in names:
+            raise CalcError(f"Variabile non definita: {name}")
+    return expression
+
+
+def evaluate_chunks(expression, names, columns, token=None, chunk_rows=CHUNK_ROWS):
+    """Genera (inizio, risultati) per blocchi di chunk_rows righe, in float64.
+
+    Le righe non calcolabili (divisione per zero, radice di un negativo,
+    celle non numeriche) valgono inf o NaN invece di fermare la serie.
+    """
+    np = numpy()
+    operations = vector_operations(np)
+    total = len(columns[0]) if columns else 0
+    for start in range(0, total, chunk_rows):
+        if token is not None:
+            token.check()
+        end = min(start + chunk_rows, total)
+        variables = {name: column[start:end] for name, column in zip(names, columns)}
+        try:
+            with np.errstate(all="ignore"):
+                result = run_vectorized(expression, variables, end - start, token, np, operations)
+        except OverflowError:
+            raise LimitError("Risultato troppo grande")
+        yield start, result
+
+
+def write_csv(path, names, columns, results, token=None, chunk_rows=CHUNK_ROWS):
+    """Scrive in path un CSV con le colonne di ingresso e i risultati; restituisce le righe scritte.
+
+    I valori sono in forma repr: la più corta che si rilegge esattamente.
+    """
+    rows = len(results)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(",".join(list(names) + [RESULT_NAME]) + "\n")
+        for start in range(0, rows, chunk_rows):
+            if token is not None:
+                token.check()
+            end = min(start + chunk_rows, rows)
+            # One join per block: about four times faster than np.savetxt's per-row formatting.
+            cells = [map(repr, column[start:end].tolist()) for column in list(columns) + [results]]
+            f.write("\n".join(map(",".join, zip(*cells))) + "\n")
+    return rows
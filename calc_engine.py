@@ -0,0 +1,443 @@
+import re
+import math
+import time
+import decimal
+from functools import lru_cache
+
+# Resource limits: together they bound the time and memory of a single
+# evaluation, whatever the user types. Integers stay exact up to
+# MAX_INT_BITS (about 158000 digits): past that CPython's quadratic
+# division would hold the GIL, and so the GUI, for too long.
+MAX_INT_BITS = 1 << 19
+MAX_EXPONENT = MAX_INT_BITS
+MAX_OPERATIONS = 10000
+MAX_DEPTH = 100
+MAX_LENGTH = 20000
+PARSE_CACHE_SIZE = 256
+# Operations between two looks at the cancellation token.
+CHECK_EVERY = 32
+# Precision mode: significant digits are capped because non-integer powers
+# get slow fast (2**0.5 takes 40 ms at 1000 digits, 13 s at 10000), and
+# exponents are capped so the full digit string stays within a few MB.
+MAX_PRECISION = 1000
+DECIMAL_EMAX = 10 ** 6
+# Integers longer than this are shown in scientific notation; it also
+# keeps str() clear of its quadratic cost and of the 4300-digit limit.
+DISPLAY_MAX_CHARS = 1000
+SCIENTIFIC_DIGITS = 16
+LOG10_2 = math.log10(2)
+
+TOKEN_RE = re.compile(r"\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|(\*\*|//|[-+*/%()])|([A-Za-z_]\w*))")
+BINARY_PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2, "//": 2, "%": 2}
+
+
+class CalcError(ValueError):
+    """Espressione non valida o non calcolabile; il messaggio è pronto per l'utente."""
+
+
+class LimitError(CalcError):
+    """Il calcolo supererebbe uno dei limiti di risorse."""
+
+
+class Cancelled(CalcError):
+    """Calcolo annullato o scaduto prima della fine."""
+
+
+class CancelToken:
+    """Richiesta di annullamento condivisa tra chi avvia un calcolo e il thread che lo esegue.
+
+    Con timeout (in secondi) il calcolo si interrompe anche da solo quando
+    scade.
+    """
+
+    def __init__(self, timeout=None):
+        self.cancelled = False
+        self.deadline = time.monotonic() + timeout if timeout else None
+
+    def cancel(self):
+        self.cancelled = True
+
+    def check(self):
+        if self.cancelled:
+            raise Cancelled("Calcolo annullato")
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise Cancelled("Tempo scaduto")
+
+
+class Variable:
+    """Nome di variabile nel programma compilato; il valore arriva da evaluate(variables=...) o da calc_batch."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"Variable({self.name!r})"
+
+
+def tokenize(text, context=None):
+    """Lista di token: numeri, Variable e operatori/parentesi come stringhe.
+
+    I numeri sono int o float, oppure Decimal arrotondati a context se è indicato.
+    """
+    tokens = []
+    pos = 0
+    end = len(text.rstrip())
+    while pos < end:
+        match = TOKEN_RE.match(text, pos)
+        if not match:
+            raise CalcError("Espressione non valida")
+        number, symbol, name = match.groups()
+        if name is not None:
+            tokens.append(Variable(name))
+        elif number is not None:
+            if context is not None:
+                try:
+                    tokens.append(context.create_decimal(number))
+                except decimal.Overflow:
+                    raise LimitError("Numero troppo grande")
+            elif "." in number or "e" in number or "E" in number:
+                value = float(number)
+                if math.isinf(value):
+                    # 1e999 would be inf, and 1e999*0 nan, with no limit ever checked.
+                    raise LimitError("Numero troppo grande")
+                tokens.append(value)
+            else:
+                tokens.append(int(number))
+        else:
+            tokens.append(symbol)
+        pos = match.end()
+    return tokens
+
+
+class Parser:
+    """Parser a discesa ricorsiva con le precedenze di Python.
+
+    L'AST è fatto di tuple: ("num", valore), ("var", Variable), ("neg", nodo),
+    ("pos", nodo) e (operatore, sinistro, destro). Le catene di + e * sono costruite in
+    un ciclo; la profondità di parentesi, segni e potenze è limitata da
+    MAX_DEPTH.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        self.depth = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise CalcError("Espressione non valida")
+        node = self.binary(1)
+        if self.pos != len(self.tokens):
+            raise CalcError("Espressione non valida")
+        return node
+
+    def binary(self, level):
+        if level > 2:
+            return self.unary()
+        node = self.binary(level + 1)
+        while True:
+            token = self.peek()
+            if not isinstance(token, str) or BINARY_PRECEDENCE.get(token) != level:
+                return node
+            self.take()
+            node = (token, node, self.binary(level + 1))
+
+    def enter(self):
+        self.depth += 1
+        if self.depth > MAX_DEPTH:
+            raise LimitError("Espressione troppo annidata")
+
+    def unary(self):
+        token = self.peek()
+        if token in ("-", "+"):
+            self.take()
+            self.enter()
+            node = ("neg" if token == "-" else "pos", self.unary())
+            self.depth -= 1
+            return node
+        return self.power()
+
+    def power(self):
+        node = self.atom()
+        if self.peek() == "**":
+            self.take()
+            self.enter()
+            # Right associative, and binds tighter than a unary minus on its left: -2**2 == -4.
+            node = ("**", node, self.unary())
+            self.depth -= 1
+        return node
+
+    def atom(self):
+        token = self.take()
+        if token == "(":
+            self.enter()
+            node = self.binary(1)
+            self.depth -= 1
+            if self.take() != ")":
+                raise CalcError("Parentesi non chiusa")
+            return node
+        if isinstance(token, Variable):
+            return ("var", token)
+        if token is None or isinstance(token, str):
+            raise CalcError("Espressione non valida")
+        return ("num", token)
+
+
+def compile_ast(node):
+    """Traduce l'AST in un programma in notazione polacca inversa, senza ricorsione."""
+    program = []
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if not isinstance(item, tuple):
+            program.append(item)
+        elif item[0] in ("num", "var"):
+            program.append(item[1])
+        elif len(item) == 2:
+            stack.append(item[0])
+            stack.append(item[1])
+        else:
+            stack.append(item[0])
+            stack.append(item[2])
+            stack.append(item[1])
+    return tuple(program)
+
+
+def check_int(value):
+    if isinstance(value, int) and value.bit_length() > MAX_INT_BITS:
+        raise LimitError("Risultato troppo grande")
+    return value
+
+
+def check_float(value):
+    if isinstance(value, float) and value in (float("inf"), float("-inf")):
+        raise LimitError("Risultato troppo grande")
+    if isinstance(value, complex):
+        raise CalcError("Il risultato non è un numero reale")
+    if isinstance(value, decimal.Decimal) and not value.is_finite():
+        # Decimal returns Infinity for some operations without signalling.
+        if value.is_infinite():
+            raise LimitError("Risultato troppo grande")
+        raise CalcError("Il risultato non è un numero reale")
+    return value
+
+
+def power(base, exponent):
+    if isinstance(base, decimal.Decimal) and not base:
+        # Same answers as int and float: Decimal gives Infinity for 0**-1 and refuses 0**0.
+        if exponent < 0:
+            raise ZeroDivisionError
+        if not exponent:
+            return decimal.Decimal(1)
+    if isinstance(base, decimal.Decimal) and exponent == decimal.Decimal("0.5"):
+        # The square root button: much faster than the general power.
+        return base.sqrt()
+    if isinstance(exponent, int) and abs(exponent) > MAX_EXPONENT and abs(base) not in (0, 1):
+        raise LimitError("Esponente troppo grande")
+    if isinstance(base, int) and isinstance(exponent, int) and exponent > 0:
+        # Estimate the size before computing: 9**9**9 must fail at once.
+        if (abs(base).bit_length() - 1) * exponent > MAX_INT_BITS:
+            raise LimitError("Risultato troppo grande")
+    return check_float(base ** exponent)
+
+
+def divisor(b):
+    # Decimal reports x%0 and 0/0 as invalid operations, not as divisions by zero.
+    if not b:
+        raise ZeroDivisionError
+    return b
+
+
+def multiply(a, b):
+    if isinstance(a, int) and isinstance(b, int) and a.bit_length() + b.bit_length() > MAX_INT_BITS + 1:
+        raise LimitError("Risultato troppo grande")
+    return check_float(a * b)
+
+
+OPERATIONS = {
+    "+": lambda a, b: check_int(check_float(a + b)),
+    "-": lambda a, b: check_int(check_float(a - b)),
+    "*": multiply,
+    "/": lambda a, b: check_float(a / divisor(b)),
+    "//": lambda a, b: a // divisor(b),
+    "%": lambda a, b: a % divisor(b),
+    "**": lambda a, b: check_int(power(a, b)),
+}
+
+
+@lru_cache(maxsize=8)
+def decimal_context(precision):
+    """Contesto Decimal per la modalità a precisione arbitraria con precision cifre significative."""
+    if not 1 <= precision <= MAX_PRECISION:
+        raise CalcError(f"La precisione deve essere tra 1 e {MAX_PRECISION} cifre")
+    return decimal.Context(prec=precision, Emax=DECIMAL_EMAX, Emin=-DECIMAL_EMAX,
+                           traps=[decimal.Overflow, decimal.InvalidOperation, decimal.DivisionByZero])
+
+
+class Expression:
+    """Espressione analizzata una volta: AST, programma compilato e valore memorizzato.
+
+    Con precision (cifre significative) i numeri sono Decimal e ogni
+    operazione è arrotondata a quella precisione; senza, int esatti e float.
+    """
+
+    def __init__(self, text, precision=None):
+        self.text = text
+        self.context = decimal_context(precision) if precision else None
+        if len(text) > MAX_LENGTH:
+            raise LimitError("Espressione troppo lunga")
+        tokens = tokenize(text, self.context)
+        try:
+            self.ast = Parser(tokens).parse()
+        except RecursionError:
+            raise LimitError("Espressione troppo annidata")
+        self.program = compile_ast(self.ast)
+        if len(self.program) > MAX_OPERATIONS:
+            raise LimitError("Troppe operazioni")
+        names = [item.name for item in self.program if item.__class__ is Variable]
+        self.variables = tuple(sorted(set(names), key=names.index))
+        self.value = None
+
+    def evaluate(self, token=None, variables=None):
+        if self.value is not None:
+            return self.value
+        for name in self.variables:
+            if not variables or name not in variables:
+                raise CalcError(f"Variabile non definita: {name}")
+        stack = []
+        try:
+            if self.context is not None:
+                # Thread-local: Decimal operators below round to this precision.
+                with decimal.localcontext(self.context):
+                    return self.run(stack, token, variables)
+            return self.run(stack, token, variables)
+        except ZeroDivisionError:
+            raise CalcError("Divisione per zero")
+        except (OverflowError, decimal.Overflow):
+            raise LimitError("Risultato troppo grande")
+        except decimal.InvalidOperation:
+            raise CalcError("Il risultato non è un numero reale")
+
+    def run(self, stack, token, variables=None):
+        for count, item in enumerate(self.program):
+            if token is not None and count % CHECK_EVERY == 0:
+                token.check()
+            if item.__class__ is Variable:
+                stack.append(variables[item.name])
+            elif item.__class__ is not str:
+                stack.append(check_int(item))
+            elif item == "neg":
+                stack.append(-stack.pop())
+            elif item == "pos":
+                pass
+            else:
+                b = stack.pop()
+                stack.append(OPERATIONS[item](stack.pop(), b))
+        if self.variables:
+            # Depends on the values passed in: nothing to remember.
+            return stack[0]
+        self.value = stack[0]
+        return self.value
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def compile_expression(text, precision=None):
+    """Expression per text; le analisi già fatte vengono riusate finché testo e precisione non cambiano."""
+    return Expression(text, precision)
+
+
+def evaluate(text, token=None, precision=None, variables=None):
+    """Valore di text (int, float o Decimal con precision); CalcError se non valida, fuori dai limiti o annullata tramite token.
+
+    variables dà il valore dei nomi usati nell'espressione.
+    """
+    if token is not None:
+        token.check()
+    return compile_expression(text, precision).evaluate(token, variables)
+
+
+def int_to_decimal(n):
+    """Decimal esatto di un int in tempo subquadratico (come _pylong di Python 3.12).
+
+    Divide n in due metà binarie, cosa che costa solo uno shift, e le
+    ricompone con le moltiplicazioni veloci di libmpdec; str(n) è
+    quadratico e oltre 4300 cifre viene rifiutato.
+    """
+    context = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN,
+                              traps=[decimal.Inexact])
+    powers = {}
+
+    def power_of_two(bits):
+        if bits not in powers:
+            powers[bits] = context.power(context.create_decimal(2), bits)
+        return powers[bits]
+
+    def convert(n, bits):
+        if bits <= 3000:
+            return context.create_decimal(n)
+        low_bits = bits >> 1
+        high = n >> low_bits
+        low = n - (high << low_bits)
+        return context.add(convert(low, low_bits), context.multiply(convert(high, bits - low_bits), power_of_two(low_bits)))
+
+    result = convert(abs(n), abs(n).bit_length())
+    return context.minus(result) if n < 0 else result
+
+
+def int_head(n, keep):
+    """(prime keep cifre di n arrotondate, numero di cifre di n) per n > 0, senza convertire tutto n."""
+    bits = n.bit_length()
+    # floor(bits * log10(2)) + 1 is the digit count or one more than it.
+    digits = int(bits * LOG10_2) + 1
+    scale = 10 ** (digits - keep - 1)
+    head = n // scale
+    if head < 10 ** keep:
+        digits -= 1
+        head = n // (scale // 10)
+    # One guard digit for rounding; a carry to keep + 1 digits adds one to the exponent.
+    head = (head + 5) // 10
+    if head >= 10 ** keep:
+        head //= 10
+        digits += 1
+    return head, digits
+
+
+def render(value, max_chars=DISPLAY_MAX_CHARS):
+    """(testo da mostrare, abbreviato) per un risultato.
+
+    Un intero con più di max_chars cifre diventa notazione scientifica con
+    SCIENTIFIC_DIGITS cifre significative, da mostrare soltanto: riletto
+    come numero sarebbe un float infinito, quindi per continuare a
+    calcolare serve il valore esatto. Le cifre complete si ottengono con
+    full_digits. I float e
+    i Decimal (al più MAX_PRECISION cifre, poi notazione scientifica) sono
+    già corti.
+    """
+    if isinstance(value, int) and value.bit_length() > max_chars * 3.33:
+        head, digits = int_head(abs(value), SCIENTIFIC_DIGITS)
+        mantissa = str(head).rstrip("0") or "0"
+        sign = "-" if value < 0 else ""
+        fraction = f".{mantissa[1:]}" if len(mantissa) > 1 else ""
+        return f"{sign}{mantissa[0]}{fraction}e+{digits - 1}", True
+    return str(value), False
+
+
+def full_digits(value):
+    """Tutte le cifre del risultato, senza notazione scientifica; può richiedere tempo, va chiamata a richiesta."""
+    if isinstance(value, int):
+        if value.bit_length() <= 4000:
+            return str(value)
+        return format(int_to_decimal(value), "f")
+    if isinstance(value, decimal.Decimal):
+        return format(value, "f")
+    return repr(value)
@@ -0,0 +1,482 @@
+import os
+import json
+import pathlib
+import shutil
+
+BLACKLIST = {"i3", "gnome-shell", "plasmashell", "xfce4-panel", "lxpanel", "portal", "desktop"}
+
+# Bump whenever the parser output or the index layout changes: a stale
+# index with a different version is discarded and rebuilt from scratch.
+INDEX_VERSION = 4
+
+# Parsing is mostly file I/O, so a small pool is enough to hide the latency
+# of cold reads without flooding the disk on machines with many cores.
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+BATCH_SIZE = 64
+
+
+def application_dirs():
+    """Cartelle applications/ secondo XDG, dalla più prioritaria (utente) alla meno prioritaria."""
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    data_dirs = os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share"
+    dirs = []
+    for base in [data_home] + data_dirs.split(":"):
+        if not base:
+            continue
+        d = os.path.join(base, "applications")
+        if d not in dirs:
+            dirs.append(d)
+    return dirs
+
+
+def default_index_path():
+    """Percorso dell'indice: $XDG_CACHE_HOME se impostata, altrimenti la cartella delle impostazioni."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if cache_home:
+        return pathlib.Path(cache_home) / "pylauncher" / "desktop_index.json"
+    return pathlib.Path.home() / ".config" / "pylauncher_settings" / "desktop_index.json"
+
+
+def locale_variants():
+    """Varianti della lingua corrente in ordine di preferenza, come da specifica (lang_COUNTRY@MODIFIER)."""
+    value = os.environ.get("LC_ALL") or os.environ.get("LC_MESSAGES") or os.environ.get("LANG") or ""
+    value = value.split(".", 1)[0]
+    if "@" in value:
+        value, modifier = value.split("@", 1)
+    else:
+        modifier = ""
+    lang, _, country = value.partition("_")
+    if not lang or lang in ("C", "POSIX"):
+        return []
+    variants = []
+    if country and modifier:
+        variants.append(f"{lang}_{country}@{modifier}")
+    if country:
+        variants.append(f"{lang}_{country}")
+    if modifier:
+        variants.append(f"{lang}@{modifier}")
+    variants.append(lang)
+    return variants
+
+
+LOCALE_VARIANTS = locale_variants()
+
+ESCAPES = {"s": " ", "n": "\n", "t": "\t", "r": "\r", "\\": "\\"}
+
+
+def unescape_string(value):
+    """Applica gli escape dei valori string (\\s, \\n, \\t, \\r, \\\\)."""
+    if "\\" not in value:
+        return value
+    out = []
+    i = 0
+    while i < len(value):
+        c = value[i]
+        if c == "\\" and i + 1 < len(value) and value[i + 1] in ESCAPES:
+            out.append(ESCAPES[value[i + 1]])
+            i += 2
+        else:
+            out.append(c)
+            i += 1
+    return "".join(out)
+
+
+def split_list(value):
+    """Divide un valore lista separato da ';' rispettando l'escape \\;."""
+    items = []
+    current = []
+    i = 0
+    while i < len(value):
+        c = value[i]
+        if c == "\\" and i + 1 < len(value):
+            # Pairs are consumed whole: in a\\; the backslash is escaped and ';' still separates.
+            current.append(";" if value[i + 1] == ";" else value[i:i + 2])
+            i += 2
+            continue
+        if c == ";":
+            items.append(unescape_string("".join(current)))
+            current = []
+        else:
+            current.append(c)
+        i += 1
+    if current:
+        items.append(unescape_string("".join(current)))
+    return [item for item in items if item]
+
+
+def split_exec(command):
+    """Divide la riga Exec in argomenti secondo le regole di quoting della specifica."""
+    args = []
+    current = []
+    in_arg = False
+    quoted = False
+    i = 0
+    while i < len(command):
+        c = command[i]
+        if quoted:
+            if c == "\\" and i + 1 < len(command) and command[i + 1] in '"`$\\':
+                current.append(command[i + 1])
+                i += 1
+            elif c == '"':
+                quoted = False
+            else:
+                current.append(c)
+        elif c == '"':
+            quoted = True
+            in_arg = True
+        elif c in " \t":
+            if in_arg:
+                args.append("".join(current))
+                current = []
+                in_arg = False
+        else:
+            current.append(c)
+            in_arg = True
+        i += 1
+    if quoted:
+        raise ValueError(f"Unterminated quote in Exec: {command}")
+    if in_arg:
+        args.append("".join(current))
+    return args
+
+
+def expand_field_codes(app, files=()):
+    """Espande i field code di Exec (%f %u %F %U %i %c %k %%) e restituisce l'argv da eseguire."""
+    files = [str(f) for f in files]
+    argv = []
+    for arg in app['args']:
+        if arg in ("%F", "%U"):
+            argv.extend(files)
+            continue
+        if arg in ("%f", "%u") and not files:
+            continue
+        if arg == "%i":
+            if app.get('icon'):
+                argv.extend(["--icon", app['icon']])
+            continue
+        out = []
+        i = 0
+        while i < len(arg):
+            c = arg[i]
+            if c == "%" and i + 1 < len(arg):
+                code = arg[i + 1]
+                if code == "%":
+                    out.append("%")
+                elif code in "fu":
+                    out.append(files[0] if files else "")
+                elif code == "c":
+                    out.append(app['name'])
+                elif code == "k":
+                    out.append(app.get('file') or "")
+                # Deprecated (%d %D %n %N %v %m) and unknown codes expand to nothing.
+                i += 2
+                continue
+            out.append(c)
+            i += 1
+        if not out and len(arg) == 2 and arg[0] == "%":
+            continue  # a lone field code that expands to nothing is removed, not passed as ""
+        argv.append("".join(out))
+    return argv
+
+
+BOOLEAN_KEYS = {"NoDisplay", "Hidden", "Terminal"}
+LIST_KEYS = {"Categories", "Keywords", "OnlyShowIn", "NotShowIn"}
+STRING_KEYS = {"Type", "Name", "GenericName", "Comment", "Exec", "TryExec", "Icon", "Path"}
+LOCALIZED_KEYS = {"Name", "GenericName", "Comment", "Keywords"}
+
+
+def parse_desktop_file(filepath):
+    """Legge il solo gruppo [Desktop Entry] di un file .desktop.
+
+    La lettura si ferma all'intestazione del gruppo successivo, così le
+    sezioni [Desktop Action ...] non vengono nemmeno lette. Restituisce
+    None se il file non è una voce valida.
+    """
+    values = {}
+    localized = {}
+    in_entry = False
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line[0] == "#":
+                    continue
+                if line[0] == "[":
+                    if in_entry:
+                        break
+                    in_entry = line == "[Desktop Entry]"
+                    continue
+                if not in_entry:
+                    continue
+                key, sep, value = line.partition("=")
+                if not sep:
+                    continue
+                key = key.rstrip()
+                value = value.lstrip()
+                if key.endswith("]"):
+                    base, _, locale = key[:-1].partition("[")
+                    if base in LOCALIZED_KEYS and locale in LOCALE_VARIANTS:
+                        rank = LOCALE_VARIANTS.index(locale)
+                        if base not in localized or rank < localized[base][0]:
+                            localized[base] = (rank, value)
+                    continue
+                if key in STRING_KEYS or key in BOOLEAN_KEYS or key in LIST_KEYS:
+                    values.setdefault(key, value)
+    except Exception:
+        return None
+
+    for key, (_, value) in localized.items():
+        values[key] = value
+    name = unescape_string(values.get("Name", ""))
+    command = unescape_string(values.get("Exec", ""))
+    if not name or not command:
+        return None
+    try:
+        args = split_exec(command)
+    except ValueError:
+        return None
+    if not args:
+        return None
+    categories = split_list(values.get("Categories", ""))
+    return {
+        'name': name,
+        'exec': args[0],
+        'command': command,
+        'args': args,
+        'icon': unescape_string(values.get("Icon", "")) or None,
+        'category': categories[0] if categories else "Other",
+        'categories': categories,
+        'keywords': split_list(values.get("Keywords", "")),
+        'generic_name': unescape_string(values.get("GenericName", "")),
+        'comment': unescape_string(values.get("Comment", "")),
+        'type': values.get("Type", "Application"),
+        'try_exec': unescape_string(values.get("TryExec", "")),
+        'workdir': unescape_string(values.get("Path", "")),
+        'terminal': values.get("Terminal") == "true",
+        'no_display': values.get("NoDisplay") == "true",
+        'hidden': values.get("Hidden") == "true",
+        'only_show_in': split_list(values.get("OnlyShowIn", "")),
+        'not_show_in': split_list(values.get("NotShowIn", "")),
+        'file': str(filepath),
+    }
+
+
+def current_desktops():
+    return [d for d in os.environ.get("XDG_CURRENT_DESKTOP", "").split(":") if d]
+
+
+def is_visible(app_info, desktops=None):
+    """Applica Type, NoDisplay, Hidden, OnlyShowIn/NotShowIn e TryExec a una voce già analizzata."""
+    if app_info.get('type', "Application") != "Application":
+        return False
+    if app_info.get('hidden') or app_info.get('no_display'):
+        return False
+    if desktops is None:
+        desktops = current_desktops()
+    only_show_in = app_info.get('only_show_in')
+    if only_show_in and not any(d in only_show_in for d in desktops):
+        return False
+    if any(d in app_info.get('not_show_in', ()) for d in desktops):
+        return False
+    try_exec = app_info.get('try_exec')
+    if try_exec and not (os.access(try_exec, os.X_OK) if os.path.isabs(try_exec) else shutil.which(try_exec)):
+        return False
+    name = app_info['name'].lower()
+    program = os.path.basename(app_info['exec']).lower()
+    return name not in BLACKLIST and program not in BLACKLIST
+
+
+def scan_dir(d):
+    """Elenca con os.scandir i file .desktop e le sottocartelle di d."""
+    names = []
+    subdirs = []
+    try:
+        with os.scandir(d) as it:
+            for entry in it:
+                if entry.name.endswith(".desktop") and entry.is_file():
+                    names.append(entry.name)
+                elif entry.is_dir():
+                    subdirs.append(entry.name)
+    except OSError:
+        pass
+    return sorted(names), sorted(subdirs)
+
+
+class DesktopIndex:
+    """Indice su disco dei file .desktop già analizzati.
+
+    Ogni cartella è registrata con il suo mtime e l'elenco dei file; ogni
+    file con mtime, dimensione e inode. Se nulla è cambiato la voce viene
+    riletta dall'indice senza riaprire il file. Le voci contengono i nomi
+    già localizzati: un indice scritto con un'altra lingua viene scartato.
+    """
+
+    def __init__(self, path=None):
+        self.path = pathlib.Path(path) if path else default_index_path()
+        self.dirs = {}
+        self.files = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION or data.get("locale") != LOCALE_VARIANTS:
+                self.dirty = True
+                return
+            self.dirs = data.get("dirs", {})
+            self.files = data.get("files", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading desktop index: {e}")
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Per-process name: the launcher and a headless query may save at once.
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": INDEX_VERSION, "locale": LOCALE_VARIANTS, "dirs": self.dirs, "files": self.files}, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            print(f"Error saving desktop index: {e}")
+
+    def invalidate(self):
+        """Svuota l'indice e lo rimuove dal disco: il prossimo scan rianalizza tutto."""
+        self.dirs = {}
+        self.files = {}
+        self.dirty = True
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error removing desktop index: {e}")
+
+    def list_dir(self, d):
+        """File .desktop e sottocartelle di d; usa l'elenco salvato se l'mtime della cartella non è cambiato."""
+        try:
+            mtime = os.stat(d).st_mtime_ns
+        except OSError:
+            if self.dirs.pop(d, None) is not None:
+                self.dirty = True
+            return [], []
+        cached = self.dirs.get(d)
+        if cached and cached["mtime"] == mtime:
+            return cached["names"], cached["subdirs"]
+        names, subdirs = scan_dir(d)
+        self.dirs[d] = {"mtime": mtime, "names": names, "subdirs": subdirs}
+        self.dirty = True
+        return names, subdirs
+
+    def lookup(self, filepath):
+        """Restituisce (trovato, chiave, voce): trovato è vero se mtime, dimensione e inode coincidono."""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return False, None, None
+        key = [st.st_mtime_ns, st.st_size, st.st_ino]
+        cached = self.files.get(filepath)
+        if cached and cached["key"] == key:
+            self.hits += 1
+            return True, key, cached["app"]
+        self.misses += 1
+        return False, key, None
+
+    def store(self, filepath, key, app_info):
+        self.files[filepath] = {"key": key, "app": app_info}
+        self.dirty = True
+
+    def prune(self, seen):
+        """Rimuove le voci dei file che non esistono più."""
+        stale = [path for path in self.files if path not in seen]
+        for path in stale:
+            del self.files[path]
+        if stale:
+            self.dirty = True
+
+
+def iter_desktop_files(root, index=None):
+    """Genera (id, percorso) per ogni file .desktop sotto root, incluse le sottocartelle.
+
+    L'id segue la specifica: percorso relativo a root con "/" sostituito da "-".
+    """
+    stack = [(root, "")]
+    while stack:
+        d, prefix = stack.pop()
+        names, subdirs = index.list_dir(d) if index else scan_dir(d)
+        for name in names:
+            yield prefix + name, os.path.join(d, name)
+        for sub in reversed(subdirs):
+            stack.append((os.path.join(d, sub), f"{prefix}{sub}-"))
+
+
+def find_applications(desktop_dirs=None, index=None, parse=parse_desktop_file, workers=None, on_batch=None, batch_size=BATCH_SIZE):
+    """Catalogo delle app visibili, ordinato per nome.
+
+    Se on_batch è indicato viene chiamato (dal thread chiamante) con gruppi
+    di al più batch_size voci man mano che sono pronte: prima quelle
+    servite dall'indice, poi quelle rianalizzate.
+    """
+    # The first directory that provides an id wins, so user entries shadow system ones.
+    paths = {}
+    for d in desktop_dirs if desktop_dirs is not None else application_dirs():
+        if not os.path.isdir(d):
+            continue
+        for desktop_id, filepath in iter_desktop_files(d, index):
+            paths.setdefault(desktop_id, filepath)
+
+    # Hidden entries are filtered only after the merge: a user file with
+    # Hidden=true must still shadow the system entry with the same id.
+    desktops = current_desktops()
+    applications = []
+    sent = 0
+
+    def collect(app_info):
+        nonlocal sent
+        if app_info and is_visible(app_info, desktops):
+            applications.append(app_info)
+            if on_batch and len(applications) - sent >= batch_size:
+                on_batch(applications[sent:])
+                sent = len(applications)
+
+    pending = []
+    for desktop_id, filepath in paths.items():
+        if index:
+            found, key, app_info = index.lookup(filepath)
+            if found:
+                collect(app_info)
+                continue
+            pending.append((desktop_id, filepath, key))
+        else:
+            pending.append((desktop_id, filepath, None))
+
+    if pending:
+        # Imported here: with a warm index there is nothing to parse, and
+        # the headless CLI should not pay for concurrent.futures.
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers or MAX_WORKERS) as pool:
+            parsed = pool.map(parse, [filepath for _, filepath, _ in pending])
+            for (desktop_id, filepath, key), app_info in zip(pending, parsed):
+                if app_info:
+                    app_info['id'] = desktop_id
+                if index and key:
+                    index.store(filepath, key, app_info)
+                collect(app_info)
+
+    if on_batch and len(applications) > sent:
+        on_batch(applications[sent:])
+
+    if index:
+        index.prune(set(paths.values()))
+        index.save()
+
+    return sorted(applications, key=lambda x: (x['name'].lower(), x['id']))
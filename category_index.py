@@ -0,0 +1,113 @@
+import locale
+from bisect import bisect_left
+from operator import itemgetter
+
+# Main categories of the freedesktop menu specification; an app may add any
+# of the additional ones (TextEditor, WebBrowser, ...) and is listed under all.
+MAIN_CATEGORIES = ("AudioVideo", "Audio", "Video", "Development", "Education", "Game", "Graphics",
+                   "Network", "Office", "Science", "Settings", "System", "Utility")
+# Additional categories that name the toolkit or desktop an app is built
+# for rather than what it does; they would only duplicate whole catalogs.
+ENVIRONMENT_CATEGORIES = frozenset(("GNOME", "KDE", "XFCE", "DDE", "GTK", "Qt", "Motif", "Java", "ConsoleOnly"))
+FALLBACK_CATEGORY = "Other"
+
+
+def collation_key(text):
+    """Chiave di ordinamento secondo LC_COLLATE (impostata da QApplication o da cli.py), senza distinzione di maiuscole."""
+    text = text.casefold()
+    try:
+        return locale.strxfrm(text)
+    except Exception:
+        return text
+
+
+def app_categories(app):
+    """Categorie freedesktop di app senza duplicati; "Other" se non ne ha."""
+    categories = [
+        cat for cat in dict.fromkeys(app.get('categories') or [app.get('category') or FALLBACK_CATEGORY])
+        if cat and not cat.startswith("X-") and cat not in ENVIRONMENT_CATEGORIES
+    ]
+    return tuple(categories) or (FALLBACK_CATEGORY,)
+
+
+class CategoryIndex:
+    """Indice invertito categoria -> app, con le viste già ordinate per nome.
+
+    Ogni app compare sotto tutte le sue categorie principali e aggiuntive.
+    La chiave di collazione di un'app si calcola una volta sola in add; le
+    viste restano ordinate inserendo e togliendo per bisezione, così
+    apps() restituisce la lista pronta senza ordinare nulla.
+    """
+
+    def __init__(self, applications=()):
+        self.keys = {}
+        self.members = {}
+        self.views = {}
+        # A whole catalog is sorted once per category instead of bisected in.
+        entries = {}
+        for app in applications:
+            key = self.register(app)
+            for category in self.members[app['id']]:
+                entries.setdefault(category, []).append((key, app))
+        for category, pairs in entries.items():
+            pairs.sort(key=itemgetter(0))
+            self.views[category] = ([key for key, _ in pairs], [app for _, app in pairs])
+
+    def register(self, app):
+        if app['id'] in self.keys:
+            self.remove(app)
+        key = (collation_key(app['name']), app['id'])
+        self.keys[app['id']] = key
+        self.members[app['id']] = app_categories(app)
+        return key
+
+    def add(self, app):
+        """Inserisce app nelle sue categorie; restituisce le categorie appena create."""
+        key = self.register(app)
+        categories = self.members[app['id']]
+        created = []
+        for category in categories:
+            view = self.views.get(category)
+            if view is None:
+                view = self.views[category] = ([], [])
+                created.append(category)
+            keys, apps = view
+            row = bisect_left(keys, key)
+            keys.insert(row, key)
+            apps.insert(row, app)
+        return created
+
+    def remove(self, app):
+        """Toglie app dall'indice; restituisce le categorie rimaste vuote."""
+        key = self.keys.pop(app['id'], None)
+        if key is None:
+            return []
+        emptied = []
+        for category in self.members.pop(app['id']):
+            keys, apps = self.views[category]
+            row = bisect_left(keys, key)
+            del keys[row]
+            del apps[row]
+            if not keys:
+                del self.views[category]
+                emptied.append(category)
+        return emptied
+
+    def categories(self):
+        return self.views.keys()
+
+    def categories_of(self, app):
+        return self.members.get(app['id'], ())
+
+    def apps(self, category):
+        """App di category in ordine di nome; la lista è quella dell'indice e non va modificata."""
+        view = self.views.get(category)
+        return view[1] if view else []
+
+    def count(self, category):
+        view = self.views.get(category)
+        return len(view[1]) if view else 0
+
+    def position(self, category, app):
+        """Riga di app nella vista di category."""
+        return bisect_left(self.views[category][0], self.keys[app['id']])
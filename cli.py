@@ -0,0 +1,112 @@
+import os
+import sys
+import json
+
+import catalog
+
+# Everything else is imported by the option that needs it: the interpreter
+# start-up is most of the latency of a headless query.
+
+# Flags handled here, without PyQt, by launcher.py.
+HEADLESS_FLAGS = ("--list", "--search", "--launch", "--categories")
+JSON_FIELDS = ("id", "name", "generic_name", "comment", "exec", "icon", "categories", "keywords", "terminal")
+
+USAGE = """usage: launcher.py --list [--json]
+       launcher.py --search TERM [--json]
+       launcher.py --launch ID
+       launcher.py --categories [--json]"""
+
+
+def wants_headless(args):
+    return any(flag in args for flag in HEADLESS_FLAGS)
+
+
+def option_value(args, flag):
+    i = args.index(flag)
+    if i + 1 < len(args) and not args[i + 1].startswith("--"):
+        return args[i + 1]
+    return None
+
+
+def load_applications(args):
+    index = catalog.DesktopIndex()
+    if "--rebuild-index" in args:
+        index.invalidate()
+    return catalog.find_applications(index=index)
+
+
+def print_apps(apps, as_json):
+    if as_json:
+        json.dump([{field: app.get(field) for field in JSON_FIELDS} for app in apps], sys.stdout, ensure_ascii=False)
+        sys.stdout.write("\n")
+    else:
+        # One "id<TAB>name" line per app, ready for dmenu, rofi or cut -f.
+        sys.stdout.writelines(f"{app['id']}\t{app['name']}\n" for app in apps)
+
+
+def print_categories(apps, as_json):
+    import locale
+    import category_index
+    import settings_store
+    # QApplication does this in the GUI; without it strxfrm sorts by code point.
+    try:
+        locale.setlocale(locale.LC_COLLATE, "")
+    except locale.Error:
+        pass
+    index = category_index.CategoryIndex(apps)
+    counts = {cat: index.count(cat) for cat in index.categories()}
+    # Same order as the home page: the user's saved order, then alphabetical.
+    order = settings_store.SettingsStore().get("category_order", [])
+    ranked = sorted(counts, key=lambda cat: (0, order.index(cat), "") if cat in order
+                    else (1, 0, category_index.collation_key(cat)))
+    if as_json:
+        json.dump([{"name": cat, "count": counts[cat]} for cat in ranked], sys.stdout, ensure_ascii=False)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.writelines(f"{cat}\t{counts[cat]}\n" for cat in ranked)
+
+
+def launch(apps, app_id):
+    import launch_engine
+    import launch_history
+    apps_by_id = {app['id']: app for app in apps}
+    app = apps_by_id.get(app_id) or apps_by_id.get(app_id + ".desktop")
+    if app is None:
+        print(f"Unknown application id: {app_id}", file=sys.stderr)
+        return 1
+    try:
+        # The child runs in its own session: once this process exits it is
+        # reparented and reaped by init, so no reaper thread is needed.
+        launch_engine.spawn(launch_engine.build_argv(app), app.get('workdir') or None)
+    except Exception as e:
+        print(f"Failed to launch {app['name']}: {e}", file=sys.stderr)
+        return 1
+    launch_history.LaunchHistory().record(app['id'])
+    return 0
+
+
+def main(args):
+    """Esegue le opzioni senza interfaccia grafica e restituisce il codice di uscita."""
+    as_json = "--json" in args
+    for flag in ("--search", "--launch"):
+        if flag in args and option_value(args, flag) is None:
+            print(USAGE, file=sys.stderr)
+            return 2
+    apps = load_applications(args)
+    try:
+        if "--launch" in args:
+            return launch(apps, option_value(args, "--launch"))
+        if "--search" in args:
+            import launch_history
+            import search_index
+            history = launch_history.LaunchHistory()
+            print_apps(search_index.SearchIndex(apps, history.scores).search(option_value(args, "--search")), as_json)
+        elif "--categories" in args:
+            print_categories(apps, as_json)
+        else:
+            print_apps(apps, as_json)
+    except BrokenPipeError:
+        # The reader (head, dmenu) went away early; keep the interpreter
+        # from failing again while flushing stdout at exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return 0
@@ -0,0 +1,161 @@
+import os
+import time
+import shutil
+import select
+import threading
+import subprocess
+
+import catalog
+
+# Terminal emulators tried for Terminal=true entries, with the option that
+# introduces the command to run.
+TERMINALS = [
+    ("x-terminal-emulator", ["-e"]),
+    ("gnome-terminal", ["--"]),
+    ("konsole", ["-e"]),
+    ("xfce4-terminal", ["-x"]),
+    ("alacritty", ["-e"]),
+    ("kitty", []),
+    ("foot", []),
+    ("xterm", ["-e"]),
+]
+
+
+def terminal_command():
+    """Prefisso dell'argv per aprire un comando in un terminale ($TERMINAL o il primo emulatore trovato)."""
+    terminal = os.environ.get("TERMINAL")
+    if terminal and shutil.which(terminal):
+        return [shutil.which(terminal), "-e"]
+    for name, option in TERMINALS:
+        path = shutil.which(name)
+        if path:
+            return [path] + option
+    return None
+
+
+def build_argv(app, files=()):
+    argv = catalog.expand_field_codes(app, files)
+    if not argv:
+        raise ValueError(f"Empty Exec line in {app.get('file') or app['name']}")
+    if app.get('terminal'):
+        prefix = terminal_command()
+        if prefix is None:
+            raise FileNotFoundError(f"No terminal emulator found to run {app['name']}")
+        argv = prefix + argv
+    return argv
+
+
+def exit_code(status):
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def spawn(argv, cwd=None):
+    """Avvia argv in una nuova sessione senza attenderne la fine; restituisce (pid, Popen o None).
+
+    Con posix_spawnp (Python 3.8+) il costo non cresce con la memoria del
+    launcher; serve subprocess solo per la cartella di lavoro (Path=).
+    Un eseguibile mancante solleva subito OSError in entrambi i casi.
+    """
+    if cwd is None and hasattr(os, "posix_spawnp"):
+        return os.posix_spawnp(argv[0], argv, os.environ, setsid=True), None
+    proc = subprocess.Popen(argv, cwd=cwd, start_new_session=True)
+    return proc.pid, proc
+
+
+class ChildReaper:
+    """Raccoglie lo stato dei figli terminati, così non restano zombie.
+
+    Con os.pidfd_open (Linux 5.3+, Python 3.9+) un solo thread attende
+    tutti i figli con poll sui loro pidfd; altrimenti ogni figlio ha un
+    thread bloccato in waitpid. on_exit(pid, code, data) viene chiamato
+    dal thread del reaper.
+    """
+
+    def __init__(self, on_exit=None):
+        self.on_exit = on_exit
+        self.lock = threading.Lock()
+        self.children = {}
+        self.pending = []
+        self.thread = None
+        self.wake_r = None
+        self.wake_w = None
+
+    def watch(self, pid, data=None):
+        try:
+            fd = os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            threading.Thread(target=self.reap, args=(pid, data), name="child-wait", daemon=True).start()
+            return
+        with self.lock:
+            self.children[fd] = (pid, data)
+            self.pending.append(fd)
+            if self.thread is None:
+                self.wake_r, self.wake_w = os.pipe()
+                self.thread = threading.Thread(target=self.run, name="child-reaper", daemon=True)
+                self.thread.start()
+        os.write(self.wake_w, b"x")
+
+    def run(self):
+        poller = select.poll()
+        poller.register(self.wake_r, select.POLLIN)
+        while True:
+            for fd, _ in poller.poll():
+                if fd == self.wake_r:
+                    os.read(self.wake_r, 512)
+                    with self.lock:
+                        pending, self.pending = self.pending, []
+                    for new_fd in pending:
+                        poller.register(new_fd, select.POLLIN)
+                    continue
+                with self.lock:
+                    pid, data = self.children.pop(fd)
+                poller.unregister(fd)
+                os.close(fd)
+                self.reap(pid, data)
+
+    def reap(self, pid, data):
+        try:
+            _, status = os.waitpid(pid, 0)
+            code = exit_code(status)
+        except ChildProcessError:
+            code = None  # already collected elsewhere
+        if self.on_exit:
+            try:
+                self.on_exit(pid, code, data)
+            except Exception as e:
+                print(f"Error reporting child exit: {e}")
+
+
+class LaunchEngine:
+    """Avvia le app staccate dal launcher e ne raccoglie l'uscita.
+
+    launch() espande Exec, avvia il processo in una nuova sessione e
+    restituisce il pid; gli errori di exec vengono sollevati subito.
+    on_exit(app, code, seconds) riceve il codice di uscita di ogni app e
+    il tempo trascorso dall'avvio, dal thread del reaper.
+    """
+
+    def __init__(self, on_exit=None):
+        self.on_exit = on_exit
+        self.reaper = ChildReaper(self.child_exited)
+
+    def launch(self, app, files=()):
+        argv = build_argv(app, files)
+        pid, proc = spawn(argv, app.get('workdir') or None)
+        self.reaper.watch(pid, (app, time.monotonic(), proc))
+        return pid
+
+    def run_command(self, argv):
+        """Avvia un comando interno (calcolatrice, systemctl) con la stessa raccolta dei figli."""
+        pid, proc = spawn([str(arg) for arg in argv])
+        self.reaper.watch(pid, (None, time.monotonic(), proc))
+        return pid
+
+    def child_exited(self, pid, code, data):
+        app, started, proc = data
+        if proc is not None:
+            proc.returncode = code  # reaped here, keeps Popen from waiting again
+        if self.on_exit and app is not None:
+            self.on_exit(app, code, time.monotonic() - started)
@@ -0,0 +1,160 @@
+import os
+import math
+import time
+import fcntl
+import pathlib
+
+HALF_LIFE_DAYS = 14
+DECAY = math.log(2) / (HALF_LIFE_DAYS * 86400)
+# The log is rewritten as one snapshot line per app once it holds this many
+# launch lines, so loading stays proportional to the number of apps.
+COMPACT_AFTER = 2000
+
+
+def default_history_path():
+    return pathlib.Path.home() / ".config" / "pylauncher_settings" / "launch_history.log"
+
+
+def logaddexp(a, b):
+    if a == -math.inf:
+        return b
+    if b == -math.inf:
+        return a
+    hi, lo = (a, b) if a > b else (b, a)
+    return hi + math.log1p(math.exp(lo - hi))
+
+
+class LaunchHistory:
+    """Storico degli avvii con punteggio frecency a decadimento esponenziale.
+
+    Il punteggio di un'app è la somma di exp(-DECAY * età) su tutti i suoi
+    avvii. Viene tenuto come log(sum(exp(DECAY * t))), che non dipende
+    dall'istante corrente: aggiornarlo costa O(1) e confrontare due app
+    non richiede calcoli. Su disco è un log in sola aggiunta, compattato
+    periodicamente in righe di riepilogo.
+
+    Più processi possono scrivere lo stesso log (il launcher residente,
+    launcher.py --launch): aggiunte e compattazione avvengono sotto un
+    lock esclusivo (launch_history.log.lock), dopo aver letto le righe
+    aggiunte dagli altri dall'ultima lettura.
+    """
+
+    def __init__(self, path=None):
+        self.path = pathlib.Path(path) if path else default_history_path()
+        self.scores = {}
+        self.counts = {}
+        self.last_used = {}
+        self.reset()
+        self.load()
+        if self.log_lines > COMPACT_AFTER:
+            self.compact()
+
+    def reset(self):
+        # Cleared in place: SearchIndex keeps a reference to scores.
+        self.scores.clear()
+        self.counts.clear()
+        self.last_used.clear()
+        self.log_lines = 0
+        # Identity of the file read so far and how many bytes of it.
+        self.file_id = None
+        self.offset = 0
+
+    def apply(self, app_id, timestamp):
+        self.scores[app_id] = logaddexp(self.scores.get(app_id, -math.inf), DECAY * timestamp)
+        self.counts[app_id] = self.counts.get(app_id, 0) + 1
+        self.last_used[app_id] = max(self.last_used.get(app_id, 0), timestamp)
+
+    def parse(self, text):
+        for line in text.splitlines():
+            fields = line.split("\t")
+            try:
+                if fields[0] == "L" and len(fields) == 3:
+                    self.apply(fields[2], float(fields[1]))
+                    self.log_lines += 1
+                elif fields[0] == "S" and len(fields) == 5:
+                    app_id = fields[1]
+                    self.scores[app_id] = logaddexp(self.scores.get(app_id, -math.inf), float(fields[2]))
+                    self.counts[app_id] = self.counts.get(app_id, 0) + int(fields[3])
+                    self.last_used[app_id] = max(self.last_used.get(app_id, 0), float(fields[4]))
+            except ValueError:
+                continue  # a torn line from a crash mid-append
+
+    def load(self):
+        """Applica le righe aggiunte al log dall'ultima lettura, anche da altri processi."""
+        try:
+            with open(self.path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                file_id = (stat.st_dev, stat.st_ino)
+                if file_id != self.file_id or stat.st_size < self.offset:
+                    # Compacted by another process: its snapshot already holds everything.
+                    self.reset()
+                    self.file_id = file_id
+                f.seek(self.offset)
+                data = f.read()
+        except FileNotFoundError:
+            self.reset()
+            return
+        except Exception as e:
+            print(f"Error loading launch history: {e}")
+            return
+        # Only whole lines: the rest is a torn append, skipped with the next ones.
+        end = data.rfind(b"\n") + 1
+        self.parse(data[:end].decode('utf-8', 'replace'))
+        self.offset += end
+
+    def lock(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock = open(self.path.with_name(self.path.name + ".lock"), 'a')
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock
+
+    def record(self, app_id, timestamp=None):
+        timestamp = time.time() if timestamp is None else timestamp
+        try:
+            with self.lock():
+                self.load()
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(f"L\t{timestamp:.3f}\t{app_id}\n")
+                # Reads back the other processes' lines and this one, applying it.
+                self.load()
+        except Exception as e:
+            print(f"Error saving launch history: {e}")
+            self.apply(app_id, timestamp)
+        if self.log_lines > COMPACT_AFTER:
+            self.compact()
+
+    def compact(self):
+        try:
+            with self.lock():
+                self.load()
+                if self.log_lines <= COMPACT_AFTER:
+                    return  # another process has just compacted it
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    for app_id, score in self.scores.items():
+                        f.write(f"S\t{app_id}\t{score!r}\t{self.counts[app_id]}\t{self.last_used[app_id]:.3f}\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+                stat = os.stat(self.path)
+                self.file_id = (stat.st_dev, stat.st_ino)
+                self.offset = stat.st_size
+                self.log_lines = 0
+        except Exception as e:
+            print(f"Error compacting launch history: {e}")
+
+    def rank_key(self, app_id):
+        """Chiave di ordinamento: più alta per le app usate spesso e di recente."""
+        return self.scores.get(app_id, -math.inf)
+
+    def score(self, app_id, now=None):
+        """Punteggio frecency attuale (numero di avvii pesati per età)."""
+        key = self.scores.get(app_id)
+        if key is None:
+            return 0.0
+        now = time.time() if now is None else now
+        return math.exp(key - DECAY * now)
+
+    def top(self, count, exclude=()):
+        ranked = sorted((app_id for app_id in self.scores if app_id not in exclude), key=self.rank_key, reverse=True)
+        return ranked[:count]
@@ -0,0 +1,1243 @@
+import os
+import sys
+import pathlib
+from collections import OrderedDict
+from functools import partial
+
+from resident import resident_command, resident_socket_path
+from startup_trace import trace, profile_path
+
+with trace.span("import_pyqt"):
+    from PyQt5 import QtWidgets, QtGui, QtCore, QtNetwork
+
+with trace.span("import_modules"):
+    import catalog
+    import category_index
+    import launch_engine
+    import launch_history
+    import prefetch
+    import search_index
+    import settings_store
+    import themes
+
+ICON_DIR = "/usr/share/icons/Ars-Dark-Icons/apps/48"
+SPECIAL_ICON_DIR = "/usr/share/icons/Sours-Full-Color/apps/scalable"
+SEARCH_DEBOUNCE_MS = 120
+SETTINGS_SAVE_DELAY_MS = 500
+# An app that exits with an error within this many seconds is reported as a failed launch.
+LAUNCH_FAILURE_WINDOW_S = 2.0
+# Fill the favorites bar with up to this many of the most used apps (0 = off).
+AUTO_PREFERRED_APPS = 0
+# Read ahead the binaries and libraries of this many of the most used apps when the
+# window opens (0 = off); "prefetch_apps" in settings.json overrides it.
+PREFETCH_APPS = 0
+
+ICON_EXTENSIONS = ['png', 'svg', 'xpm']
+
+
+class IconCache:
+    """Risoluzione delle icone con memoizzazione.
+
+    La cartella viene indicizzata una sola volta in una mappa nome -> percorso;
+    le QIcon e le QPixmap risolte restano in una LRU limitata, indicizzata
+    per (nome, dimensione), così le ricerche ripetute non toccano il disco.
+    """
+
+    def __init__(self, icon_dir, max_entries=1024, use_theme=True):
+        self.icon_dir = icon_dir
+        self.max_entries = max_entries
+        self.use_theme = use_theme
+        self.paths = None
+        self.resolved = {}
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def index_dir(self):
+        self.paths = {}
+        try:
+            with os.scandir(self.icon_dir) as it:
+                files = [entry.name for entry in it if entry.is_file()]
+        except OSError:
+            files = []
+        # Same preference order as the old per-extension isfile probes.
+        for ext in reversed(ICON_EXTENSIONS):
+            suffix = "." + ext
+            for filename in files:
+                if filename.endswith(suffix):
+                    self.paths[filename[:-len(suffix)]] = os.path.join(self.icon_dir, filename)
+
+    def resolve_path(self, icon_name):
+        """Percorso del file dell'icona, o None se va cercata nel tema."""
+        if icon_name in self.resolved:
+            return self.resolved[icon_name]
+        if self.paths is None:
+            self.index_dir()
+        path = self.paths.get(icon_name)
+        if path is None and os.path.isabs(icon_name) and os.path.isfile(icon_name):
+            path = icon_name
+        self.resolved[icon_name] = path
+        return path
+
+    def lookup(self, key, create):
+        value = self.entries.get(key)
+        if value is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return value
+        self.misses += 1
+        value = create()
+        self.entries[key] = value
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def create_icon(self, icon_name):
+        path = self.resolve_path(icon_name)
+        if path:
+            return QtGui.QIcon(path)
+        if self.use_theme:
+            icon = QtGui.QIcon.fromTheme(icon_name)
+            if not icon.isNull():
+                return icon
+        return QtGui.QIcon()
+
+    def icon(self, icon_name):
+        if not icon_name:
+            return QtGui.QIcon()
+        return self.lookup((icon_name, None), partial(self.create_icon, icon_name))
+
+    def pixmap(self, icon_name, size):
+        if not icon_name:
+            return QtGui.QPixmap()
+        return self.lookup((icon_name, size), lambda: self.icon(icon_name).pixmap(size, size))
+
+    def clear(self):
+        self.paths = None
+        self.resolved.clear()
+        self.entries.clear()
+
+
+special_icons = IconCache(SPECIAL_ICON_DIR, max_entries=32, use_theme=False)
+
+
+class IconDecodeTask(QtCore.QRunnable):
+    """Decodifica e scala un file di icona in una QImage fuori dal thread della GUI."""
+
+    def __init__(self, key, path, signal):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.key = key
+        self.path = path
+        self.signal = signal
+        self.cancelled = False
+
+    def run(self):
+        if self.cancelled:
+            return
+        size = self.key[1]
+        reader = QtGui.QImageReader(self.path)
+        source_size = reader.size()
+        if source_size.isValid():
+            reader.setScaledSize(source_size.scaled(size, size, QtCore.Qt.KeepAspectRatio))
+        image = reader.read()
+        if not self.cancelled:
+            self.signal.emit(self.key, image)
+
+
+class AsyncIconLoader(QtCore.QObject):
+    """Carica le icone delle righe in background.
+
+    request() restituisce subito la pixmap in cache o un segnaposto e avvia
+    la decodifica; set_visible_keys() annulla quelle delle righe uscite dalla
+    vista. icon_ready viene emesso quando la pixmap è pronta in cache.
+    """
+
+    decoded = QtCore.pyqtSignal(object, object)
+    icon_ready = QtCore.pyqtSignal(object)
+
+    def __init__(self, cache, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, min(4, QtCore.QThread.idealThreadCount())))
+        self.waiting = set()
+        self.tasks = {}
+        self.placeholders = {}
+        self.decoded.connect(self.on_decoded)
+
+    def placeholder(self, size):
+        if size not in self.placeholders:
+            self.placeholders[size] = QtGui.QIcon.fromTheme("application-x-executable").pixmap(size, size)
+        return self.placeholders[size]
+
+    def request(self, icon_name, size):
+        key = (icon_name, size)
+        pixmap = self.cache.entries.get(key)
+        if pixmap is not None or not icon_name:
+            return self.cache.pixmap(icon_name, size)
+        if not self.cache.resolve_path(icon_name):
+            # Theme icons have no file we can hand to a worker: QIcon is not
+            # safe to use off the GUI thread, so resolve them synchronously.
+            return self.cache.pixmap(icon_name, size)
+        # Views only ask for the rows they paint, so the request itself
+        # marks the icon as visible and starts decoding it.
+        self.waiting.add(key)
+        self.start(key)
+        return self.placeholder(size)
+
+    def start(self, key):
+        if key not in self.tasks:
+            task = IconDecodeTask(key, self.cache.resolve_path(key[0]), self.decoded)
+            self.tasks[key] = task
+            self.pool.start(task)
+
+    def set_visible_keys(self, keys):
+        for key in [k for k in self.tasks if k not in keys]:
+            task = self.tasks.pop(key)
+            task.cancelled = True
+            self.pool.tryTake(task)
+        for key in keys:
+            if key in self.waiting:
+                self.start(key)
+
+    def cancel_all(self):
+        self.set_visible_keys(())
+        self.waiting.clear()
+
+    def on_decoded(self, key, image):
+        self.tasks.pop(key, None)
+        if key not in self.waiting:
+            return
+        self.waiting.discard(key)
+        if image.isNull():
+            return
+        self.cache.lookup(key, lambda: QtGui.QPixmap.fromImage(image))
+        self.icon_ready.emit(key)
+
+
+class AppListModel(QtCore.QAbstractListModel):
+    """Modello della lista app: la vista chiede i dati solo per le righe visibili."""
+
+    FavoriteRole = QtCore.Qt.UserRole + 1
+    ICON_SIZE = 48
+
+    def __init__(self, icon_loader, is_favorite, parent=None):
+        super().__init__(parent)
+        self.icon_loader = icon_loader
+        self.is_favorite = is_favorite
+        self.apps = []
+        self.icon_loader.icon_ready.connect(self.on_icon_ready)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.apps)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        app = self.apps[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return app['name']
+        if role == QtCore.Qt.DecorationRole:
+            return self.icon_loader.request(app['icon'], self.ICON_SIZE)
+        if role == QtCore.Qt.UserRole:
+            return app
+        if role == self.FavoriteRole:
+            return self.is_favorite(app)
+        if role == QtCore.Qt.ToolTipRole:
+            return app.get('comment') or None
+        return None
+
+    def set_apps(self, apps):
+        self.beginResetModel()
+        self.apps = list(apps)
+        self.endResetModel()
+
+    def insert_app(self, app, row=None):
+        # Without a row, keep the alphabetical order of streamed search results.
+        if row is None:
+            key = app['name'].lower()
+            row = 0
+            while row < len(self.apps) and self.apps[row]['name'].lower() <= key:
+                row += 1
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.apps.insert(row, app)
+        self.endInsertRows()
+
+    def remove_app(self, app):
+        for row, other in enumerate(self.apps):
+            if other['id'] == app['id']:
+                self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+                del self.apps[row]
+                self.endRemoveRows()
+                return
+
+    def refresh_favorite(self, index):
+        self.dataChanged.emit(index, index, [self.FavoriteRole])
+
+    def on_icon_ready(self, key):
+        icon_name, size = key
+        for row, app in enumerate(self.apps):
+            if app['icon'] == icon_name:
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [QtCore.Qt.DecorationRole])
+
+
+class AppItemDelegate(QtWidgets.QStyledItemDelegate):
+    """Disegna icona, nome e pulsante +/- dei preferiti senza creare widget per riga."""
+
+    favorite_toggled = QtCore.pyqtSignal(object)
+
+    ROW_HEIGHT = 52
+    MARGIN = 5
+    TOGGLE_SIZE = 24
+
+    def toggle_rect(self, rect):
+        return QtCore.QRect(
+            rect.right() - self.MARGIN - self.TOGGLE_SIZE,
+            rect.center().y() - self.TOGGLE_SIZE // 2,
+            self.TOGGLE_SIZE, self.TOGGLE_SIZE
+        )
+
+    def sizeHint(self, option, index):
+        return QtCore.QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        rect = option.rect
+        if option.state & QtWidgets.QStyle.State_Selected:
+            painter.fillRect(rect, option.palette.color(QtGui.QPalette.Highlight))
+            painter.setPen(option.palette.color(QtGui.QPalette.HighlightedText))
+        else:
+            painter.setPen(option.palette.color(QtGui.QPalette.Text))
+
+        size = AppListModel.ICON_SIZE
+        pixmap = index.data(QtCore.Qt.DecorationRole)
+        icon_rect = QtCore.QRect(rect.left() + self.MARGIN, rect.top() + (rect.height() - size) // 2, size, size)
+        if pixmap and not pixmap.isNull():
+            painter.drawPixmap(icon_rect, pixmap)
+
+        toggle_rect = self.toggle_rect(rect)
+        text_rect = QtCore.QRect(icon_rect.right() + 2 * self.MARGIN, rect.top(),
+                                 toggle_rect.left() - icon_rect.right() - 3 * self.MARGIN, rect.height())
+        name = option.fontMetrics.elidedText(index.data(QtCore.Qt.DisplayRole), QtCore.Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect, QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft, name)
+        painter.drawText(toggle_rect, QtCore.Qt.AlignCenter, "-" if index.data(AppListModel.FavoriteRole) else "+")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QtCore.QEvent.MouseButtonRelease and self.toggle_rect(option.rect).contains(event.pos()):
+            self.favorite_toggled.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class ThemeEngine:
+    """Una QPalette precalcolata per ogni tema: cambiare tema è un solo setPalette.
+
+    A differenza di setStyleSheet non ricalcola lo stile di ogni widget, e
+    la lista app (selezione compresa) è disegnata dal delegate con i colori
+    della palette, quindi il costo non dipende dal numero di righe.
+    """
+
+    def __init__(self, theme_dir):
+        self.themes = themes.load_themes(theme_dir)
+        base = QtWidgets.QApplication.palette()
+        self.palettes = {name: self.build_palette(base, theme["colors"]) for name, theme in self.themes.items()}
+
+    def build_palette(self, base, colors):
+        palette = QtGui.QPalette(base)
+        for role, value in colors.items():
+            role_id = getattr(QtGui.QPalette, role, None)  # PlaceholderText needs Qt 5.12
+            color = QtGui.QColor(value)
+            if role_id is not None and color.isValid():
+                palette.setColor(role_id, color)
+        return palette
+
+    def names(self):
+        return list(self.themes)
+
+    def is_dark(self, name):
+        return self.themes[name]["dark"]
+
+    def apply(self, name):
+        QtWidgets.QApplication.setPalette(self.palettes[name])
+
+
+def load_special_icon(icon_name):
+    """Carica un'icona speciale da SPECIAL_ICON_DIR con estensioni comuni."""
+    return special_icons.icon(icon_name)
+
+def create_special_icon_label(icon_name, tooltip, callback):
+    """Crea un QLabel cliccabile con icona speciale."""
+    label = QtWidgets.QLabel()
+    icon = load_special_icon(icon_name)
+    label.setPixmap(icon.pixmap(20, 20))
+    label.setToolTip(tooltip)
+    label.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+    label.mousePressEvent = lambda event: callback()
+    return label
+
+class CatalogScanTask(QtCore.QRunnable):
+    """Esegue la scansione del catalogo fuori dal thread della GUI.
+
+    Con stream=True le voci vengono emesse a gruppi con batch man mano che
+    sono pronte; finished porta sempre il catalogo completo e ordinato.
+    """
+
+    class Signals(QtCore.QObject):
+        batch = QtCore.pyqtSignal(object)
+        finished = QtCore.pyqtSignal(object)
+
+    def __init__(self, index, parse, stream=False):
+        super().__init__()
+        self.index = index
+        self.parse = parse
+        self.stream = stream
+        self.signals = CatalogScanTask.Signals()
+
+    def run(self):
+        try:
+            with trace.span("scan_catalog"):
+                applications = catalog.find_applications(
+                    index=self.index, parse=self.parse,
+                    on_batch=self.signals.batch.emit if self.stream else None)
+        except Exception as e:
+            print(f"Error rescanning applications: {e}")
+            applications = None
+        self.signals.finished.emit(applications)
+
+
+class LaunchSignals(QtCore.QObject):
+    started = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(object, str)
+    exited = QtCore.pyqtSignal(object, object, float)
+
+
+class LaunchTask(QtCore.QRunnable):
+    """Avvia un'app fuori dal thread della GUI: fork ed exec di un binario non in cache possono richiedere decine di ms."""
+
+    def __init__(self, engine, app, signals):
+        super().__init__()
+        self.engine = engine
+        self.app = app
+        self.signals = signals
+
+    def run(self):
+        try:
+            self.engine.launch(self.app)
+        except Exception as e:
+            self.signals.failed.emit(self.app, str(e))
+            return
+        self.signals.started.emit(self.app)
+
+
+class CatalogWatcher(QtCore.QObject):
+    """Osserva le cartelle delle applicazioni e i loro file .desktop e segnala il nuovo catalogo.
+
+    Le cartelle segnalano solo file creati, rimossi o rinominati; un file
+    modificato sul posto lo segnala solo il watch sul file stesso. Gli eventi vengono raccolti per COALESCE_MS dal primo della serie, così
+    un aggiornamento di sistema che tocca centinaia di file produce una sola
+    scansione (incrementale grazie all'indice) in un thread separato.
+    """
+
+    COALESCE_MS = 500
+
+    catalog_changed = QtCore.pyqtSignal(object)
+
+    def __init__(self, index, parse, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.parse = parse
+        self.scanning = False
+        self.rescan_pending = False
+        self.watcher = QtCore.QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.schedule_rescan)
+        self.watcher.fileChanged.connect(self.schedule_rescan)
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(self.COALESCE_MS)
+        self.timer.timeout.connect(self.rescan)
+        self.update_watched_paths()
+
+    def update_watched_paths(self):
+        watched = set(self.watcher.directories())
+        dirs = [d for d in list(catalog.application_dirs()) + list(self.index.dirs) if d not in watched and os.path.isdir(d)]
+        if dirs:
+            self.watcher.addPaths(dirs)
+        # A file replaced by rename drops out of the watcher: it is added back after the rescan.
+        watched = set(self.watcher.files())
+        files = [path for path in self.index.files if path not in watched and os.path.isfile(path)]
+        if files:
+            self.watcher.addPaths(files)
+
+    def schedule_rescan(self, path=None):
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def rescan(self):
+        if self.scanning:
+            self.rescan_pending = True
+            return
+        self.scanning = True
+        task = CatalogScanTask(self.index, self.parse)
+        task.signals.finished.connect(self.scan_finished)
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def scan_finished(self, applications):
+        self.scanning = False
+        if applications is not None:
+            self.update_watched_paths()
+            self.catalog_changed.emit(applications)
+        if self.rescan_pending:
+            self.rescan_pending = False
+            self.schedule_rescan()
+
+
+class AppLauncher(QtWidgets.QMainWindow):
+    def __init__(self, resident=False):
+        super().__init__()
+        self.resident = resident
+        self.resident_server = None
+        self.setWindowTitle("Python Application Launcher")
+        self.resize(800, 600)
+
+        self.icon_cache = IconCache(ICON_DIR)
+        self.icon_loader = AsyncIconLoader(self.icon_cache, self)
+        # The catalog starts empty and is streamed in by start_catalog_scan
+        # once the window exists.
+        self.applications = []
+        self.category_index = category_index.CategoryIndex()
+        self.catalog_ready = False
+        self.catalog_watcher = None
+        self.profile_written = False
+        with trace.span("open_desktop_index"):
+            self.desktop_index = self.open_desktop_index()
+        with trace.span("load_launch_history"):
+            self.launch_history = launch_history.LaunchHistory()
+        self.launch_signals = LaunchSignals(self)
+        self.launch_signals.started.connect(self.launch_started)
+        self.launch_signals.failed.connect(self.launch_failed)
+        self.launch_signals.exited.connect(self.launch_exited)
+        self.launch_engine = launch_engine.LaunchEngine(self.launch_signals.exited.emit)
+        self.prefetcher = prefetch.Prefetcher()
+        self.search_index = search_index.SearchIndex((), self.launch_history.scores)
+
+        # Favorites are desktop-file ids in the user's order; preferred_apps
+        # maps those found in the catalog to their entries.
+        self.favorite_ids = {}
+        self.preferred_apps = {}
+        self.preferred_items = {}
+        self.suggested_ids = []
+        self.preferred_show_names = None
+        self.config_dir = pathlib.Path.home() / ".config" / "pylauncher_settings"
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        with trace.span("load_settings"):
+            self.settings = settings_store.SettingsStore(self.config_dir / "settings.json")
+        # Changes are written together once they stop coming (a category
+        # drag fires rowsMoved many times).
+        self.settings_timer = QtCore.QTimer(self)
+        self.settings_timer.setSingleShot(True)
+        self.settings_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self.settings_timer.timeout.connect(self.flush_settings)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.flush_settings)
+
+        with trace.span("load_theme_config"):
+            self.load_theme_config()
+
+        # The search bar lives below the pages so results can replace the
+        # home page while the user keeps typing.
+        self.central_widget = QtWidgets.QWidget()
+        self.central_layout = QtWidgets.QVBoxLayout(self.central_widget)
+        self.central_layout.setContentsMargins(0, 0, 0, 0)
+        self.stacked_widget = QtWidgets.QStackedWidget()
+        self.central_layout.addWidget(self.stacked_widget)
+        self.setCentralWidget(self.central_widget)
+
+        # Pagina categorie
+        self.category_page = QtWidgets.QWidget()
+        self.category_layout = QtWidgets.QVBoxLayout(self.category_page)
+
+        # Barra icone di sistema
+        self.system_icons_layout = QtWidgets.QHBoxLayout()
+        self.system_icons_layout.setSpacing(20)
+        self.system_icons_layout.setAlignment(QtCore.Qt.AlignCenter)
+
+        with trace.span("load_special_icons"):
+            self.system_icons_layout.addWidget(
+                create_special_icon_label('system-shutdown', 'Shutdown', lambda: self.launch_engine.run_command(['systemctl', 'poweroff']))
+            )
+            self.system_icons_layout.addWidget(
+                create_special_icon_label('system-reboot', 'Reboot', lambda: self.launch_engine.run_command(['systemctl', 'reboot']))
+            )
+            self.system_icons_layout.addWidget(
+                create_special_icon_label('system-suspend', 'Suspend', lambda: self.launch_engine.run_command(['systemctl', 'suspend']))
+            )
+
+        self.top_layout = QtWidgets.QHBoxLayout()
+        self.top_layout.setSpacing(10)
+        self.top_layout.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
+        self.top_layout.addLayout(self.system_icons_layout)
+        self.top_layout.addStretch(1)
+
+        self.category_title = QtWidgets.QLabel("Home")
+        font = self.category_title.font()
+        font.setPointSize(16)
+        font.setBold(True)
+        self.category_title.setFont(font)
+        self.category_title.setAlignment(QtCore.Qt.AlignCenter)
+        self.top_layout.addWidget(self.category_title)
+        self.top_layout.addStretch(1)
+
+        self.category_layout.addLayout(self.top_layout)
+
+        self.preferred_apps_widget = QtWidgets.QListWidget()
+        self.preferred_apps_widget.setIconSize(QtCore.QSize(32, 32))
+        self.preferred_apps_widget.setFixedHeight(60)
+        self.preferred_apps_widget.setFlow(QtWidgets.QListView.LeftToRight)
+        self.preferred_apps_widget.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.preferred_apps_widget.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.preferred_apps_widget.setSpacing(5)
+        self.preferred_apps_widget.itemClicked.connect(self.launch_selected)
+        self.category_layout.addWidget(self.preferred_apps_widget)
+
+        self.category_list_widget = QtWidgets.QListWidget()
+        self.category_list_widget.setIconSize(QtCore.QSize(48, 48))
+        self.category_list_widget.setDragDropMode(QtWidgets.QAbstractItemView.InternalMove)
+        self.category_list_widget.setDefaultDropAction(QtCore.Qt.MoveAction)
+        self.category_list_widget.setDragEnabled(True)
+        self.category_list_widget.setAcceptDrops(True)
+        self.category_list_widget.setDropIndicatorShown(True)
+        self.category_list_widget.itemClicked.connect(self.show_category_apps)
+        self.category_list_widget.model().rowsMoved.connect(self.save_category_order)
+        self.category_layout.addWidget(self.category_list_widget)
+
+        search_layout = QtWidgets.QHBoxLayout()
+        search_layout.setContentsMargins(9, 0, 9, 9)
+        self.search_box = QtWidgets.QLineEdit()
+        self.search_box.setPlaceholderText("Search apps...")
+        self.search_box.setMinimumWidth(200)
+        self.search_box.returnPressed.connect(self.search_apps)
+        self.search_box.textChanged.connect(self.schedule_search)
+        search_layout.addWidget(self.search_box)
+
+        self.search_timer = QtCore.QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.search_apps)
+
+        self.send_button = QtWidgets.QPushButton("Search")
+        self.send_button.setFixedWidth(60)
+        self.send_button.clicked.connect(self.search_apps)
+        search_layout.addWidget(self.send_button)
+
+        self.central_layout.addLayout(search_layout)
+
+        self.stacked_widget.addWidget(self.category_page)
+
+        with trace.span("load_preferred_apps"):
+            self.load_preferred_apps()
+        self.show_categories()
+
+        self.app_list_filter = (None, None)
+        self.app_list_model = AppListModel(self.icon_loader, self.is_favorite, self)
+        self.app_list_delegate = AppItemDelegate(self)
+        self.app_list_delegate.favorite_toggled.connect(self.favorite_toggled)
+        self.app_list_widget = QtWidgets.QListView()
+        self.app_list_widget.setModel(self.app_list_model)
+        self.app_list_widget.setItemDelegate(self.app_list_delegate)
+        self.app_list_widget.setUniformItemSizes(True)
+        self.app_list_widget.setIconSize(QtCore.QSize(48, 48))
+        self.app_list_widget.doubleClicked.connect(self.launch_selected)
+        self.app_list_widget.verticalScrollBar().valueChanged.connect(self.update_visible_icons)
+
+        self.back_button = QtWidgets.QPushButton("Back to Home")
+        self.back_button.setFixedWidth(150)
+        self.back_button.clicked.connect(self.show_categories)
+
+        self.app_list_layout = QtWidgets.QVBoxLayout()
+        self.app_list_container = QtWidgets.QWidget()
+        self.app_list_layout.addWidget(self.back_button)
+        self.app_list_layout.addWidget(self.app_list_widget)
+        self.app_list_container.setLayout(self.app_list_layout)
+        self.stacked_widget.addWidget(self.app_list_container)
+
+        with trace.span("load_category_order"):
+            self.load_category_order()
+        with trace.span("populate_categories"):
+            self.populate_categories()
+
+        self.toggle_button = QtWidgets.QPushButton(self)
+        self.toggle_button.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.toggle_button.setFixedSize(32, 32)
+        self.toggle_button.setFlat(True)
+        self.toggle_button.move(self.width() - 40, 10)
+        self.toggle_button.clicked.connect(self.cycle_theme)
+        self.update_toggle_icon()
+        self.toggle_button.show()
+
+        self.start_catalog_scan()
+
+        self.installEventFilter(self)
+        self.preferred_apps_widget.installEventFilter(self)
+        self.category_list_widget.installEventFilter(self)
+        self.app_list_widget.installEventFilter(self)
+
+        self.preferred_apps_widget.setFocusPolicy(QtCore.Qt.StrongFocus)
+        self.category_list_widget.setFocusPolicy(QtCore.Qt.StrongFocus)
+        self.app_list_widget.setFocusPolicy(QtCore.Qt.StrongFocus)
+
+
+    def open_desktop_index(self):
+        desktop_index = catalog.DesktopIndex()
+        if "--rebuild-index" in sys.argv:
+            desktop_index.invalidate()
+        return desktop_index
+
+    def cached_applications(self):
+        """App visibili registrate nell'indice dalla scansione precedente (per i preferiti all'avvio)."""
+        desktops = catalog.current_desktops()
+        apps = {}
+        for record in self.desktop_index.files.values():
+            app = record.get("app")
+            if app and 'id' in app and catalog.is_visible(app, desktops):
+                apps.setdefault(app['id'], app)
+        return list(apps.values())
+
+    def start_catalog_scan(self):
+        task = CatalogScanTask(self.desktop_index, self.parse_desktop_file, stream=True)
+        task.signals.batch.connect(self.catalog_batch)
+        task.signals.finished.connect(self.catalog_loaded)
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def catalog_batch(self, apps):
+        if not self.applications:
+            trace.mark("first_catalog_batch")
+        self.applications.extend(apps)
+        self.add_applications(apps)
+
+    def catalog_loaded(self, applications):
+        if applications is None:
+            applications = sorted(self.applications, key=lambda x: (x['name'].lower(), x['id']))
+        self.applications = applications
+        self.catalog_ready = True
+        trace.mark("catalog_ready")
+
+        # Swap the favorites taken from the index for the freshly parsed entries.
+        if self.settings.get("favorites") is None:
+            self.load_preferred_apps()
+        else:
+            self.resolve_preferred_apps()
+            self.update_preferred_apps()
+        # Results streamed into a search were appended by name; rank them now.
+        if self.app_list_filter[0] == "search":
+            self.search_apps()
+
+        self.catalog_watcher = CatalogWatcher(self.desktop_index, self.parse_desktop_file, self)
+        self.catalog_watcher.catalog_changed.connect(self.apply_catalog_changes)
+        self.prefetch_likely_apps()
+        self.dump_profile()
+
+    def parse_desktop_file(self, filepath):
+        return catalog.parse_desktop_file(filepath)
+
+    def apply_catalog_changes(self, applications):
+        """Applica al catalogo in memoria e alle viste solo le voci aggiunte, rimosse o modificate."""
+        old = {app['id']: app for app in self.applications}
+        new = {app['id']: app for app in applications}
+        removed = [app for app_id, app in old.items() if new.get(app_id) != app]
+        added = [app for app_id, app in new.items() if old.get(app_id) != app]
+        self.applications = applications
+        if not removed and not added:
+            return
+
+        for app in removed:
+            for category in self.category_index.remove(app):
+                for item in self.category_list_widget.findItems(category, QtCore.Qt.MatchExactly):
+                    self.category_list_widget.takeItem(self.category_list_widget.row(item))
+            self.app_list_model.remove_app(app)
+            self.search_index.remove(app)
+        self.add_applications(added)
+
+        if any(app['id'] in self.favorite_ids for app in removed + added):
+            self.resolve_preferred_apps()
+            self.update_preferred_apps()
+
+    def add_applications(self, apps):
+        """Inserisce nuove voci nell'indice di ricerca, nelle categorie e nella lista app mostrata."""
+        for app in apps:
+            self.search_index.add(app)
+            for category in self.category_index.add(app):
+                self.insert_category_item(category)
+            kind, value = self.app_list_filter
+            if kind == "category" and value in self.category_index.categories_of(app):
+                self.app_list_model.insert_app(app, self.category_index.position(value, app))
+            elif self.app_list_view_accepts(app):
+                self.app_list_model.insert_app(app)
+        self.update_visible_icons()
+
+    def category_rank(self, cat):
+        """Prima le categorie nell'ordine salvato dall'utente, poi le altre in ordine alfabetico."""
+        order = getattr(self, 'category_order', [])
+        if cat in order:
+            return (0, order.index(cat), "")
+        return (1, 0, category_index.collation_key(cat))
+
+    def insert_category_item(self, cat):
+        rank = self.category_rank(cat)
+        row = 0
+        while row < self.category_list_widget.count() and self.category_rank(self.category_list_widget.item(row).text()) < rank:
+            row += 1
+        self.category_list_widget.insertItem(row, self.create_category_item(cat))
+
+    def populate_categories(self):
+        self.category_list_widget.clear()
+        for cat in sorted(self.category_index.categories(), key=self.category_rank):
+            self.category_list_widget.addItem(self.create_category_item(cat))
+
+    def create_category_item(self, cat):
+        item = QtWidgets.QListWidgetItem(cat)
+        icon = QtGui.QIcon.fromTheme("folder")
+        if not icon.isNull():
+            item.setIcon(icon)
+        font = item.font()
+        font.setPointSize(11)
+        item.setFont(font)
+        item.setSizeHint(QtCore.QSize(item.sizeHint().width(), 50))
+        return item
+
+    def app_list_view_accepts(self, app):
+        """Indica se app appartiene alla pagina attualmente mostrata nella lista app."""
+        kind, value = self.app_list_filter
+        if kind == "category":
+            return value in self.category_index.categories_of(app)
+        if kind == "search":
+            return self.search_index.matches(app, value)
+        return False
+
+    def show_category_apps(self, item):
+        category = item.text()
+        self.app_list_filter = ("category", category)
+        self.icon_loader.cancel_all()
+        # The index keeps every category sorted: this is a plain copy.
+        self.app_list_model.set_apps(self.category_index.apps(category))
+        self.stacked_widget.setCurrentWidget(self.app_list_container)
+        self.app_list_widget.setFocus()
+        self.update_visible_icons()
+
+    def schedule_search(self, text):
+        self.search_timer.start()
+
+    def search_apps(self):
+        self.search_timer.stop()
+        text = self.search_box.text().strip()
+        self.icon_loader.cancel_all()
+        if not text:
+            self.app_list_filter = (None, None)
+            self.app_list_model.set_apps([])
+            self.populate_categories()
+            self.stacked_widget.setCurrentWidget(self.category_page)
+            return
+        self.app_list_filter = ("search", text)
+        self.app_list_model.set_apps(self.search_index.search(text))
+        self.stacked_widget.setCurrentWidget(self.app_list_container)
+        self.update_visible_icons()
+
+    def update_visible_icons(self, *args):
+        """Avvia la decodifica delle icone delle sole righe visibili della lista app."""
+        count = self.app_list_model.rowCount()
+        if not count:
+            self.icon_loader.set_visible_keys(())
+            return
+        viewport = self.app_list_widget.viewport()
+        first = self.app_list_widget.indexAt(QtCore.QPoint(0, 0)).row()
+        last = self.app_list_widget.indexAt(QtCore.QPoint(0, viewport.height() - 1)).row()
+        first = max(first, 0)
+        last = count - 1 if last < 0 else last
+        keys = set()
+        for app in self.app_list_model.apps[first:last + 1]:
+            if app['icon']:
+                keys.add((app['icon'], AppListModel.ICON_SIZE))
+        self.icon_loader.set_visible_keys(keys)
+
+    def show_categories(self):
+        self.stacked_widget.setCurrentWidget(self.category_page)
+        self.category_list_widget.setFocus()
+
+    def load_icon(self, icon_name):
+        return self.icon_cache.icon(icon_name)
+
+    def launch_selected(self, item):
+        app = item.data(QtCore.Qt.UserRole)
+        if app:
+            # Icon decodes run on AsyncIconLoader's own pool, so a launch never queues behind them.
+            QtCore.QThreadPool.globalInstance().start(LaunchTask(self.launch_engine, app, self.launch_signals))
+
+    def launch_started(self, app):
+        self.launch_history.record(app['id'])
+        self.dismiss()
+
+    def launch_failed(self, app, message):
+        QtWidgets.QMessageBox.critical(self, "Error", f"Failed to launch {app['name']}.\n{message}")
+
+    def launch_exited(self, app, code, seconds):
+        if code and code > 0 and seconds < LAUNCH_FAILURE_WINDOW_S:
+            self.launch_failed(app, f"The program exited with status {code} right after starting.")
+
+    def cycle_theme(self):
+        """Passa al tema successivo (scuro, chiaro e poi quelli dell'utente)."""
+        names = self.theme_engine.names()
+        self.theme = names[(names.index(self.theme) + 1) % len(names)]
+        self.theme_engine.apply(self.theme)
+        self.update_toggle_icon()
+        self.save_theme_config()
+
+    def load_theme_config(self):
+        try:
+            self.theme_engine = ThemeEngine(self.config_dir / "themes")
+            self.theme = self.settings.get("theme", "dark")
+            if self.theme not in self.theme_engine.themes:
+                self.theme = "dark"
+            self.theme_engine.apply(self.theme)
+        except Exception as e:
+            print(f"Error loading theme config: {e}")
+
+    def save_theme_config(self):
+        self.settings.set("theme", self.theme)
+        self.schedule_settings_save()
+
+    def schedule_settings_save(self):
+        self.settings_timer.start()
+
+    def flush_settings(self):
+        self.settings_timer.stop()
+        self.settings.flush()
+
+    def update_toggle_icon(self):
+        dark = self.theme_engine.is_dark(self.theme)
+        icon_name = "weather-clear" if dark else "weather-clear-night"
+        icon = QtGui.QIcon.fromTheme(icon_name)
+        if icon.isNull():
+            self.toggle_button.setText("Light" if dark else "Dark")
+            self.toggle_button.setIcon(QtGui.QIcon())
+        else:
+            self.toggle_button.setText("")
+            self.toggle_button.setIcon(icon)
+
+    def dismiss(self):
+        """Chiude il launcher, o lo nasconde se è in modalità residente."""
+        if self.resident:
+            self.flush_settings()
+            self.hide()
+        else:
+            self.close()
+
+    def closeEvent(self, event):
+        self.flush_settings()
+        if self.resident:
+            event.ignore()
+            self.hide()
+        else:
+            super().closeEvent(event)
+
+    def start_resident_server(self):
+        try:
+            path = resident_socket_path()
+        except OSError as e:
+            print(f"Error starting resident server: {e}")
+            return
+        # Only reached when no resident instance answered, so a leftover
+        # socket file can only belong to a process that has died.
+        QtNetwork.QLocalServer.removeServer(path)
+        self.resident_server = QtNetwork.QLocalServer(self)
+        # Mode 0700 on the socket: other users must not be able to send commands.
+        self.resident_server.setSocketOptions(QtNetwork.QLocalServer.UserAccessOption)
+        self.resident_server.newConnection.connect(self.accept_resident_connection)
+        if not self.resident_server.listen(path):
+            print(f"Error starting resident server: {self.resident_server.errorString()}")
+
+    def accept_resident_connection(self):
+        while self.resident_server.hasPendingConnections():
+            connection = self.resident_server.nextPendingConnection()
+            connection.readyRead.connect(partial(self.read_resident_command, connection))
+            connection.disconnected.connect(connection.deleteLater)
+
+    def read_resident_command(self, connection):
+        while connection.canReadLine():
+            command = bytes(connection.readLine()).decode('utf-8', 'replace').rstrip("\n")
+            self.run_resident_command(command)
+            connection.write(b"ok\n")
+            connection.flush()
+
+    def run_resident_command(self, command):
+        action, _, argument = command.partition(" ")
+        if action == "quit":
+            QtWidgets.QApplication.quit()
+        elif action == "search":
+            self.present()
+            self.search_box.setText(argument)
+            self.search_apps()
+        else:
+            self.present()
+
+    def prefetch_likely_apps(self):
+        """Avvia in background la lettura anticipata delle app che l'utente avvia più spesso."""
+        count = self.settings.get("prefetch_apps", PREFETCH_APPS)
+        if not isinstance(count, int) or count <= 0 or not self.catalog_ready:
+            return
+        apps_by_id = {app['id']: app for app in self.applications}
+        top_ids = self.launch_history.top(count * 2)
+        self.prefetcher.start([apps_by_id[app_id] for app_id in top_ids if app_id in apps_by_id][:count])
+
+    def present(self):
+        """Riporta in primo piano la finestra, pronta per una nuova ricerca."""
+        self.prefetch_likely_apps()
+        self.search_timer.stop()
+        self.search_box.blockSignals(True)
+        self.search_box.clear()
+        self.search_box.blockSignals(False)
+        self.show_categories()
+        self.showNormal()
+        self.raise_()
+        self.activateWindow()
+        self.search_box.setFocus()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.toggle_button.move(self.width() - 40, 10)
+
+    def favorite_toggled(self, index):
+        app = index.data(QtCore.Qt.UserRole)
+        if app['id'] in self.favorite_ids:
+            del self.favorite_ids[app['id']]
+            self.preferred_apps.pop(app['id'], None)
+            item = self.preferred_items.pop(app['id'], None)
+            if item is not None:
+                self.preferred_apps_widget.takeItem(self.preferred_apps_widget.row(item))
+        else:
+            self.favorite_ids[app['id']] = None
+            self.preferred_apps[app['id']] = app
+            item = self.create_preferred_item(app)
+            self.preferred_items[app['id']] = item
+            self.preferred_apps_widget.insertItem(len(self.preferred_items) - 1, item)
+        self.app_list_model.refresh_favorite(index)
+        self.update_suggested_items()
+        self.layout_preferred_bar()
+        self.save_preferred_apps()
+
+    def save_category_order(self):
+        categories = [self.category_list_widget.item(i).text() for i in range(self.category_list_widget.count())]
+        self.category_order = categories
+        self.settings.set("category_order", categories)
+        self.schedule_settings_save()
+
+    def load_category_order(self):
+        self.category_order = list(self.settings.get("category_order", []))
+
+    def save_preferred_apps(self):
+        self.settings.set("favorites", list(self.favorite_ids))
+        self.schedule_settings_save()
+
+    def load_preferred_apps(self):
+        # The catalog is still being scanned: take the entries from the index.
+        apps = self.applications or self.cached_applications()
+        ids = self.settings.get("favorites")
+        if ids is None:
+            # Older versions stored the Exec binary of each favorite.
+            exec_set = set(self.settings.get("preferred_apps", []))
+            ids = [app['id'] for app in sorted(apps, key=lambda x: (x['name'].lower(), x['id'])) if app['exec'] in exec_set]
+            self.favorite_ids = dict.fromkeys(ids)
+            # Without any catalog yet the conversion waits for the scan.
+            if apps or not exec_set:
+                self.save_preferred_apps()
+        else:
+            self.favorite_ids = dict.fromkeys(ids)
+        self.resolve_preferred_apps(apps)
+        self.update_preferred_apps()
+
+    def resolve_preferred_apps(self, apps=None):
+        apps_by_id = {app['id']: app for app in (self.applications if apps is None else apps)}
+        self.preferred_apps = {app_id: apps_by_id[app_id] for app_id in self.favorite_ids if app_id in apps_by_id}
+
+    def is_favorite(self, app):
+        return app['id'] in self.favorite_ids
+
+    def suggested_apps(self):
+        """App più usate (per frecency) da aggiungere alla barra dei preferiti."""
+        if not AUTO_PREFERRED_APPS:
+            return []
+        apps_by_id = {app['id']: app for app in self.applications}
+        top_ids = self.launch_history.top(AUTO_PREFERRED_APPS + len(self.favorite_ids), exclude=self.favorite_ids)
+        return [apps_by_id[app_id] for app_id in top_ids if app_id in apps_by_id][:AUTO_PREFERRED_APPS]
+
+    def create_preferred_item(self, app):
+        item = QtWidgets.QListWidgetItem(app['name'] if self.preferred_show_names else "")
+        item.setIcon(self.load_icon(app['icon']))
+        item.setData(QtCore.Qt.UserRole, app)
+        return item
+
+    def update_preferred_apps(self):
+        """Ricostruisce l'intera barra dei preferiti (all'avvio e quando cambia il catalogo)."""
+        self.preferred_apps_widget.clear()
+        self.preferred_items = {}
+        self.suggested_ids = []
+        self.preferred_show_names = None
+        self.layout_preferred_bar(len(self.preferred_apps) + len(self.suggested_apps()))
+        for app_id, app in self.preferred_apps.items():
+            self.preferred_items[app_id] = self.create_preferred_item(app)
+            self.preferred_apps_widget.addItem(self.preferred_items[app_id])
+        self.update_suggested_items()
+
+    def update_suggested_items(self):
+        """Sostituisce in coda alla barra solo i suggerimenti che sono cambiati."""
+        suggested = self.suggested_apps()
+        ids = [app['id'] for app in suggested]
+        if ids == self.suggested_ids:
+            return
+        first = len(self.preferred_items)
+        while self.preferred_apps_widget.count() > first:
+            self.preferred_apps_widget.takeItem(first)
+        for app in suggested:
+            self.preferred_apps_widget.addItem(self.create_preferred_item(app))
+        self.suggested_ids = ids
+
+    def layout_preferred_bar(self, count=None):
+        """Adatta dimensione delle icone e nomi al numero di voci; le icone già caricate non vengono toccate."""
+        count = self.preferred_apps_widget.count() if count is None else count
+        if count == 0:
+            return
+
+        max_icon_size = 64
+        min_icon_size = 48
+        available_width = self.preferred_apps_widget.width()
+        estimated_item_width = max_icon_size + 80
+        total_needed_width = estimated_item_width * count
+        show_names = total_needed_width <= available_width
+
+        icon_size = max(min_icon_size, max_icon_size // count) if show_names else max(min_icon_size, max_icon_size // (count * 2))
+        self.preferred_apps_widget.setIconSize(QtCore.QSize(icon_size, icon_size))
+        self.preferred_apps_widget.setFixedHeight(icon_size + 20)
+
+        show_names = show_names and icon_size > 24
+        if show_names != self.preferred_show_names:
+            self.preferred_show_names = show_names
+            for row in range(self.preferred_apps_widget.count()):
+                item = self.preferred_apps_widget.item(row)
+                item.setText(item.data(QtCore.Qt.UserRole)['name'] if show_names else "")
+
+        if count == 1:
+            self.preferred_apps_widget.setFlow(QtWidgets.QListView.LeftToRight)
+            self.preferred_apps_widget.setSpacing(10)
+        else:
+            self.preferred_apps_widget.setFlow(QtWidgets.QListView.LeftToRight)
+            self.preferred_apps_widget.setSpacing(5)
+
+    def dump_profile(self):
+        """Scrive il profilo richiesto con --profile quando la finestra è disegnata e il catalogo è completo."""
+        path = profile_path(sys.argv[1:])
+        if path and "first_paint" in trace.marks and self.catalog_ready and not self.profile_written:
+            self.profile_written = True
+            trace.dump(path)
+
+    def eventFilter(self, source, event):
+        if event.type() == QtCore.QEvent.Paint and source is self and "first_paint" not in trace.marks:
+            trace.mark("first_paint")
+            QtCore.QTimer.singleShot(0, self.dump_profile)
+        if event.type() == QtCore.QEvent.KeyPress:
+            # Detect Control+C
+            if event.key() == QtCore.Qt.Key_C and event.modifiers() & QtCore.Qt.ControlModifier:
+                # Launch calcolatrice.py
+                try:
+                    import pathlib
+                    script_dir = pathlib.Path(__file__).parent.resolve()
+                    calcolatrice_path = script_dir / "multicalculator_ui.py"
+                    if calcolatrice_path.exists():
+                        self.launch_engine.run_command([sys.executable, calcolatrice_path])
+                        self.dismiss()
+                    else:
+                        QtWidgets.QMessageBox.warning(self, "File Not Found", f"Calculator file not found in {calcolatrice_path}")
+                except Exception as e:
+                    QtWidgets.QMessageBox.critical(self, "Error", f"Failed to launch calculator app.\n{e}")
+                return True
+
+            # Detect Control+T for theme toggle
+            if event.key() == QtCore.Qt.Key_T and event.modifiers() & QtCore.Qt.ControlModifier:
+                self.cycle_theme()
+                return True
+
+            # Detect Control+I for shortcuts display
+            if event.key() == QtCore.Qt.Key_I and event.modifiers() & QtCore.Qt.ControlModifier:
+                self.show_shortcuts()
+                return True
+
+            if event.key() == QtCore.Qt.Key_Escape:
+                self.show_categories()
+                return True
+            if source is self.category_list_widget and event.key() in (QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter):
+                item = source.currentItem()
+                if item:
+                    self.show_category_apps(item)
+                return True
+            if source is self.app_list_widget and event.key() in (QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter, QtCore.Qt.Key_Underscore):
+                index = source.currentIndex()
+                if index.isValid():
+                    self.launch_selected(index)
+                return True
+            if source is self.preferred_apps_widget and event.key() in (QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter, QtCore.Qt.Key_Underscore):
+                item = source.currentItem()
+                if item:
+                    self.launch_selected(item)
+                return True
+        return super().eventFilter(source, event)
+
+    def show_shortcuts(self):
+        from PyQt5.QtWidgets import QMessageBox
+        shortcuts_text = (
+            "Shortcuts:\n"
+            "Ctrl+T: Switch theme (Dark, Light, then your own themes)\n"
+            "Ctrl+C: Launch The multicalculator\n"
+            "Escape: Show Categories (home)\n"
+            "Ctrl+I: Show this shortcuts window\n"
+        )
+        QMessageBox.information(self, "Keyboard Shortcuts", shortcuts_text)
+
+
+def main():
+    with trace.span("create_qapplication"):
+        app = QtWidgets.QApplication(sys.argv)
+    resident = "--resident" in sys.argv
+    with trace.span("AppLauncher.__init__"):
+        launcher = AppLauncher(resident=resident)
+    if resident:
+        app.setQuitOnLastWindowClosed(False)
+        launcher.start_resident_server()
+
+    if not launcher.settings.get("guide_shown", False):
+        with trace.span("spawn_guide_visualizer"):
+            try:
+                import pathlib
+                script_dir = pathlib.Path(__file__).parent.resolve()
+                launcher.launch_engine.run_command([sys.executable, script_dir / "guide/visualizer.py"])
+                launcher.settings.set("guide_shown", True)
+                launcher.schedule_settings_save()
+            except Exception as e:
+                print(f"Error launching guide visualizer: {e}")
+
+    with trace.span("show"):
+        launcher.show()
+    command = resident_command(sys.argv[1:])
+    if command.startswith("search "):
+        launcher.run_resident_command(command)
+
+    if not launcher.settings.get("shortcuts_shown", False):
+        launcher.show_shortcuts()
+        launcher.settings.set("shortcuts_shown", True)
+        launcher.schedule_settings_save()
+
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()
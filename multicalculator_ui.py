@@ -2,13 +2,137 @@ import sys
 import time
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QLineEdit, QMessageBox, QComboBox, QSpinBox, QTabWidget, QGroupBox, QFormLayout
+    QLineEdit, QMessageBox, QComboBox, QSpinBox, QTabWidget, QGroupBox, QFormLayout,
+    QPlainTextEdit, QTableView, QHeaderView, QFileDialog, QCheckBox
 )
 import subprocess
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import (
+    QTimer, Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QAbstractTableModel, QModelIndex
+)
 from PyQt5.QtWidgets import QGridLayout
 from PyQt5.QtGui import QDoubleValidator
 
+import calc_engine
+import calc_batch
+
+PREVIEW_DELAY_MS = 150
+PREVIEW_TIMEOUT_S = 0.5
+RESULT_TIMEOUT_S = 10
+# "Computing..." appears only if the result is not there by then.
+BUSY_DELAY_MS = 100
+PREVIEW_MAX_CHARS = 40
+# Stands for an abbreviated result inside the expression; the keyboard cannot type letters.
+RESULT_VARIABLE = "ans"
+BATCH_TIMEOUT_S = 120
+
+
+class EvaluationSignals(QObject):
+    finished = pyqtSignal(int, object, str, bool)
+    failed = pyqtSignal(int, str)
+    digits = pyqtSignal(str)
+
+
+class EvaluationTask(QRunnable):
+    """Valuta un'espressione e ne formatta il risultato fuori dal thread della GUI."""
+
+    def __init__(self, request_id, text, token, precision, signals, variables=None):
+        super().__init__()
+        self.request_id = request_id
+        self.text = text
+        self.token = token
+        self.precision = precision
+        self.signals = signals
+        self.variables = variables
+
+    def run(self):
+        try:
+            value = calc_engine.evaluate(self.text, self.token, self.precision, self.variables)
+            result, abbreviated = calc_engine.render(value)
+            self.token.check()
+        except calc_engine.CalcError as e:
+            self.signals.failed.emit(self.request_id, str(e))
+            return
+        except Exception as e:
+            print(f"Error evaluating expression: {e}")
+            self.signals.failed.emit(self.request_id, "Espressione non valida")
+            return
+        self.signals.finished.emit(self.request_id, value, result, abbreviated)
+
+
+class DigitsTask(QRunnable):
+    """Calcola tutte le cifre di un risultato abbreviato, solo quando l'utente le copia."""
+
+    def __init__(self, value, signals):
+        super().__init__()
+        self.value = value
+        self.signals = signals
+
+    def run(self):
+        try:
+            self.signals.digits.emit(calc_engine.full_digits(self.value))
+        except Exception as e:
+            print(f"Error formatting result: {e}")
+
+
+class BatchSignals(QObject):
+    started = pyqtSignal(int, object, object)
+    chunk = pyqtSignal(int, int, object)
+    finished = pyqtSignal(int, float)
+    failed = pyqtSignal(int, str)
+    exported = pyqtSignal(str, int)
+    export_failed = pyqtSignal(str)
+
+
+class BatchTask(QRunnable):
+    """Calcola un'espressione su tutte le righe di una serie, un blocco alla volta, fuori dal thread della GUI."""
+
+    def __init__(self, request_id, text, inputs, token, signals, decimal_comma=None):
+        super().__init__()
+        self.request_id = request_id
+        self.text = text
+        self.inputs = inputs
+        self.decimal_comma = decimal_comma
+        self.token = token
+        self.signals = signals
+
+    def run(self):
+        start = time.perf_counter()
+        try:
+            names, columns = calc_batch.parse_inputs(self.inputs, self.decimal_comma)
+            expression = calc_batch.compile_batch(self.text, names)
+            self.signals.started.emit(self.request_id, names, columns)
+            for offset, results in calc_batch.evaluate_chunks(expression, names, columns, self.token):
+                self.signals.chunk.emit(self.request_id, offset, results)
+        except calc_engine.CalcError as e:
+            self.signals.failed.emit(self.request_id, str(e))
+            return
+        except Exception as e:
+            print(f"Error evaluating series: {e}")
+            self.signals.failed.emit(self.request_id, "Serie non valida")
+            return
+        self.signals.finished.emit(self.request_id, time.perf_counter() - start)
+
+
+class ExportTask(QRunnable):
+    """Scrive la serie calcolata in un file CSV."""
+
+    def __init__(self, path, names, columns, results, signals):
+        super().__init__()
+        self.path = path
+        self.names = names
+        self.columns = columns
+        self.results = results
+        self.signals = signals
+
+    def run(self):
+        try:
+            rows = calc_batch.write_csv(self.path, self.names, self.columns, self.results)
+        except Exception as e:
+            print(f"Error exporting CSV: {e}")
+            self.signals.export_failed.emit(f"Esportazione non riuscita: {e}")
+            return
+        self.signals.exported.emit(self.path, rows)
+
 
 class Calculator(QWidget):
     def __init__(self):
@@ -84,14 +208,62 @@ class Calculator(QWidget):
 
         layout.addWidget(buttons_widget)
 
+        precision_layout = QHBoxLayout()
+        precision_layout.addWidget(QLabel("Precisione:"))
+        # 0 is the standard mode: exact integers and floats.
+        self.precision_box = QSpinBox()
+        self.precision_box.setRange(0, calc_engine.MAX_PRECISION)
+        self.precision_box.setSpecialValueText("Standard")
+        self.precision_box.setSuffix(" cifre")
+        self.precision_box.setFocusPolicy(Qt.ClickFocus)
+        precision_layout.addWidget(self.precision_box)
+        precision_layout.addStretch()
+        layout.addLayout(precision_layout)
+
         self.result_label = QLabel("")
         self.result_label.setStyleSheet("font-size: 16px; padding: 5px;")
-        layout.addWidget(self.result_label)
+        self.cancel_button = QPushButton("Annulla")
+        self.cancel_button.clicked.connect(self.cancel_evaluation)
+        self.cancel_button.hide()
+        result_layout = QHBoxLayout()
+        self.copy_button = QPushButton("Copia tutte le cifre")
+        self.copy_button.clicked.connect(self.copy_full_result)
+        self.copy_button.hide()
+        result_layout.addWidget(self.result_label, 1)
+        result_layout.addWidget(self.cancel_button)
+        result_layout.addWidget(self.copy_button)
+        layout.addLayout(result_layout)
 
         self.setLayout(layout)
 
         self.current_expression = ""
         self.memory = 0.0
+        # Exact value of the last result when the display only shows it abbreviated,
+        # and the abbreviated text standing for it.
+        self.result_value = None
+        self.result_text = None
+
+        # Evaluations run one at a time on their own thread; each request
+        # cancels the previous one and late answers are recognised by id.
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.evaluation_signals = EvaluationSignals(self)
+        self.evaluation_signals.finished.connect(self.evaluation_finished)
+        self.evaluation_signals.failed.connect(self.evaluation_failed)
+        self.evaluation_signals.digits.connect(self.digits_ready)
+        self.request_id = 0
+        self.pending = None
+
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(PREVIEW_DELAY_MS)
+        self.preview_timer.timeout.connect(self.start_preview)
+        self.display.textChanged.connect(self.preview_timer.start)
+        self.precision_box.valueChanged.connect(self.preview_timer.start)
+        self.busy_timer = QTimer(self)
+        self.busy_timer.setSingleShot(True)
+        self.busy_timer.setInterval(BUSY_DELAY_MS)
+        self.busy_timer.timeout.connect(self.show_busy)
 
     def on_button_clicked(self):
         sender = self.sender()
@@ -121,6 +293,7 @@ class Calculator(QWidget):
             self.current_expression = ""
             self.display.setText(self.current_expression)
             self.result_label.setText("")
+            self.set_result_value(None)
         elif text == 'CE':
             import re
             new_expr = re.sub(r'(\d+\.?\d*|\.\d+)$', '', self.current_expression)
@@ -138,28 +311,9 @@ class Calculator(QWidget):
                 self.current_expression = '-' + self.current_expression
             self.display.setText(self.current_expression)
         elif text == '=':
-            try:
-                # Evaluate the expression safely
-                result = eval(self.current_expression, {"__builtins__": None}, {})
-                self.result_label.setText(f"Risultato: {result}")
-                self.current_expression = str(result)
-                self.display.setText(self.current_expression)
-            except Exception:
-                QMessageBox.warning(self, "Errore", "Espressione non valida")
-                self.current_expression = ""
-                self.display.setText(self.current_expression)
-                self.result_label.setText("")
+            self.on_button_clicked_enter()
         elif text == '√':
-            try:
-                result = str(eval(self.current_expression, {"__builtins__": None}, {}) ** 0.5)
-                self.result_label.setText(f"Risultato: {result}")
-                self.current_expression = result
-                self.display.setText(self.current_expression)
-            except Exception:
-                QMessageBox.warning(self, "Errore", "Espressione non valida")
-                self.current_expression = ""
-                self.display.setText(self.current_expression)
-                self.result_label.setText("")
+            self.evaluate_expression(f"({self.current_expression})**0.5")
         elif text == '1/x':
             try:
                 result = str(1 / float(self.current_expression))
@@ -204,16 +358,327 @@ class Calculator(QWidget):
             self.result_label.setText("")
 
     def on_button_clicked_enter(self):
+        self.evaluate_expression(self.current_expression)
+
+    def evaluate_expression(self, text):
+        self.preview_timer.stop()
+        self.submit("result", text, RESULT_TIMEOUT_S)
+        self.busy_timer.start()
+
+    def bind_result(self, text):
+        """text con il risultato abbreviato al posto di RESULT_VARIABLE, e il suo valore esatto."""
+        if self.result_value is None or self.result_text not in text:
+            return text, None
+        return text.replace(self.result_text, RESULT_VARIABLE), {RESULT_VARIABLE: self.result_value}
+
+    def submit(self, kind, text, timeout):
+        """Avvia la valutazione di text nel thread di lavoro, annullando quella in corso."""
+        self.drop_pending()
+        self.request_id += 1
+        token = calc_engine.CancelToken(timeout)
+        self.pending = (self.request_id, kind, token)
+        precision = self.precision_box.value() or None
+        text, variables = self.bind_result(text)
+        self.pool.start(EvaluationTask(self.request_id, text, token, precision, self.evaluation_signals, variables))
+
+    def drop_pending(self):
+        if self.pending:
+            self.pending[2].cancel()
+            self.pending = None
+        self.busy_timer.stop()
+        if not self.cancel_button.isHidden():
+            self.cancel_button.hide()
+            self.result_label.setText("")
+
+    def take_pending(self, request_id):
+        """Tipo della richiesta request_id se è ancora quella attesa, altrimenti None."""
+        if not self.pending or self.pending[0] != request_id:
+            return None
+        kind = self.pending[1]
+        self.pending = None
+        self.busy_timer.stop()
+        self.cancel_button.hide()
+        return kind
+
+    def show_busy(self):
+        if self.pending and self.pending[1] == "result":
+            self.result_label.setText("Calcolo in corso…")
+            self.cancel_button.show()
+
+    def cancel_evaluation(self):
+        computing = self.pending and self.pending[1] == "result"
+        self.drop_pending()
+        if computing:
+            self.result_label.setText("Calcolo annullato")
+
+    def start_preview(self):
+        # The display changed: whatever is still being evaluated is for old text.
+        text = self.current_expression
         try:
-            result = eval(self.current_expression, {"__builtins__": None}, {})
-            self.result_label.setText(f"Risultato: {result}")
-            self.current_expression = str(result)
+            # A bare number (the last result, a single operand) has nothing to preview.
+            float(text)
+            self.drop_pending()
+            return
+        except ValueError:
+            if not text:
+                self.drop_pending()
+                return
+        self.submit("preview", text, PREVIEW_TIMEOUT_S)
+
+    def evaluation_finished(self, request_id, value, result, abbreviated):
+        kind = self.take_pending(request_id)
+        if kind == "preview":
+            if len(result) > PREVIEW_MAX_CHARS:
+                result = result[:PREVIEW_MAX_CHARS - 1] + "…"
+            self.result_label.setText(f"= {result}")
+        elif kind == "result":
+            note = " (abbreviato)" if abbreviated else ""
+            self.result_label.setText(f"Risultato: {result}{note}")
+            self.current_expression = result
             self.display.setText(self.current_expression)
-        except Exception:
-            QMessageBox.warning(self, "Errore", "Espressione non valida")
+            if abbreviated:
+                self.set_result_value(value, result)
+            else:
+                self.set_result_value(None)
+
+    def set_result_value(self, value, text=None):
+        self.result_value = value
+        self.result_text = text
+        self.copy_button.setVisible(value is not None)
+
+    def copy_full_result(self):
+        if self.result_value is not None:
+            self.result_label.setText("Preparazione delle cifre…")
+            self.pool.start(DigitsTask(self.result_value, self.evaluation_signals))
+
+    def digits_ready(self, digits):
+        QApplication.clipboard().setText(digits)
+        self.result_label.setText(f"Copiate negli appunti {len(digits.lstrip('-'))} cifre")
+
+    def evaluation_failed(self, request_id, message):
+        kind = self.take_pending(request_id)
+        if kind == "preview":
+            # Half-typed input is the norm while typing: just drop the old preview.
+            self.result_label.setText("")
+        elif kind == "result":
+            QMessageBox.warning(self, "Errore", message)
             self.current_expression = ""
             self.display.setText(self.current_expression)
             self.result_label.setText("")
+            self.set_result_value(None)
+
+
+class BatchResultModel(QAbstractTableModel):
+    """Tabella delle colonne di ingresso e dei risultati, riempita un blocco alla volta.
+
+    I valori restano negli array NumPy e vengono formattati solo per le
+    righe visibili.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.names = []
+        self.columns = []
+        self.results = None
+        self.rows = 0
+
+    def start(self, names, columns):
+        self.beginResetModel()
+        self.names = list(names)
+        self.columns = columns
+        self.results = calc_batch.numpy().empty(len(columns[0]) if columns else 0)
+        self.rows = 0
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self.names = []
+        self.columns = []
+        self.results = None
+        self.rows = 0
+        self.endResetModel()
+
+    def append_chunk(self, offset, results):
+        if offset != self.rows or self.results is None:
+            return
+        self.beginInsertRows(QModelIndex(), self.rows, self.rows + len(results) - 1)
+        self.results[offset:offset + len(results)] = results
+        self.rows += len(results)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or not self.names else len(self.names) + 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role != Qt.DisplayRole:
+            return None
+        column = index.column()
+        values = self.results if column == len(self.names) else self.columns[column]
+        value = float(values[index.row()])
+        if value != value:
+            return "—"
+        return repr(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Vertical:
+            return str(section + 1)
+        return self.names[section] if section < len(self.names) else "Risultato"
+
+
+class BatchCalculator(QWidget):
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout()
+
+        group = QGroupBox("Serie")
+        form_layout = QFormLayout()
+
+        self.expression_input = QLineEdit()
+        self.expression_input.setPlaceholderText("es. x**2 + 1, oppure a*b con le colonne a e b")
+        form_layout.addRow("Espressione:", self.expression_input)
+
+        self.inputs_edit = QPlainTextEdit()
+        self.inputs_edit.setPlaceholderText("x = 0..1e6 step 1\n\noppure incolla una colonna o un CSV, con i nomi nella prima riga")
+        self.inputs_edit.setFixedHeight(90)
+        form_layout.addRow("Valori:", self.inputs_edit)
+
+        self.decimal_comma_check = QCheckBox("Virgola decimale (1,5 = uno e mezzo)")
+        form_layout.addRow("", self.decimal_comma_check)
+
+        group.setLayout(form_layout)
+        layout.addWidget(group)
+
+        buttons_layout = QHBoxLayout()
+        self.calc_button = QPushButton("Calcola")
+        self.calc_button.clicked.connect(self.calculate)
+        self.cancel_button = QPushButton("Annulla")
+        self.cancel_button.clicked.connect(self.cancel_evaluation)
+        self.cancel_button.hide()
+        self.export_button = QPushButton("Esporta CSV")
+        self.export_button.clicked.connect(self.export_csv)
+        self.export_button.setEnabled(False)
+        buttons_layout.addWidget(self.calc_button)
+        buttons_layout.addWidget(self.cancel_button)
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(self.export_button)
+        layout.addLayout(buttons_layout)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        self.model = BatchResultModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        # Fixed row heights: the view never measures a million rows.
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(self.table.fontMetrics().height() + 6)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(self.table, 1)
+
+        self.setLayout(layout)
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.signals = BatchSignals(self)
+        self.signals.started.connect(self.batch_started)
+        self.signals.chunk.connect(self.batch_chunk)
+        self.signals.finished.connect(self.batch_finished)
+        self.signals.failed.connect(self.batch_failed)
+        self.signals.exported.connect(self.export_finished)
+        self.signals.export_failed.connect(self.export_failed)
+        self.request_id = 0
+        self.pending = None
+
+    def keyPressEvent(self, event):
+        key = event.key()
+        if key in (Qt.Key_Enter, Qt.Key_Return) and not self.inputs_edit.hasFocus():
+            self.calculate()
+        else:
+            super().keyPressEvent(event)
+
+    def calculate(self):
+        self.drop_pending()
+        self.request_id += 1
+        token = calc_engine.CancelToken(BATCH_TIMEOUT_S)
+        self.pending = (self.request_id, token)
+        self.model.clear()
+        self.export_button.setEnabled(False)
+        self.status_label.setText("Calcolo in corso…")
+        self.cancel_button.show()
+        # Unchecked is "decide from the separators", not "never a decimal comma".
+        decimal_comma = True if self.decimal_comma_check.isChecked() else None
+        self.pool.start(BatchTask(self.request_id, self.expression_input.text(), self.inputs_edit.toPlainText(),
+                                  token, self.signals, decimal_comma))
+
+    def drop_pending(self):
+        if self.pending:
+            self.pending[1].cancel()
+            self.pending = None
+        self.cancel_button.hide()
+
+    def cancel_evaluation(self):
+        computing = self.pending is not None
+        self.drop_pending()
+        if computing:
+            self.status_label.setText(f"Calcolo annullato dopo {self.model.rows} righe")
+
+    def is_current(self, request_id):
+        return self.pending is not None and self.pending[0] == request_id
+
+    def batch_started(self, request_id, names, columns):
+        if self.is_current(request_id):
+            self.model.start(names, columns)
+
+    def batch_chunk(self, request_id, offset, results):
+        if self.is_current(request_id):
+            self.model.append_chunk(offset, results)
+            self.status_label.setText(f"Calcolate {self.model.rows} righe su {len(self.model.results)}…")
+
+    def batch_finished(self, request_id, seconds):
+        if not self.is_current(request_id):
+            return
+        self.drop_pending()
+        self.status_label.setText(f"{self.model.rows} righe in {seconds:.2f} s")
+        self.export_button.setEnabled(self.model.rows > 0)
+
+    def batch_failed(self, request_id, message):
+        if not self.is_current(request_id):
+            return
+        self.drop_pending()
+        self.model.clear()
+        self.status_label.setText("")
+        QMessageBox.warning(self, "Errore", message)
+
+    def export_csv(self):
+        if self.model.results is None or not self.model.rows:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Esporta CSV", "serie.csv", "CSV (*.csv)")
+        if not path:
+            return
+        self.export_button.setEnabled(False)
+        self.status_label.setText("Esportazione in corso…")
+        rows = self.model.rows
+        self.pool.start(ExportTask(path, self.model.names, [column[:rows] for column in self.model.columns],
+                                   self.model.results[:rows], self.signals))
+
+    def export_finished(self, path, rows):
+        self.export_button.setEnabled(True)
+        self.status_label.setText(f"Esportate {rows} righe in {path}")
+
+    def export_failed(self, message):
+        # The series is still there: it can be exported again elsewhere.
+        self.export_button.setEnabled(True)
+        self.status_label.setText("")
+        QMessageBox.warning(self, "Errore", message)
 
 
 class PercentualCalculator(QWidget):
@@ -333,8 +798,8 @@ class ClickableLabel(QLabel):
         pass
 
 
-import json
 import pathlib
+import settings_store
 
 class MultiCalculatorApp(QWidget):
     def __init__(self):
@@ -343,15 +808,22 @@ class MultiCalculatorApp(QWidget):
 
         self.config_dir = pathlib.Path.home() / ".config" / "pylauncher_settings"
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        self.theme_config_file = self.config_dir / "theme_config.json"
+        # Same store as the launcher: the theme choice is shared.
+        self.settings = settings_store.SettingsStore(self.config_dir / "settings.json")
+        self.settings_timer = QTimer(self)
+        self.settings_timer.setSingleShot(True)
+        self.settings_timer.setInterval(500)
+        self.settings_timer.timeout.connect(self.settings.flush)
 
         self.tabs = QTabWidget()
         self.calc = Calculator()
         self.perc = PercentualCalculator()
+        self.batch = BatchCalculator()
         self.cron = Stopwatch()
 
         self.tabs.addTab(self.calc, "Calcolatrice")
         self.tabs.addTab(self.perc, "Calcolatore Percentuale")
+        self.tabs.addTab(self.batch, "Serie")
         self.tabs.addTab(self.cron, "Cronometro")
 
         self.theme = "dark"
@@ -495,24 +967,18 @@ class MultiCalculatorApp(QWidget):
         self.close()
 
     def load_theme_config(self):
-        try:
-            if self.theme_config_file.exists():
-                with open(self.theme_config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                theme = data.get("theme", "dark")
-                self.theme = theme
-            else:
-                self.theme = "dark"
-        except Exception as e:
-            print(f"Error loading theme config: {e}")
+        self.theme = self.settings.get("theme", "dark")
 
     def save_theme_config(self):
-        try:
-            data = {"theme": self.theme}
-            with open(self.theme_config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f)
-        except Exception as e:
-            print(f"Error saving theme config: {e}")
+        self.settings.set("theme", self.theme)
+        self.settings_timer.start()
+
+    def closeEvent(self, event):
+        self.calc.cancel_evaluation()
+        self.batch.cancel_evaluation()
+        self.settings_timer.stop()
+        self.settings.flush()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,269 @@
+import os
+import glob
+import time
+import shutil
+import struct
+import threading
+
+# Upper bounds for one prefetch run: bytes handed to the page cache and files opened.
+BYTE_BUDGET = 128 << 20
+FILE_BUDGET = 256
+# A file advised less than this many seconds ago is skipped, its pages are most likely still cached.
+REFRESH_AFTER_S = 600
+
+PT_LOAD = 1
+PT_DYNAMIC = 2
+PT_INTERP = 3
+DT_NULL = 0
+DT_NEEDED = 1
+DT_STRTAB = 5
+DT_RPATH = 15
+DT_RUNPATH = 29
+DEFAULT_LIB_DIRS = ["/lib64", "/usr/lib64", "/lib", "/usr/lib"]
+
+
+def read_ld_so_conf(path="/etc/ld.so.conf", seen=None):
+    """Cartelle elencate in ld.so.conf, seguendo le direttive include."""
+    seen = set() if seen is None else seen
+    if path in seen:
+        return []
+    seen.add(path)
+    dirs = []
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if not line:
+                    continue
+                if line.startswith("include "):
+                    pattern = line.split(None, 1)[1]
+                    if not os.path.isabs(pattern):
+                        pattern = os.path.join(os.path.dirname(path), pattern)
+                    for included in sorted(glob.glob(pattern)):
+                        dirs.extend(read_ld_so_conf(included, seen))
+                else:
+                    dirs.append(line)
+    except OSError:
+        pass
+    return dirs
+
+
+def library_dirs():
+    dirs = [d for d in os.environ.get("LD_LIBRARY_PATH", "").split(":") if d]
+    dirs += read_ld_so_conf() + DEFAULT_LIB_DIRS
+    return list(dict.fromkeys(d for d in dirs if os.path.isdir(d)))
+
+
+def read_elf(path):
+    """(classe e macchina, interprete, DT_NEEDED, cartelle RUNPATH/RPATH) di un ELF, o None se non lo è."""
+    with open(path, 'rb') as f:
+        ident = f.read(64)
+        if len(ident) < 52 or ident[:4] != b"\x7fELF":
+            return None
+        is64 = ident[4] == 2
+        end = "<" if ident[5] == 1 else ">"
+        if is64:
+            phoff, = struct.unpack_from(end + "Q", ident, 32)
+            phentsize, phnum = struct.unpack_from(end + "HH", ident, 54)
+            ph_format, dyn_format = end + "IIQQQQQQ", end + "qQ"
+        else:
+            phoff, = struct.unpack_from(end + "I", ident, 28)
+            phentsize, phnum = struct.unpack_from(end + "HH", ident, 42)
+            ph_format, dyn_format = end + "IIIIIIII", end + "iI"
+        machine = (ident[4], ident[5], struct.unpack_from(end + "H", ident, 18)[0])
+
+        f.seek(phoff)
+        table = f.read(phentsize * phnum)
+        loads = []
+        dynamic = None
+        interp = None
+        for i in range(phnum):
+            fields = struct.unpack_from(ph_format, table, i * phentsize)
+            if is64:
+                p_type, _, p_offset, p_vaddr, _, p_filesz = fields[:6]
+            else:
+                p_type, p_offset, p_vaddr, _, p_filesz = fields[:5]
+            if p_type == PT_LOAD:
+                loads.append((p_vaddr, p_offset, p_filesz))
+            elif p_type == PT_DYNAMIC:
+                dynamic = (p_offset, p_filesz)
+            elif p_type == PT_INTERP:
+                f.seek(p_offset)
+                interp = f.read(p_filesz).rstrip(b"\0").decode('utf-8', 'replace')
+        if dynamic is None:
+            return machine, interp, [], []
+
+        f.seek(dynamic[0])
+        data = f.read(dynamic[1])
+        entry_size = struct.calcsize(dyn_format)
+        needed, paths, strtab = [], [], None
+        for offset in range(0, len(data) - entry_size + 1, entry_size):
+            tag, value = struct.unpack_from(dyn_format, data, offset)
+            if tag == DT_NULL:
+                break
+            if tag == DT_NEEDED:
+                needed.append(value)
+            elif tag in (DT_RPATH, DT_RUNPATH):
+                paths.append(value)
+            elif tag == DT_STRTAB:
+                strtab = value
+        # DT_STRTAB is a virtual address: map it back to a file offset.
+        base = None
+        for vaddr, offset, size in loads:
+            if strtab is not None and vaddr <= strtab < vaddr + size:
+                base = strtab - vaddr + offset
+        if base is None:
+            return machine, interp, [], []
+
+        def string(index):
+            f.seek(base + index)
+            raw = f.read(256)
+            return raw.split(b"\0", 1)[0].decode('utf-8', 'replace')
+
+        origin = os.path.dirname(os.path.realpath(path))
+        search = []
+        for index in paths:
+            search.extend(d.replace("$ORIGIN", origin).replace("${ORIGIN}", origin) for d in string(index).split(":") if d)
+        return machine, interp, [string(index) for index in needed], search
+
+
+def resolve_executable(command):
+    """Percorso reale del binario di un comando; per gli script segue l'interprete dello shebang."""
+    path = shutil.which(command) if command else None
+    if not path:
+        return []
+    path = os.path.realpath(path)
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(256)
+    except OSError:
+        return []
+    if head.startswith(b"#!"):
+        words = head[2:].split(b"\n", 1)[0].decode('utf-8', 'replace').split()
+        if words and os.path.basename(words[0]) == "env" and len(words) > 1:
+            return [path] + resolve_executable(words[1])
+        if words:
+            return [path] + resolve_executable(words[0])
+    return [path]
+
+
+class Prefetcher:
+    """Porta in page cache binari e librerie delle app che verranno probabilmente avviate.
+
+    Per ogni eseguibile segue PT_INTERP e DT_NEEDED leggendo gli header
+    ELF (senza eseguire ldd) e chiede al kernel la lettura anticipata con
+    posix_fadvise(WILLNEED), entro BYTE_BUDGET byte e FILE_BUDGET file per
+    esecuzione. Lavora in un thread a priorità minima; le dipendenze
+    risolte vengono ricordate tra un'esecuzione e l'altra.
+    """
+
+    def __init__(self, byte_budget=BYTE_BUDGET, file_budget=FILE_BUDGET):
+        self.byte_budget = byte_budget
+        self.file_budget = file_budget
+        self.lib_dirs = None
+        self.closures = {}
+        self.advised = {}
+        self.thread = None
+        self.last_run = None
+
+    def find_library(self, name, machine, extra_dirs):
+        if "/" in name:
+            return os.path.realpath(name) if os.path.isfile(name) else None
+        for d in list(extra_dirs) + self.lib_dirs:
+            candidate = os.path.join(d, name)
+            if os.path.isfile(candidate):
+                try:
+                    info = read_elf(candidate)
+                except (OSError, struct.error, ValueError):
+                    continue
+                # Skip libraries built for another architecture (e.g. 32-bit ones).
+                if info and info[0] == machine:
+                    return os.path.realpath(candidate)
+        return None
+
+    def closure(self, executable):
+        """L'eseguibile, il suo interprete e tutte le librerie da cui dipende."""
+        if executable in self.closures:
+            return self.closures[executable]
+        if self.lib_dirs is None:
+            self.lib_dirs = library_dirs()
+        files = []
+        seen = set()
+        queue = [(executable, None)]
+        while queue:
+            path, machine = queue.pop(0)
+            if path in seen:
+                continue
+            seen.add(path)
+            try:
+                info = read_elf(path)
+            except OSError:
+                continue
+            except (struct.error, ValueError):
+                # Truncated or malformed ELF: still worth reading ahead, but no dependencies to follow.
+                info = None
+            files.append(path)
+            if info is None:
+                continue
+            machine, interp, needed, extra_dirs = info
+            if interp and os.path.isfile(interp):
+                queue.append((os.path.realpath(interp), machine))
+            for name in needed:
+                lib = self.find_library(name, machine, extra_dirs)
+                if lib:
+                    queue.append((lib, machine))
+        self.closures[executable] = files
+        return files
+
+    def plan(self, apps):
+        """File da leggere in anticipo per apps (in ordine di priorità), entro i budget."""
+        now = time.monotonic()
+        planned = []
+        seen = set()
+        total = 0
+        for app in apps:
+            for executable in resolve_executable(app.get('try_exec') or app.get('exec')):
+                for path in self.closure(executable):
+                    if path in seen or now - self.advised.get(path, -REFRESH_AFTER_S) < REFRESH_AFTER_S:
+                        continue
+                    seen.add(path)
+                    try:
+                        size = os.path.getsize(path)
+                    except OSError:
+                        continue
+                    if total + size > self.byte_budget or len(planned) >= self.file_budget:
+                        return planned
+                    planned.append((path, size))
+                    total += size
+        return planned
+
+    def advise(self, planned):
+        for path, size in planned:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+                self.advised[path] = time.monotonic()
+            except OSError:
+                continue
+
+    def run(self, apps):
+        try:
+            if hasattr(os, "setpriority") and hasattr(threading, "get_native_id"):
+                # On Linux a thread id selects the thread; the I/O priority follows the nice value.
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+            start = time.perf_counter()
+            planned = self.plan(apps)
+            self.advise(planned)
+            self.last_run = (len(planned), sum(size for _, size in planned), time.perf_counter() - start)
+        except Exception as e:
+            print(f"Error prefetching applications: {e}")
+
+    def start(self, apps):
+        """Avvia run(apps) in background, se non ce n'è già uno in corso."""
+        if not hasattr(os, "posix_fadvise") or (self.thread and self.thread.is_alive()):
+            return
+        self.thread = threading.Thread(target=self.run, args=(list(apps),), name="prefetch", daemon=True)
+        self.thread.start()
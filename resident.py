@@ -0,0 +1,65 @@
+import os
+import stat
+import socket
+import struct
+
+
+def private_dir(path):
+    """Crea path con permessi 0700 se manca; OSError se non è una cartella solo dell'utente."""
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    # Anyone can pre-create a name in /tmp: a symlink or someone else's directory is refused.
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{path} is not a private directory of this user")
+    return path
+
+
+def resident_socket_path():
+    """Percorso del socket dell'istanza residente; OSError se la cartella non è sicura.
+
+    Senza XDG_RUNTIME_DIR il socket sta in /tmp/pylauncher-UID, una
+    cartella 0700 di cui si verifica il proprietario.
+    """
+    uid = os.getuid()
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or private_dir(f"/tmp/pylauncher-{uid}")
+    return os.path.join(runtime_dir, f"pylauncher-{uid}.sock")
+
+
+def peer_uid(sock):
+    """uid del processo all'altro capo di sock, o None dove SO_PEERCRED non esiste."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    size = struct.calcsize("3i")
+    _, uid, _ = struct.unpack("3i", sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, size))
+    return uid
+
+
+def resident_command(args):
+    """Traduce gli argomenti della riga di comando nel comando per l'istanza residente."""
+    if "--quit" in args:
+        return "quit"
+    if "--query" in args:
+        i = args.index("--query")
+        if i + 1 < len(args):
+            return f"search {args[i + 1]}"
+    return "show"
+
+
+def send_to_resident(command, timeout=2.0):
+    """Invia un comando all'istanza residente; restituisce False se non ce n'è una in ascolto."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(resident_socket_path())
+            # Search terms go only to our own instance, never to whoever owns the path.
+            uid = peer_uid(sock)
+            if uid is not None and uid != os.getuid():
+                print(f"Error contacting resident launcher: socket owned by uid {uid}")
+                return False
+            sock.sendall(command.encode('utf-8') + b"\n")
+            return sock.makefile('rb').readline() == b"ok\n"
+    except OSError:
+        return False
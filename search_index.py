@@ -0,0 +1,138 @@
+import heapq
+import unicodedata
+from operator import itemgetter
+
+# Fields searched besides the name, in the order they are tried.
+EXTRA_FIELDS = ('generic_name', 'exec', 'categories', 'keywords')
+GRAM = 3
+
+
+def normalize(text):
+    """Minuscole, senza accenti e con gli spazi compattati."""
+    if text.isascii():
+        return " ".join(text.lower().split())
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(text.split())
+
+
+def grams(text):
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+class SearchIndex:
+    """Indice di ricerca del catalogo costruito una sola volta.
+
+    Per ogni app conserva il nome normalizzato e un testo con exec,
+    categorie e parole chiave; le posting list dei trigrammi restringono i
+    candidati prima della verifica per sottostringa (le query più corte di
+    un trigramma scorrono direttamente i nomi normalizzati).
+    Se la nuova query estende la precedente si filtrano solo i risultati
+    precedenti, senza tornare all'indice. boost è un dizionario id -> chiave
+    (per esempio LaunchHistory.scores) che ordina i risultati a parità di
+    rilevanza.
+    """
+
+    def __init__(self, applications=(), boost=None):
+        self.boost = boost
+        self.docs = {}
+        self.postings = {}
+        self.last_query = None
+        self.last_ids = None
+        for app in applications:
+            self.add(app)
+
+    def document(self, app):
+        name = normalize(app['name'])
+        extra = []
+        for field in EXTRA_FIELDS:
+            value = app.get(field)
+            if isinstance(value, (list, tuple)):
+                extra.extend(value)
+            elif value:
+                extra.append(value)
+        return name, normalize(" ".join(extra))
+
+    def add(self, app):
+        if app['id'] in self.docs:
+            self.remove(app)
+        name, extra = self.document(app)
+        self.docs[app['id']] = (app, name, extra)
+        for gram in grams(name) | grams(extra):
+            self.postings.setdefault(gram, set()).add(app['id'])
+        self.reset_narrowing()
+
+    def remove(self, app):
+        doc = self.docs.pop(app['id'], None)
+        if doc is None:
+            return
+        for gram in grams(doc[1]) | grams(doc[2]):
+            ids = self.postings.get(gram)
+            if ids:
+                ids.discard(app['id'])
+        self.reset_narrowing()
+
+    def reset_narrowing(self):
+        self.last_query = None
+        self.last_ids = None
+
+    def candidates(self, query):
+        if len(query) < GRAM:
+            return self.docs.keys()
+        result = None
+        for gram in sorted(grams(query), key=lambda g: len(self.postings.get(g, ()))):
+            ids = self.postings.get(gram)
+            if not ids:
+                return set()
+            result = set(ids) if result is None else result & ids
+            if not result:
+                break
+        return result if result is not None else set()
+
+    def rank(self, query, doc):
+        """0 inizio del nome, 1 inizio di una parola del nome, 2 dentro il nome, 3 altri campi; None se non corrisponde."""
+        _, name, extra = doc
+        pos = name.find(query)
+        if pos == 0:
+            return 0
+        if pos > 0:
+            return 1 if f" {query}" in name else 2
+        if query in extra:
+            return 3
+        return None
+
+    def matches(self, app, query):
+        doc = self.docs.get(app['id'])
+        return doc is not None and self.rank(normalize(query), doc) is not None
+
+    def search(self, query):
+        """App che corrispondono a query, ordinate per rilevanza, per boost e poi per nome."""
+        query = normalize(query)
+        if not query:
+            self.reset_narrowing()
+            return []
+        if self.last_query and query.startswith(self.last_query):
+            pool = self.last_ids
+        else:
+            pool = self.candidates(query)
+        # Apps without history are the vast majority: they are sorted on
+        # their own and merged after the boosted ones of the same rank, so
+        # the ranking costs nothing extra for them.
+        boost = self.boost or {}
+        plain = []
+        boosted = []
+        for app_id in pool:
+            doc = self.docs[app_id]
+            rank = self.rank(query, doc)
+            if rank is None:
+                continue
+            score = boost.get(app_id)
+            if score is None:
+                plain.append((rank, doc[1], app_id))
+            else:
+                boosted.append((rank, -score, doc[1], app_id))
+        plain.sort()
+        boosted.sort()
+        self.last_query = query
+        self.last_ids = [entry[-1] for entry in heapq.merge(boosted, plain, key=itemgetter(0))]
+        return [self.docs[app_id][0] for app_id in self.last_ids]
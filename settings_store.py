@@ -0,0 +1,100 @@
+import os
+import json
+import fcntl
+import pathlib
+
+# Files written by earlier versions, read once when settings.json does not exist yet.
+LEGACY_FILES = {
+    "preferred_apps": ("preferred_apps.json", lambda data: data),
+    "category_order": ("categories_order.json", lambda data: data),
+    "theme": ("theme_config.json", lambda data: data.get("theme", "dark")),
+    "guide_shown": ("guide.json", lambda data: data.get("shown", False)),
+    "shortcuts_shown": ("shortcuts_shown.json", lambda data: data.get("shown", False)),
+}
+
+
+def default_settings_dir():
+    return pathlib.Path.home() / ".config" / "pylauncher_settings"
+
+
+class SettingsStore:
+    """Impostazioni del launcher e della calcolatrice in un solo file JSON.
+
+    Il file viene letto una volta; set() modifica solo la copia in memoria
+    e flush() scrive le chiavi cambiate. La scrittura avviene sotto un
+    lock esclusivo (settings.json.lock), rilegge il file per non perdere le
+    chiavi salvate nel frattempo da un altro processo e lo sostituisce con
+    os.replace, così un crash lascia sempre la versione precedente intatta.
+    Il debounce delle scritture spetta al chiamante (per esempio un QTimer).
+    """
+
+    def __init__(self, path=None):
+        self.path = pathlib.Path(path) if path else default_settings_dir() / "settings.json"
+        self.values = {}
+        self.dirty = set()
+        self.load()
+
+    def read_file(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error loading settings: {e}")
+            return {}
+
+    def load(self):
+        data = self.read_file()
+        if data is None:
+            data = self.migrate_legacy_files()
+            self.dirty.update(data)
+        self.values = data
+
+    def migrate_legacy_files(self):
+        data = {}
+        for key, (name, convert) in LEGACY_FILES.items():
+            try:
+                with open(self.path.parent / name, 'r', encoding='utf-8') as f:
+                    data[key] = convert(json.load(f))
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                print(f"Error migrating {name}: {e}")
+        return data
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        if key in self.values and self.values[key] == value:
+            return
+        self.values[key] = value
+        self.dirty.add(key)
+
+    def flush(self):
+        """Scrive le chiavi modificate; restituisce False se la scrittura fallisce."""
+        if not self.dirty:
+            return True
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path.with_name(self.path.name + ".lock"), 'a') as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                # Keys this process did not touch keep the value on disk,
+                # which may have been written by another process.
+                merged = self.read_file() or {}
+                for key in self.dirty:
+                    merged[key] = self.values[key]
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(merged, f, indent=1)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            self.values = merged
+            self.dirty.clear()
+            return True
+        except Exception as e:
+            print(f"Error saving settings: {e}")
+            return False
@@ -0,0 +1,69 @@
+import os
+import sys
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+
+class StartupTrace:
+    """Intervalli temporali con nome raccolti durante l'avvio.
+
+    Gli intervalli sono sempre registrati (costano pochi microsecondi) e
+    vengono scritti solo con --profile, in formato Chrome trace: il file si
+    apre con chrome://tracing o https://ui.perfetto.dev.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events = []
+        self.marks = {}
+
+    def now_us(self):
+        return (time.perf_counter() - self.origin) * 1e6
+
+    @contextmanager
+    def span(self, name):
+        start = self.now_us()
+        try:
+            yield
+        finally:
+            self.events.append({
+                "name": name, "ph": "X", "ts": start, "dur": self.now_us() - start,
+                "pid": os.getpid(), "tid": threading.get_ident(),
+            })
+
+    def mark(self, name):
+        """Registra un istante (ad esempio il primo paint); solo la prima volta per ogni nome."""
+        if name in self.marks:
+            return
+        ts = self.now_us()
+        self.marks[name] = ts
+        self.events.append({"name": name, "ph": "i", "s": "g", "ts": ts, "pid": os.getpid(), "tid": threading.get_ident()})
+
+    def dump(self, path):
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f, indent=1)
+        except Exception as e:
+            print(f"Error writing startup profile: {e}")
+            return
+        print(f"Startup profile written to {path}", file=sys.stderr)
+        for event in self.events:
+            if event["ph"] == "X":
+                print(f"  {event['name']:32s} {event['ts'] / 1000:8.1f} ms  +{event['dur'] / 1000:7.1f} ms", file=sys.stderr)
+            else:
+                print(f"  {event['name']:32s} {event['ts'] / 1000:8.1f} ms", file=sys.stderr)
+
+
+trace = StartupTrace()
+
+
+def profile_path(args, default="pylauncher-profile.json"):
+    """Percorso richiesto con --profile [FILE], o None se il profilo non è richiesto."""
+    if "--profile" not in args:
+        return None
+    i = args.index("--profile")
+    if i + 1 < len(args) and not args[i + 1].startswith("--"):
+        return args[i + 1]
+    return default
@@ -0,0 +1,45 @@
+import os
+import json
+
+# Colour roles a theme may set, named as in QPalette. Roles left out keep
+# the colour of the system palette.
+ROLES = ("Window", "WindowText", "Base", "AlternateBase", "Text", "Button", "ButtonText",
+         "Highlight", "HighlightedText", "ToolTipBase", "ToolTipText", "PlaceholderText")
+
+BUILTIN_THEMES = {
+    "dark": {"dark": True, "colors": {
+        "Window": "#2b2b2b", "WindowText": "#a0a0a0", "Base": "#2b2b2b", "AlternateBase": "#333333",
+        "Text": "#f0f0f0", "Button": "#2b2b2b", "ButtonText": "#f0f0f0",
+        "Highlight": "#5a5a5a", "HighlightedText": "#ffffff",
+        "ToolTipBase": "#3a3a3a", "ToolTipText": "#f0f0f0", "PlaceholderText": "#808080",
+    }},
+    "light": {"dark": False, "colors": {"Highlight": "#3a6efb", "HighlightedText": "#ffffff"}},
+}
+
+
+def load_themes(theme_dir):
+    """Temi predefiniti più quelli dell'utente in theme_dir, un file NOME.json per tema.
+
+    Un file contiene {"dark": true|false, "colors": {"Window": "#202020", ...}}
+    con i ruoli di ROLES; un tema dell'utente con il nome di uno
+    predefinito lo sostituisce.
+    """
+    themes = dict(BUILTIN_THEMES)
+    try:
+        names = sorted(os.listdir(theme_dir))
+    except FileNotFoundError:
+        return themes
+    except Exception as e:
+        print(f"Error listing themes: {e}")
+        return themes
+    for name in names:
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(theme_dir, name), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            colors = {role: value for role, value in data.get("colors", {}).items() if role in ROLES}
+            themes[name[:-len(".json")]] = {"dark": bool(data.get("dark", False)), "colors": colors}
+        except Exception as e:
+            print(f"Error loading theme {name}: {e}")
+    return themes